@@ -9,7 +9,7 @@ import argparse
 import requests
 import sys
 import logging
-from typing import List, Dict, Tuple, Optional, Union, Callable
+from typing import List, Dict, Tuple, Optional, Union, Callable, Final
 import concurrent.futures
 import threading
 
@@ -410,6 +410,23 @@ class CorrectionAPI:
         
         return corrected_text
 
+# 格式规范化用到的正则（每条字幕都会调用，预先编译）
+_CJK_CHARS: Final = '\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af'
+WHITESPACE_PATTERN = re.compile(r'\s+')
+CJK_GAP_PATTERN = re.compile(rf'(?<=[{_CJK_CHARS}]) +(?=[{_CJK_CHARS}])')
+SPACE_BEFORE_PUNCT_PATTERN = re.compile(r' +([，。！？；：、])')
+PUNCT_BEFORE_ALNUM_PATTERN = re.compile(r'([，。！？；：、])([A-Za-z0-9])')
+SPACE_BEFORE_QUOTE_PATTERN = re.compile(r' +"')
+SPACE_AFTER_QUOTE_PATTERN = re.compile(r'" +')
+# 断行优先级（从高到低）
+LINE_BREAK_PATTERNS = tuple(re.compile(p) for p in (
+    r'([。！？])([^"）】])',  # 句号、感叹号、问号后（但不在引号、括号前）
+    r'([，；：])([^"）】])',   # 逗号、分号、冒号后
+    r'([、])([^"）】])',      # 顿号后
+    r'(["])([^）】])',       # 引号后
+    r'([）】])([^，。！？；：])', # 右括号后（但不在标点前）
+))
+
 class SubtitleFormatter:
     """字幕格式规范化处理器"""
     
@@ -469,15 +486,14 @@ class SubtitleFormatter:
         """移除多余的空格"""
         lines = text.split('\n')
         cleaned_lines = []
-        cjk_chars = '\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af'
         
         for line in lines:
             # 移除行首行尾空格
             line = line.strip()
             # 将各种空白字符折叠为单个ASCII空格（不包含换行）
-            line = re.sub(r'\s+', ' ', line)
+            line = WHITESPACE_PATTERN.sub(' ', line)
             # 移除中日韩文字之间的空格（保留英文单词间空格）
-            line = re.sub(rf'(?<=[{cjk_chars}]) +(?=[{cjk_chars}])', '', line)
+            line = CJK_GAP_PATTERN.sub('', line)
             if line:  # 只保留非空行
                 cleaned_lines.append(line)
         
@@ -486,12 +502,12 @@ class SubtitleFormatter:
     def _normalize_punctuation(self, text: str) -> str:
         """统一标点符号格式"""
         # 移除标点符号前的空格
-        text = re.sub(r' +([，。！？；：、])', r'\1', text)
+        text = SPACE_BEFORE_PUNCT_PATTERN.sub(r'\1', text)
         # 仅在标点后紧跟英文/数字时插入空格（避免中文标点后强行加空格）
-        text = re.sub(r'([，。！？；：、])([A-Za-z0-9])', r'\1 \2', text)
+        text = PUNCT_BEFORE_ALNUM_PATTERN.sub(r'\1 \2', text)
         # 处理引号的空格
-        text = re.sub(r' +"', r'"', text)  # 引号前不要空格
-        text = re.sub(r'" +', r'"', text)   # 引号后不要空格
+        text = SPACE_BEFORE_QUOTE_PATTERN.sub('"', text)  # 引号前不要空格
+        text = SPACE_AFTER_QUOTE_PATTERN.sub('"', text)   # 引号后不要空格
         return text
     
     def _smart_line_break(self, text: str, max_line_length: int = 35) -> str:
@@ -515,15 +531,6 @@ class SubtitleFormatter:
         if len(line) <= max_length:
             return [line]
         
-        # 定义断行优先级（从高到低）
-        break_points = [
-            r'([。！？])([^"）】])',  # 句号、感叹号、问号后（但不在引号、括号前）
-            r'([，；：])([^"）】])',   # 逗号、分号、冒号后
-            r'([、])([^"）】])',      # 顿号后
-            r'(["])([^）】])',       # 引号后
-            r'([）】])([^，。！？；：])', # 右括号后（但不在标点前）
-        ]
-        
         result = []
         remaining = line
         
@@ -531,9 +538,8 @@ class SubtitleFormatter:
             best_break = -1
             
             # 寻找最佳断行点
-            for pattern in break_points:
-                matches = list(re.finditer(pattern, remaining))
-                for match in matches:
+            for pattern in LINE_BREAK_PATTERNS:
+                for match in pattern.finditer(remaining):
                     break_pos = match.start() + len(match.group(1))
                     # 确保断行点在合理范围内（不要太早或太晚断行）
                     if max_length * 0.6 <= break_pos <= max_length:
@@ -12,12 +12,21 @@ import json
 import queue
 import multiprocessing
 import time
-from typing import Optional, Dict, Any
+import atexit
+import bisect
+import codecs
+import functools
+from typing import Optional, Dict, Any, List, Final
+from concurrent.futures import ThreadPoolExecutor
 import tempfile
 import uuid
 import glob
 import math
+import mmap
 import re
+from multiprocessing.connection import wait as mp_wait
+from collections import OrderedDict
+from types import MappingProxyType
 
 def _is_writable_stream(stream) -> bool:
     try:
@@ -43,12 +52,14 @@ try:
 except Exception:
     pass
 
-from independent_bilingual_translator import convert_to_bilingual
 from srt_task_worker import (
     CheckerJobConfig,
     CorrectorJobConfig,
+    PipeQueue,
     PolisherJobConfig,
+    BilingualJobConfig,
     TranslationJobConfig,
+    run_bilingual_job,
     run_checker_job,
     run_corrector_job,
     run_polisher_job,
@@ -81,12 +92,67 @@ def resource_path(relative_name: str) -> str:
 
 GUI_DEBUG = os.environ.get("SRT_GUI_DEBUG", "0") == "1"
 
+# 任务结束提示用的分隔线
+_RULE: Final = "=" * 50
+_BANNER: Final = "\n" + _RULE + "\n"
+
+# SRT条目正则：内容行使用 [^\n]+ 且每行必须以换行/文件尾结束，
+# 各次重复互不重叠，畸形文件（缺少空行、超长内容）下也不会灾难性回溯
+_SRT_ENTRY_RE: Final = re.compile(
+    r'(\d+)\s*\n'                # 字幕序号
+    r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n'  # 时间码
+    r'((?:[^\n]+(?:\n|\Z))+)'     # 字幕内容（遇空行即止）
+    r'(?:\n|\Z)',                 # 空行或文件结尾
+    re.MULTILINE
+)
+# 字节版条目正则（用于mmap扫描），额外容忍CRLF换行
+_SRT_ENTRY_RE_B: Final = re.compile(
+    rb'(\d+)\s*\n'
+    rb'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n'
+    rb'((?:[^\r\n]+\r?(?:\n|\Z))+)'
+    rb'(?:\r?\n|\Z)'
+)
+# 编号行 / 时间轴行（逐行扫描用）
+_SRT_NUM_LINE_RE: Final = re.compile(r"^\s*(\d+)\s*$")
+_SRT_TIME_LINE_RE: Final = re.compile(r"^\s*\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}\s*$")
+# 文件名中的范围标签，如 name_10_200 -> _10_200（group(0)为完整标签）
+_RANGE_TAG_RE: Final = re.compile(r"_(\d+)_(\d+)$")
+# 进度文件名：out_progress 或 out_progress_10_200
+_PROGRESS_NAME_RE: Final = re.compile(r"(.+?)_progress(.*)$")
+# 批次文件名末尾的批次号：xxx_batch12.srt
+_BATCH_NUM_RE: Final = re.compile(r"(\d+)\.srt$")
+# 子进程输出行中的进度信息（逐行调用，预编译避免每行查正则缓存）
+_PROGRESS_PCT_RE: Final = re.compile(r"进度:\s*(\d+(?:\.\d+)?)%")
+_PERCENT_RE: Final = re.compile(r"(\d{1,3})%")
+_FRACTION_RE: Final = re.compile(r"(\d+)\s*/\s*(\d+)")
+_BATCH_TOTAL_RE: Final = re.compile(r"总计\s+(\d+)\s+个批次，剩余\s+(\d+)\s+个需要处理")
+# 双语转换输出中可能带进度的行都含以下子串之一
+_BILINGUAL_PROGRESS_KEYS: Final = ("%", "/", "processing", "convert", "转换", "处理")
+_POLISH_BATCH_WROTE_RE: Final = re.compile(r"已将润色批次\s+(\d+)\s+写入")
+# 润色批次文件名：xxx_polish_batch12.srt
+_POLISH_BATCH_FILE_RE: Final = re.compile(r"_polish_batch(\d+)\.srt$")
+# 时间轴箭头（统计条目数）/ 空白 / 中文字符
+_TIMECODE_ARROW_RE: Final = re.compile(r'\d{2}:\d{2}:\d{2},\d{3}\s*-->')
+_WHITESPACE_RE: Final = re.compile(r"\s+")
+_CJK_CHAR_RE: Final = re.compile(r"[\u4e00-\u9fff]")
+
+
+_DEBUG_FH = None
+
+
+def _get_debug_fh():
+    """惰性打开调试日志句柄（行缓冲，进程退出时关闭）"""
+    global _DEBUG_FH
+    if _DEBUG_FH is None:
+        log_path = os.path.join(get_app_dir(), "srt_gui_debug.log")
+        _DEBUG_FH = open(log_path, "a", encoding="utf-8", errors="ignore", buffering=1)
+        atexit.register(_DEBUG_FH.close)
+    return _DEBUG_FH
+
 
 def safe_file_log(message: str) -> None:
     try:
-        log_path = os.path.join(get_app_dir(), "srt_gui_debug.log")
-        with open(log_path, "a", encoding="utf-8", errors="ignore") as f:
-            f.write(str(message) + "\n")
+        _get_debug_fh().write(str(message) + "\n")
     except Exception:
         pass
 
@@ -125,50 +191,53 @@ class SubtitleDiffEngine:
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                     content = f.read()
         
-        # SRT格式正则表达式
-        SRT_PATTERN = re.compile(
-            r'(\d+)\s*\n'               # 字幕序号
-            r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n'  # 时间码
-            r'((?:.+(?:\n|$))+?)'       # 字幕内容
-            r'(?:\n|$)',                # 空行或文件结尾
-            re.MULTILINE
-        )
-        
         entries = {}
-        for match in SRT_PATTERN.finditer(content):
+        for match in _SRT_ENTRY_RE.finditer(content):
             number = int(match.group(1))
-            start_time = match.group(2)
-            end_time = match.group(3)
+            # 时间码在原文/纠错文件间大量重复，驻留后比较退化为指针比较
+            start_time = sys.intern(match.group(2))
+            end_time = sys.intern(match.group(3))
             subtitle_content = match.group(4).strip()
             
             entries[number] = {
                 'number': number,
                 'start_time': start_time,
                 'end_time': end_time,
-                'content': subtitle_content
+                'content': subtitle_content,
+                # 去首尾空白后内容的哈希，供 find_changed_entries 比较
+                'content_hash': hash(subtitle_content)
             }
         
         return entries
     
+    @staticmethod
+    def _content_hash(entry: dict) -> int:
+        """取条目内容哈希（兼容未预计算哈希的字典）；与逐条比较时一样忽略首尾空白"""
+        h = entry.get('content_hash')
+        if h is None:
+            h = hash(entry['content'].strip())
+        return h
+    
     @staticmethod
     def find_changed_entries(original_dict: dict, corrected_dict: dict):
         """找出有变化的字幕条目"""
-        changed_entries = []
+        # 以 (编号, 内容哈希) 集合差一次性找出变化编号，避免逐条比较字符串
+        content_hash = SubtitleDiffEngine._content_hash
+        orig_set = {(n, content_hash(e)) for n, e in original_dict.items()}
+        corr_set = {(n, content_hash(e)) for n, e in corrected_dict.items() if n in original_dict}
+        diff_nums = {n for (n, _h) in corr_set - orig_set}
         
-        for num in sorted(corrected_dict.keys()):
-            if num in original_dict:
-                orig = original_dict[num]
-                corr = corrected_dict[num]
-                
-                # 比较内容是否有变化
-                if orig['content'].strip() != corr['content'].strip():
-                    changed_entries.append(CorrectionReviewEntry(
-                        number=num,
-                        start_time=corr['start_time'],
-                        end_time=corr['end_time'],
-                        original_content=orig['content'],
-                        corrected_content=corr['content']
-                    ))
+        changed_entries = []
+        for num in sorted(diff_nums):
+            orig = original_dict[num]
+            corr = corrected_dict[num]
+            changed_entries.append(CorrectionReviewEntry(
+                number=num,
+                start_time=corr['start_time'],
+                end_time=corr['end_time'],
+                original_content=orig['content'],
+                corrected_content=corr['content']
+            ))
         
         return changed_entries
     
@@ -186,11 +255,136 @@ class SubtitleDiffEngine:
         except Exception as e:
             raise Exception(f"比较文件时出错: {str(e)}")
 
+def _to_int(v, default):
+    """界面输入转整数（允许"5.0"这类写法），无法解析时返回默认值"""
+    try:
+        return int(float(v))
+    except Exception:
+        return default
+
+
+def _to_float(v, default):
+    """界面输入转浮点数，无法解析时返回默认值"""
+    try:
+        return float(v)
+    except Exception:
+        return default
+
+
+def _sorted_difference(a_sorted, b_sorted):
+    """有序整数序列差集（去重），线性归并，不构建中间哈希表"""
+    result = []
+    append = result.append
+    j = 0
+    len_b = len(b_sorted)
+    last = None
+    for x in a_sorted:
+        while j < len_b and b_sorted[j] < x:
+            j += 1
+        if (j < len_b and b_sorted[j] == x) or x == last:
+            continue
+        append(x)
+        last = x
+    return result
+
+def _try_remove(path):
+    """删除文件：成功返回True，文件不存在返回False，失败返回异常对象"""
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        return e
+
+# API连接测试时最多先读取的响应正文字节数
+_API_TEST_BODY_LIMIT: Final = 8192
+
+# requests 连带导入 urllib3/charset_normalizer/certifi，较慢：首次测试API时才加载，之后复用
+_requests_mod = None
+
+
+def _get_requests():
+    global _requests_mod
+    if _requests_mod is None:
+        import requests as _r
+        _requests_mod = _r
+    return _requests_mod
+
+
+# 后台文件系统检查（glob/stat等）使用的线程池，避免在Tk线程上阻塞
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# 路径是否存在的短时缓存：path -> (检查时间, 结果)；连续的自动填充请求复用同一次 stat
+_STAT_CACHE: Dict[str, tuple] = {}
+_STAT_CACHE_LOCK = threading.Lock()
+
+
+def _exists_cached(path: str, ttl: float = 0.5) -> bool:
+    """带 TTL 的 os.path.exists，可在 IO 线程池中并发调用"""
+    now = time.monotonic()
+    with _STAT_CACHE_LOCK:
+        hit = _STAT_CACHE.get(path)
+    if hit is not None and now - hit[0] < ttl:
+        return hit[1]
+    ok = os.path.exists(path)
+    with _STAT_CACHE_LOCK:
+        if len(_STAT_CACHE) > 256:
+            _STAT_CACHE.clear()
+        _STAT_CACHE[path] = (now, ok)
+    return ok
+
+
+def _latest_range_file(base_name: str, dir_name: str) -> Optional[str]:
+    """在 dir_name 中查找最新创建的范围翻译文件（等价于 glob(f"{base_name}_*_*.srt")），
+    单次 scandir，每个候选只 stat 一次"""
+    norm = os.path.normcase
+    prefix = norm(os.path.basename(base_name) + "_")
+    best_ctime = None
+    best_path = None
+    try:
+        with os.scandir(dir_name) as it:
+            for entry in it:
+                name = norm(entry.name)
+                if not (name.startswith(prefix) and name.endswith(".srt")):
+                    continue
+                # 前缀之后还需要一段 "*_*"
+                if "_" not in name[len(prefix):-4]:
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    ctime = entry.stat().st_ctime
+                except OSError:
+                    continue
+                if best_ctime is None or ctime > best_ctime:
+                    best_ctime, best_path = ctime, entry.path
+    except OSError:
+        return None
+    return best_path
+
+
+def _resolve_translation_files(input_file, output_file):
+    """（后台线程）返回 (存在的输入文件或None, 翻译输出文件或None)；
+    输出文件不存在时可能是范围翻译，取最新创建的带范围标记的文件"""
+    source = input_file if input_file and _exists_cached(input_file) else None
+    translated = None
+    if output_file:
+        if _exists_cached(output_file):
+            translated = output_file
+        else:
+            base_name = os.path.splitext(output_file)[0]
+            translated = _latest_range_file(base_name, os.path.dirname(output_file) or ".")
+    return source, translated
+
+
 class ColoredLogWidget:
     """增强版日志显示组件，支持彩色输出和表情符号"""
     
-    def __init__(self, parent, height=28, width=None, dark_mode=False):
+    def __init__(self, parent, height=28, width=None, dark_mode=False, max_lines=5000):
         self.dark_mode = dark_mode
+        # 最多保留的行数，超出后从头部删除（None/0 表示不限制）
+        self._max_lines = max_lines
         # 根据模式选择背景和前景
         bg_color = '#1e1e1e' if dark_mode else '#fafafa'
         fg_color = '#d4d4d4' if dark_mode else '#333333'
@@ -214,6 +408,24 @@ class ColoredLogWidget:
         
         # 配置颜色标签
         self._setup_color_tags()
+        # 批量写入嵌套深度：>0 时插入不再逐条切换 NORMAL/DISABLED
+        self._batch_depth = 0
+        
+    def _begin_batch(self):
+        """开始批量写入：仅在最外层切换一次为可写状态"""
+        if self._batch_depth == 0:
+            self.text_widget.config(state=tk.NORMAL)
+        self._batch_depth += 1
+        
+    def _end_batch(self):
+        """结束批量写入：恢复只读并滚动到底部（仅一次）"""
+        if self._batch_depth <= 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._trim()
+            self.text_widget.config(state=tk.DISABLED)
+            self.text_widget.see(tk.END)
         
     def _setup_color_tags(self):
         """设置颜色标签"""
@@ -236,34 +448,77 @@ class ColoredLogWidget:
             self.text_widget.tag_config('progress', foreground='#5e35b1')
             self.text_widget.tag_config('timestamp', foreground='#888888')
         
+    @staticmethod
+    def _tag_for(text, tag=None):
+        """根据状态标记自动选择颜色标签"""
+        if '[OK]' in text:
+            return 'success'
+        if '[WARN]' in text:
+            return 'warning'
+        if '[ERROR]' in text:
+            return 'error'
+        if '[INFO]' in text:
+            return 'info'
+        if any(progress_word in text for progress_word in ('进度', '处理', '完成', '%', '批次')):
+            return 'progress'
+        return tag
+
     def insert_colored(self, text, tag=None):
         """插入带颜色的文本"""
-        self.text_widget.config(state=tk.NORMAL)
+        batching = self._batch_depth > 0
+        if not batching:
+            self.text_widget.config(state=tk.NORMAL)
         
         # 自动检测状态标记并应用颜色
-        if '[OK]' in text:
-            tag = 'success'
-        elif '[WARN]' in text:
-            tag = 'warning'
-        elif '[ERROR]' in text:
-            tag = 'error'
-        elif '[INFO]' in text:
-            tag = 'info'
-        elif any(progress_word in text for progress_word in ['进度', '处理', '完成', '%', '批次']):
-            tag = 'progress'
+        tag = self._tag_for(text, tag)
             
         if tag:
             self.text_widget.insert(tk.END, text, tag)
         else:
             self.text_widget.insert(tk.END, text)
             
-        self.text_widget.config(state=tk.DISABLED)
-        self.text_widget.see(tk.END)
+        if not batching:
+            self._trim()
+            self.text_widget.config(state=tk.DISABLED)
+            self.text_widget.see(tk.END)
+        
+    def insert_lines(self, lines):
+        """批量追加多段文本：相邻同色的合并为一次insert，整批只切换一次状态、裁剪并滚动一次"""
+        if not lines:
+            return
+        insert = self.text_widget.insert
+        self._begin_batch()
+        try:
+            run = []
+            run_tag = None
+            for text in lines:
+                tag = self._tag_for(text)
+                if run and tag != run_tag:
+                    insert(tk.END, "".join(run), *((run_tag,) if run_tag else ()))
+                    run = []
+                run_tag = tag
+                run.append(text)
+            if run:
+                insert(tk.END, "".join(run), *((run_tag,) if run_tag else ()))
+        finally:
+            self._end_batch()
+
+    def _trim(self):
+        """超出行数上限时删除最早的行（调用时组件须处于可写状态）。
+        一次多删约10%，避免达到上限后每次写入都触发删除"""
+        if not self._max_lines:
+            return
+        line_count = int(self.text_widget.index('end-1c').split('.')[0])
+        if line_count > self._max_lines:
+            keep = self._max_lines - max(1, self._max_lines // 10)
+            self.text_widget.delete('1.0', f'{line_count - keep + 1}.0')
         
     def insert(self, index, text, *args):
         """兼容原始insert方法"""
         if index == tk.END:
             self.insert_colored(text)
+        elif self._batch_depth > 0:
+            self.text_widget.insert(index, text, *args)
         else:
             self.text_widget.config(state=tk.NORMAL)
             self.text_widget.insert(index, text, *args)
@@ -290,24 +545,57 @@ class ColoredLogWidget:
     def pack(self, **kwargs):
         """pack布局"""
         self.text_widget.pack(**kwargs)
+        
+    def grid(self, **kwargs):
+        """grid布局"""
+        self.text_widget.grid(**kwargs)
 
 class TkTextLogHandler(logging.Handler):
-    """将logging日志安全写入到Tk文本组件的处理器（通过root.after跨线程）。"""
-    def __init__(self, tk_root, append_fn):
+    """将logging日志安全写入到Tk文本组件的处理器（通过root.after跨线程）。
+
+    日志先进入缓冲区，每个Tk回调一次性取出全部消息；若提供 log_widget，
+    整批消息在一次 _begin_batch/_end_batch 内写入。
+    """
+    def __init__(self, tk_root, append_fn, log_widget=None):
         super().__init__()
         self.tk_root = tk_root
         self.append_fn = append_fn
+        self.log_widget = log_widget
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
 
     def emit(self, record):
         try:
             msg = self.format(record)
-            self.tk_root.after(0, lambda m=msg: self.append_fn(m + "\n"))
+            with self._pending_lock:
+                self._pending.append(msg)
+                if self._drain_scheduled:
+                    return
+                self._drain_scheduled = True
+            self.tk_root.after(0, self._drain)
         except Exception:
             pass
-        
-    def grid(self, **kwargs):
-        """grid布局"""
-        self.text_widget.grid(**kwargs)
+
+    def _drain(self):
+        """在Tk线程中批量写出缓冲的日志"""
+        with self._pending_lock:
+            messages = self._pending
+            self._pending = []
+            self._drain_scheduled = False
+        if not messages:
+            return
+        widget = self.log_widget
+        if widget is not None:
+            widget._begin_batch()
+        try:
+            for m in messages:
+                self.append_fn(m + "\n")
+        except Exception:
+            pass
+        finally:
+            if widget is not None:
+                widget._end_batch()
 
 # 导入字幕纠错模块
 try:
@@ -413,13 +701,221 @@ class ToolTip:
             self.tooltip.destroy()
             self.tooltip = None
 
+@functools.lru_cache(maxsize=128)
 def truncate_text(text, max_length=10):
     """截断文本，超长时添加省略号"""
     if len(text) <= max_length:
         return text
     return text[:max_length-1] + "…"
 
+def _frozen_presets(presets):
+    """把预设表包装为两层只读映射"""
+    return MappingProxyType({k: MappingProxyType(v) for k, v in presets.items()})
+
+# 翻译器默认预设：编号 -> {"name", "content"}（只读，使用时复制）
+_DEFAULT_PRESETS: Final = _frozen_presets({
+    1: {
+        "name": "技术术语",
+        "content": (
+            "请将AI翻译为人工智能，Machine Learning翻译为机器学习，Deep Learning翻译为深度学习。"
+            "保留所有英文缩写如CPU、GPU、API、JSON等。"
+            "技术术语优先使用业界通用的中文译名。"
+        )
+    },
+    2: {
+        "name": "人名地名",
+        "content": (
+            "对于日本人名请保持日式发音的中文音译，如田中、山田、佐藤等。"
+            "对于韩国人名请保持韩式发音的中文音译，如金、朴、李等。"
+            "非著名的欧美地名、人名请直接保留英文原文，不要强行翻译。"
+            "确保同一人名在整个字幕中翻译一致。"
+        )
+    },
+    3: {
+        "name": "语言风格",
+        "content": (
+            "请使用更加口语化、生活化的翻译风格，避免过于正式的书面语。"
+            "对话要符合中文表达习惯，自然流畅。"
+            "保持原文的语气和情感色彩。"
+            "网络用语和俚语请翻译为对应的中文网络用语。"
+        )
+    },
+    4: {
+        "name": "影视娱乐",
+        "content": (
+            "对于影视作品名称、角色名称请保持一致性翻译。"
+            "影视术语如导演、制片人、演员等使用标准中文术语。"
+            "对于电影、电视剧、综艺节目的台词要符合观众的观看习惯。"
+            "保持娱乐内容的轻松幽默感，不要过于严肃。"
+        )
+    },
+    5: {
+        "name": "商务用语",
+        "content": (
+            "使用正式的商务中文表达，避免过于口语化。"
+            "商务术语如CEO、CFO、董事会等使用标准翻译。"
+            "数字、金额、百分比等要准确翻译。"
+            "保持专业性和严谨性，符合商务场合的表达习惯。"
+        )
+    },
+    6: {
+        "name": "学术文献",
+        "content": (
+            "使用规范的学术中文表达，保持严谨性。"
+            "学术术语要使用标准的中文翻译。"
+            "引用、参考文献、图表等要按中文学术规范翻译。"
+            "保持客观性和准确性，避免主观色彩。"
+        )
+    },
+    7: {
+        "name": "日常对话",
+        "content": (
+            "使用自然流畅的中文日常对话表达。"
+            "俚语、口头禅要翻译为对应的中文表达。"
+            "保持对话的自然感和亲切感。"
+            "年龄、性别、社会身份要体现在语言风格中。"
+        )
+    },
+    8: {
+        "name": "新闻播报",
+        "content": (
+            "翻译时保持新闻播报的正式性和客观性。"
+            "使用标准的新闻用语和表达方式。"
+            "人名地名采用通用译名，数据要准确。"
+            "保持新闻的严肃性和权威性。"
+        )
+    },
+    9: {
+        "name": "医学健康",
+        "content": (
+            "翻译医学健康类内容时保持专业准确。"
+            "医学术语使用标准中文表达。"
+            "药物名称、疾病名称使用通用译名。"
+            "涉及健康建议时保持严谨客观的表述。"
+        )
+    },
+    10: {
+        "name": "美食烹饪",
+        "content": (
+            "翻译美食烹饪类内容时保持生动诱人的表达。"
+            "食材名称使用中文常见名称。"
+            "烹饪方法和步骤要清晰易懂。"
+            "保持美食内容的诱人和温馨感。"
+        )
+    }
+})
+
+# 纠错器默认预设：编号 -> {"name", "content"}（只读，使用时复制）
+_DEFAULT_CORRECTOR_PRESETS: Final = _frozen_presets({
+    1: {
+        "name": "标准纠错",
+        "content": (
+            "修正常见的错别字、同音字错误，如'的得'、'在再'、'做作'等。"
+            "保持原文的语言风格和表达习惯，不要改变原意。"
+        )
+    },
+    2: {
+        "name": "保守纠错",
+        "content": (
+            "只修正明显的错别字，对于可能是专有名词或技术术语的内容保持谨慎，"
+            "确实不确定的词汇保持原样。注重保持原文的语言风格。"
+        )
+    },
+    3: {
+        "name": "口语化纠错",
+        "content": (
+            "注意修正口语化表达中的语法错误，将不规范的口语表达调整为更标准的书面语，"
+            "但保持自然的表达方式，不要过于正式。"
+        )
+    },
+    4: {
+        "name": "技术内容纠错",
+        "content": (
+            "对于技术术语和专业词汇格外小心，优先保持原样。"
+            "重点修正语音识别导致的技术词汇错误，确保技术表达的准确性。"
+        )
+    },
+    5: {
+        "name": "标点符号纠错",
+        "content": (
+            "除了修正错别字外，也要注意标点符号的使用，"
+            "修正明显的标点错误，确保句子结构清晰。"
+        )
+    },
+    6: {"name": "商务纠错", "content": "请修正语音识别错误，保持商务用语的正式性和准确性。"},
+    7: {"name": "学术纠错", "content": "请修正语音识别错误，保持学术术语的专业性和严谨性。"},
+    8: {"name": "娱乐纠错", "content": "请修正语音识别错误，保持娱乐内容的生动性和口语化特点。"},
+})
+
+
 class SRTGuiApp:
+    # 已知实例属性使用槽存储；未列出的属性（如以后新增或动态生成的）仍可落入 __dict__
+    __slots__ = (
+        '_api_combo_values_pushed', '_api_config_keys_tuple', '_api_session', '_applied_sections',
+        '_auto_name_after_id', '_built_tabs', '_config_cache',
+        '_config_fragments', '_corrector_auto_name_after_id', '_dirty_keys', '_last_batch_size', '_last_dirs', '_last_dirs_dirty',
+        '_last_index_offset', '_last_number_to_index', '_loading_config', '_message_handlers',
+        '_mp_ctx', '_notebook_tab_texts', '_number_to_index_cache', '_pb_max', '_pb_mode',
+        '_polisher_done_batches', '_polisher_total_batches', '_poll_delay', '_preset_options_cache',
+        '_presets_version', '_progress_dirty', '_progress_state', '_pv_last', '_review_hover_item',
+        '_review_overlay_rows', '_review_overlay_update_job', '_review_restore_tooltip',
+        '_review_restore_tooltip_after_id', '_review_row_overlays', '_save_after_id',
+        '_spawn_error_handlers', '_spawn_tokens', '_srt_entry_cache', '_srt_nums_cache',
+        '_status_bar_after_id', '_tab_builders', '_ui_state', '_utf8_sniff_cache',
+        '_worker_conn_lock', '_worker_conns', '_worker_gen', '_worker_wakeup_r', '_worker_wakeup_w',
+        'add_api_btn', 'api_configs', 'api_details_frame', 'api_details_visible',
+        'api_endpoint_entry', 'api_endpoint_var', 'api_key_entry', 'api_key_var',
+        'api_preset_combo', 'api_preset_var', 'api_status_label', 'api_toggle_btn', 'api_type_var',
+        'app_dir', 'auto_fix_button', 'auto_name_var', 'batch_size_spin', 'batch_size_var',
+        'bilingual_convert_button', 'bilingual_done', 'bilingual_frame', 'bilingual_original_entry',
+        'bilingual_original_var', 'bilingual_output', 'bilingual_output_entry',
+        'bilingual_output_var', 'bilingual_process', 'bilingual_stop_button',
+        'bilingual_stop_event', 'bilingual_total', 'bilingual_translated_entry',
+        'bilingual_translated_var', 'check_button', 'checker_frame', 'checker_output',
+        'checking_process', 'clean_newlines_var', 'cn_speed_max', 'cn_speed_max_var',
+        'cn_speed_min', 'cn_speed_min_var', 'completed_batches', 'config_file', 'context_size_spin',
+        'context_size_var', 'corrected_file_path', 'corrector_batch_mode_combo',
+        'corrector_batch_mode_var', 'corrector_batch_size_spin', 'corrector_batch_size_var',
+        'corrector_context_window_spin', 'corrector_context_window_var', 'corrector_frame',
+        'corrector_input_entry', 'corrector_input_file_var', 'corrector_output_entry',
+        'corrector_output_file_var', 'corrector_output_text', 'corrector_preset_buttons',
+        'corrector_preset_flow', 'corrector_preset_tooltips', 'corrector_presets',
+        'corrector_process', 'corrector_save_button', 'corrector_start_button',
+        'corrector_stop_button', 'corrector_temperature_spin', 'corrector_temperature_var',
+        'corrector_threads_spin', 'corrector_threads_var', 'corrector_timeout_spin',
+        'corrector_timeout_var', 'corrector_user_prompt_text', 'current_api_config',
+        'current_process', 'delete_api_btn', 'end_num_var', 'fluency_optimization_var',
+        'input_entry', 'input_file_var', 'is_running', 'last_polished_file', 'last_review_files',
+        'literal_align_chk', 'literal_align_var', 'max_speed_label', 'max_speed_scale',
+        'min_speed_label', 'min_speed_scale', 'model_var', 'no_resume_chk', 'no_resume_var',
+        'normalize_punctuation_var', 'notebook', 'output_entry', 'output_file_var', 'output_queue',
+        'polisher_auto_verify_var', 'polisher_batch_size_var', 'polisher_context_size_var',
+        'polisher_corner_quotes_var', 'polisher_frame', 'polisher_input_entry',
+        'polisher_input_file_var', 'polisher_length_policy_var', 'polisher_output',
+        'polisher_output_entry', 'polisher_output_file_var', 'polisher_process',
+        'polisher_resume_var', 'polisher_start_button', 'polisher_stop_button',
+        'polisher_temperature_var', 'polisher_threads_var', 'presets', 'professional_mode_chk',
+        'professional_mode_var', 'progress_bar', 'progress_var', 'remove_spaces_var',
+        'report_entry', 'report_file_var', 'review_corrected_entry', 'review_corrected_file_var',
+        'review_entries', 'review_frame', 'review_item_to_entry', 'review_item_to_row',
+        'review_modified', 'review_modified_label', 'review_original_entry',
+        'review_original_file_var', 'review_processed_numbers', 'review_stats_label',
+        'review_status_label', 'review_tree', 'review_tree_scrollbar_x', 'review_tree_scrollbar_y',
+        'root', 'save_api_btn', 'show_password_var', 'smart_line_break_var',
+        'smart_punctuation_var', 'smart_spacing_var', 'source_entry', 'source_file_var',
+        'start_num_var', 'status_frame', 'status_label', 'status_var', 'stop_button',
+        'stop_check_button', 'structured_output_chk', 'structured_output_var', 'temp_source_file',
+        'temp_translated_file', 'temperature_var', 'test_api_btn', 'threads_spin', 'threads_var',
+        'toggle_password_btn', 'total_batches', 'translate_button', 'translated_entry',
+        'translated_file_var', 'translation_process', 'translator_frame', 'translator_output',
+        'translator_preset_buttons', 'translator_preset_tooltips', 'user_prompt_text',
+        'user_prompt_var',
+        "__dict__",
+    )
+
+    # 审核表格基准行高（进程内只查询一次样式）
+    _REVIEW_ROWHEIGHT = None
+
     def __init__(self, root):
         self.root = root
         self.root.title("SRT 字幕翻译工具 v2.8.1")
@@ -451,32 +947,122 @@ class SRTGuiApp:
         self.polisher_process = None
         self.translation_process = None
         self.checking_process = None
+        self.bilingual_process = None
         
         # 输出队列，用于线程间通信
-        self.output_queue = queue.Queue()
+        self.output_queue = queue.SimpleQueue()
 
         self._mp_ctx = multiprocessing.get_context("spawn")
-        self.worker_queue = self._mp_ctx.Queue()
+        # 工作进程各用一条单向管道回传消息，由后台线程等待可读后转入 output_queue
+        # 读端 -> (属性名, 代号)；属性的当前代号变化后，旧进程迟到的消息直接丢弃
+        self._worker_conns = {}
+        self._worker_gen = {}
+        self._worker_conn_lock = threading.Lock()
+        self._worker_wakeup_r, self._worker_wakeup_w = self._mp_ctx.Pipe(duplex=False)
+        threading.Thread(target=self._worker_pipe_reader, daemon=True).start()
+        # 队列消息分发表
+        self._message_handlers = self._build_message_handlers()
+        # 后台线程启动工作进程：属性名 -> 当前有效的启动令牌 / 启动失败时的界面恢复回调
+        self._spawn_tokens = {}
+        self._spawn_error_handlers = {}
+        # 各任务按钮/进度条最近一次设置的运行状态，重复的空闲通知不再重新配置控件
+        self._ui_state = {}
+        # 批次进度（由翻译器/润色器输出行解析得到）
+        self.total_batches = None
+        self.completed_batches = 0
         self._polisher_total_batches = None
         self._polisher_done_batches = set()
-        
-        # 初始化预设内容
+        # 输出行解析出的进度先记下，最多约30次/秒写入进度条与状态栏
+        self._progress_state = {}
+        self._progress_dirty = False
+
+        # 快速解析缓存：键为 (path, mtime_ns, size)，文件变化后自动失效
+        self._srt_entry_cache = {}
+        self._srt_nums_cache = {}
+        self._number_to_index_cache = (None, None)
+        # _compute_batches_to_reset 最近一次使用的编号→索引映射与批次大小（供调试输出复用）
+        self._last_number_to_index = None
+        self._last_index_offset = None
+        self._last_batch_size = None
+
+        # UTF-8嗅探结果缓存：(path, mtime_ns, size) -> bool
+        self._utf8_sniff_cache = {}
+
+        # API预设下拉框的权威键元组（增量维护）；仅当元组对象变化时才写回控件
+        self._api_config_keys_tuple = ()
+        self._api_combo_values_pushed = None
+
+        # 输入文件名变化时自动命名输出文件的防抖回调ID（翻译器 / 纠错器）
+        self._auto_name_after_id = None
+        self._corrector_auto_name_after_id = None
+
+        # 各文件对话框上次使用的目录（随配置保存）
+        self._last_dirs = {}
+        self._last_dirs_dirty = False
+
+        # 状态栏重定位的防抖回调ID（拖动调整窗口大小时合并<Configure>事件）
+        self._status_bar_after_id = None
+        
+        # 初始化预设内容；预设每次修改时版本号加一，用于缓存预设下拉列表
+        self._presets_version = 0
+        self._preset_options_cache = None
         self.init_default_presets()
         
         # 检查脚本兼容性
         self.check_scripts_compatibility()
         
+        # 由 create_widgets 创建、load_config 需要探测的控件，先置为 None
+        self.api_preset_combo = None
+        self.corrector_user_prompt_text = None
+        self.corrector_batch_size_var = None
+        self.corrector_threads_var = None
+        self.corrector_temperature_var = None
+        self.corrector_context_window_var = None
+        self.corrector_batch_mode_var = None
+        self.corrector_timeout_var = None
+        self.clean_newlines_var = None
+        self.remove_spaces_var = None
+        self.normalize_punctuation_var = None
+        self.smart_line_break_var = None
+        self.smart_spacing_var = None
+        self.smart_punctuation_var = None
+        self.fluency_optimization_var = None
+        # 体积较大的顶层配置段的序列化缓存，以及自上次保存后有改动的段
+        self._config_fragments = {}
+        self._dirty_keys = set()
+        # 自动保存的延迟任务：500ms 内的连续修改合并为一次写入
+        self._save_after_id = None
+        # API连接测试复用的HTTP会话（保持连接，重复测试免去TCP/TLS握手）
+        self._api_session = None
+
         # 创建主界面
         self.create_widgets()
         
         # 加载配置
         self.load_config()
         
-        # 启动输出检查器
+        # 启动输出检查器（自适应轮询：有消息时空闲即处理，无消息时逐步退避）
+        self._poll_delay = 50
         self.check_output_queue()
         
         # 绑定关闭事件
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+        # 后台预热上次使用目录的文件状态，缩短首次打开文件对话框的等待
+        threading.Thread(target=self._warm_dialog_cache, daemon=True).start()
+
+    def _warm_dialog_cache(self):
+        """遍历各对话框上次所在目录并stat其条目，使系统缓存在用户点击浏览前就绪"""
+        for d in set(self._last_dirs.values()):
+            try:
+                with os.scandir(d) as it:
+                    for entry in it:
+                        try:
+                            entry.stat()
+                        except Exception:
+                            pass
+            except Exception:
+                pass
     
     def setup_styles(self):
         """设置界面样式"""
@@ -575,22 +1161,27 @@ class SRTGuiApp:
         # 双语转换器标签页
         self.bilingual_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.bilingual_frame, text="双语转换器")
-        self.create_bilingual_widgets()
         
         # 字幕纠错器标签页
         self.corrector_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.corrector_frame, text="字幕纠错器")
-        self.create_corrector_widgets()
 
         # 字幕润色器标签页
         self.polisher_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.polisher_frame, text="字幕润色器")
-        self.create_polisher_widgets()
 
         # 纠错/润色审核标签页（移到最右边）
         self.review_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.review_frame, text="纠错/润色审核")
-        self.create_review_widgets()
+
+        # 双语/纠错/润色/审核标签页在首次切换到时才构建，缩短启动时间
+        self._tab_builders = {
+            self.bilingual_frame: self.create_bilingual_widgets,
+            self.corrector_frame: self._build_corrector_tab,
+            self.polisher_frame: self._build_polisher_tab,
+            self.review_frame: self.create_review_widgets,
+        }
+        self._built_tabs = set()
         
         # 状态栏
         self._init_notebook_tab_indicator()
@@ -604,7 +1195,36 @@ class SRTGuiApp:
         except Exception:
             self._notebook_tab_texts = {}
 
+    def _ensure_tab_built(self, frame):
+        """延迟构建的标签页在首次需要时构建（只执行一次）"""
+        builders = getattr(self, '_tab_builders', None)
+        if not builders or frame in self._built_tabs:
+            return
+        builder = builders.get(frame)
+        if builder is None:
+            return
+        self._built_tabs.add(frame)
+        builder()
+
+    def _build_corrector_tab(self):
+        """构建纠错器标签页，并应用启动时已加载的纠错器配置"""
+        self.create_corrector_widgets()
+        self._track_config_vars(self._CORRECTOR_SPEC + self._FORMAT_OPTIONS_SPEC, "corrector")
+        self._apply_once("corrector")
+
+    def _build_polisher_tab(self):
+        """构建润色器标签页，并应用启动时已加载的润色器配置"""
+        self.create_polisher_widgets()
+        self._track_config_vars(self._POLISHER_SPEC, "polisher")
+        self._apply_once("polisher")
+
     def _on_notebook_tab_changed(self, event=None):
+        try:
+            current = self.notebook.select()
+            if current:
+                self._ensure_tab_built(self.notebook.nametowidget(current))
+        except Exception as e:
+            safe_file_log(f"lazy tab build error: {e}")
         try:
             current = self.notebook.select()
             for tab_id, base_text in getattr(self, "_notebook_tab_texts", {}).items():
@@ -840,34 +1460,23 @@ class SRTGuiApp:
         # 所有预设按钮，使用grid布局（每行6个）
         preset_buttons = [
             ("清空", self.clear_user_prompt, None),
-            ("预设1", self.set_preset_1, 1),
-            ("预设2", self.set_preset_2, 2),
-            ("预设3", self.set_preset_3, 3),
-            ("预设4", self.set_preset_4, 4),
-            ("预设5", self.set_preset_5, 5),
-            ("预设6", self.set_preset_6, 6),
-            ("预设7", self.set_preset_7, 7),
-            ("预设8", self.set_preset_8, 8),
-            ("预设9", self.set_preset_9, 9),
-            ("预设10", self.set_preset_10, 10),
+            *((f"预设{i}", lambda pid=i: self.set_preset(pid), i) for i in range(1, 11)),
             ("编辑预设", self.edit_presets, None),
         ]
         
         cols_per_row = 6
         self.translator_preset_buttons = {}  # 保存按钮引用以便更新tooltip
-        self.translator_preset_tooltips = {}
+        self.translator_preset_tooltips = {}  # 首次悬停时才创建
         for idx, (text, cmd, preset_id) in enumerate(preset_buttons):
             row = idx // cols_per_row
             col = idx % cols_per_row
             btn = ttk.Button(preset_frame, text=text, command=cmd)
             btn.grid(row=row, column=col, padx=2, pady=2, sticky=tk.W)
             
-            # 为预设按钮添加ToolTip显示预设名称
+            # 为预设按钮添加ToolTip显示预设名称（延迟到首次悬停再创建）
             if preset_id is not None:
                 self.translator_preset_buttons[preset_id] = btn
-                preset_data = self.presets.get(preset_id, {})
-                name = preset_data.get("name", f"预设{preset_id}")
-                self.translator_preset_tooltips[preset_id] = ToolTip(btn, name)
+                btn.bind('<Enter>', lambda e, b=btn, pid=preset_id: self._ensure_preset_tooltip(b, pid), add='+')
         
         # 控制按钮
         button_frame = ttk.Frame(parent)
@@ -892,6 +1501,16 @@ class SRTGuiApp:
             self.api_toggle_btn.config(text="v")
             self.api_details_visible = True
 
+    def _ensure_preset_tooltip(self, btn, preset_id):
+        """首次悬停时创建翻译器预设按钮的ToolTip并立即显示"""
+        tooltip = self.translator_preset_tooltips.get(preset_id)
+        if tooltip is None:
+            name = self.presets.get(preset_id, {}).get("name", f"预设{preset_id}")
+            # ToolTip 会重新绑定 <Enter>/<Leave>，同时替换掉这里的初始化绑定
+            tooltip = ToolTip(btn, name)
+            self.translator_preset_tooltips[preset_id] = tooltip
+        tooltip.show_tooltip()
+
     def on_api_preset_change(self, event=None):
         """API预设切换处理"""
         name = self.api_preset_var.get()
@@ -912,10 +1531,16 @@ class SRTGuiApp:
         self.current_api_config = new_name
         
         # 更新下拉列表
-        values = list(self.api_preset_combo['values'])
-        if new_name not in values:
-            values.append(new_name)
-            self.api_preset_combo['values'] = values
+        if new_name not in self._api_config_keys_tuple:
+            self._api_config_keys_tuple += (new_name,)
+            self._sync_api_preset_combo()
+
+    def _sync_api_preset_combo(self):
+        """将 _api_config_keys_tuple 写入下拉框；元组未变（同一对象）时跳过"""
+        if self._api_config_keys_tuple is self._api_combo_values_pushed:
+            return
+        self.api_preset_combo['values'] = self._api_config_keys_tuple
+        self._api_combo_values_pushed = self._api_config_keys_tuple
 
     def add_api_preset(self):
         """新增API配置"""
@@ -953,7 +1578,7 @@ class SRTGuiApp:
             
             # 创建新的空白配置
             if not hasattr(self, 'api_configs'):
-                self.api_configs = {}
+                self.api_configs = OrderedDict()
             
             self.api_configs[new_name] = {
                 "api_endpoint": "",
@@ -962,8 +1587,9 @@ class SRTGuiApp:
             }
             
             # 更新下拉列表
-            values = list(self.api_configs.keys())
-            self.api_preset_combo['values'] = values
+            if new_name not in self._api_config_keys_tuple:
+                self._api_config_keys_tuple += (new_name,)
+                self._sync_api_preset_combo()
             self.api_preset_combo.set(new_name)
             self.current_api_config = new_name
             
@@ -1022,7 +1648,7 @@ class SRTGuiApp:
         
         # 初始化api_configs如果不存在
         if not hasattr(self, 'api_configs'):
-            self.api_configs = {}
+            self.api_configs = OrderedDict()
         
         # 保存到api_configs
         self.api_configs[current_name] = {
@@ -1032,9 +1658,10 @@ class SRTGuiApp:
         }
         self.current_api_config = current_name
         
-        # 更新下拉列表（确保新名称在列表中）
-        values = list(self.api_configs.keys())
-        self.api_preset_combo['values'] = values
+        # 更新下拉列表（仅当名称是新的）
+        if current_name not in self._api_config_keys_tuple:
+            self._api_config_keys_tuple += (current_name,)
+            self._sync_api_preset_combo()
         
         # 静默保存配置到文件
         self.save_config(quiet=True)
@@ -1059,23 +1686,25 @@ class SRTGuiApp:
         # 从配置中移除
         if hasattr(self, 'api_configs') and current_name in self.api_configs:
             del self.api_configs[current_name]
+        if current_name in self._api_config_keys_tuple:
+            self._api_config_keys_tuple = tuple(k for k in self._api_config_keys_tuple if k != current_name)
             
         # 如果删空了，恢复默认
         if not self.api_configs:
-            self.api_configs = {
+            self.api_configs = OrderedDict({
                 "Default": {
                     "api_endpoint": "https://api.deepseek.com/v1/chat/completions",
                     "api_key": "",
                     "model": "deepseek-chat"
                 }
-            }
+            })
+            self._api_config_keys_tuple = ("Default",)
             
         # 更新下拉列表
-        values = list(self.api_configs.keys())
-        self.api_preset_combo['values'] = values
+        self._sync_api_preset_combo()
         
         # 选中第一个
-        new_selection = values[0]
+        new_selection = self._api_config_keys_tuple[0] if self._api_config_keys_tuple else next(iter(self.api_configs))
         self.api_preset_combo.set(new_selection)
         self.on_api_preset_change()
         
@@ -1186,28 +1815,62 @@ class SRTGuiApp:
         self.stop_check_button = ttk.Button(button_frame, text="停止校验", command=self.stop_checking, state=tk.DISABLED)
         self.stop_check_button.pack(side=tk.LEFT)
 
+    @staticmethod
+    def _srt_cache_key(srt_path: str):
+        """解析缓存键 (path, mtime_ns, size)；文件不可访问时返回None"""
+        try:
+            st = os.stat(srt_path)
+        except OSError:
+            return None
+        return (srt_path, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _cache_put(cache: dict, key, value, limit: int = 256):
+        """写入解析缓存，超出上限时淘汰最早的条目"""
+        if key is None:
+            return
+        if len(cache) >= limit:
+            cache.pop(next(iter(cache)))
+        cache[key] = value
+
+    def _number_to_index(self, entries):
+        """编号→索引映射；同一条目列表重复调用时复用上次结果"""
+        cached_entries, mapping = self._number_to_index_cache
+        if cached_entries is not entries:
+            mapping = {entry['number']: idx for idx, entry in enumerate(entries)}
+            self._number_to_index_cache = (entries, mapping)
+        return mapping
+
     def _parse_srt_entries_quick(self, srt_path: str):
-        """快速解析SRT，返回按顺序的条目列表(编号、起止时间、文本)。只用于GUI内部计算。"""
-        pattern = re.compile(
-            r'(\d+)\s*\n'  # number
-            r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n'  # time
-            r'((?:.+(?:\n|$))+?)'  # content
-            r'(?:\n|$)',
-            re.MULTILINE
-        )
+        """快速解析SRT，返回按顺序的条目列表(编号、起止时间、文本)。只用于GUI内部计算。
+
+        结果按 (path, mtime_ns, size) 缓存，调用方不要修改返回的列表。
+        """
+        key = self._srt_cache_key(srt_path)
+        cached = self._srt_entry_cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached
         try:
-            with open(srt_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            if not content.endswith('\n'):
-                content += '\n'
             entries = []
-            for m in pattern.finditer(content):
-                entries.append({
-                    'number': int(m.group(1)),
-                    'start': m.group(2),
-                    'end': m.group(3),
-                    'text': m.group(4)
-                })
+            with open(srt_path, 'rb') as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # 空文件无法映射
+                    mm = None
+                if mm is not None:
+                    try:
+                        # 直接在映射视图上匹配，仅解码捕获的分组，避免整文件复制+解码
+                        for m in _SRT_ENTRY_RE_B.finditer(mm):
+                            entries.append({
+                                'number': int(m.group(1)),
+                                'start': m.group(2).decode('ascii'),
+                                'end': m.group(3).decode('ascii'),
+                                'text': m.group(4).decode('utf-8', 'replace').replace('\r\n', '\n')
+                            })
+                    finally:
+                        mm.close()
+            self._cache_put(self._srt_entry_cache, key, entries)
             return entries
         except Exception as e:
             self.checker_output.insert(tk.END, f"解析SRT失败: {e}\n")
@@ -1216,9 +1879,9 @@ class SRTGuiApp:
 
     def _detect_range_tag_from_filename(self, base_without_ext: str):
         """从形如 name_10_200 推断范围标签与去除后的基础名。(range_tag, pure_base)"""
-        m = re.search(r"(_\d+_\d+)$", base_without_ext)
+        m = _RANGE_TAG_RE.search(base_without_ext)
         if m:
-            return m.group(1), base_without_ext[: -len(m.group(1))]
+            return m.group(0), base_without_ext[: -len(m.group(0))]
         return "", base_without_ext
 
     def _find_progress_and_base(self, translated_file: str):
@@ -1227,17 +1890,25 @@ class SRTGuiApp:
         base_no_ext = os.path.splitext(os.path.basename(translated_file))[0]
         range_tag, pure_base = self._detect_range_tag_from_filename(base_no_ext)
 
-        candidates = []
+        # 单次枚举目录，收集所有 progress json，再在内存中按三种规则筛选
+        try:
+            with os.scandir(tr_dir) as it:
+                names = [e.name for e in it
+                         if e.name.endswith('.json') and '_progress' in e.name and e.is_file()]
+        except OSError:
+            names = []
+
         # 1) 直接用 name_progress*.json
-        candidates.extend(glob.glob(os.path.join(tr_dir, f"{base_no_ext}_progress*.json")))
+        prefix = base_no_ext + "_progress"
+        candidates = [n for n in names if n.startswith(prefix)]
         # 2) 用去掉range的pure_base
-        candidates.extend(glob.glob(os.path.join(tr_dir, f"{pure_base}_progress{range_tag}.json")))
+        exact = f"{pure_base}_progress{range_tag}.json"
+        candidates.extend(n for n in names if n == exact)
         # 3) 回退：同目录所有progress，筛选名字前缀相同的
         if not candidates:
-            for p in glob.glob(os.path.join(tr_dir, f"*_progress*.json")):
-                name = os.path.splitext(os.path.basename(p))[0]
-                if name.startswith(pure_base + "_progress"):
-                    candidates.append(p)
+            pure_prefix = pure_base + "_progress"
+            candidates = [n for n in names if n.startswith(pure_prefix)]
+        candidates = [os.path.join(tr_dir, n) for n in candidates]
 
         if not candidates:
             return None, None, None
@@ -1247,7 +1918,7 @@ class SRTGuiApp:
         progress_path = candidates[0]
         fname = os.path.splitext(os.path.basename(progress_path))[0]
         # fname 形如: out_progress 或 out_progress_10_200
-        m = re.match(r"(.+?)_progress(.*)$", fname)
+        m = _PROGRESS_NAME_RE.match(fname)
         if not m:
             return None, None, None
         output_base = m.group(1)
@@ -1256,25 +1927,47 @@ class SRTGuiApp:
 
     def _compute_batches_to_reset(self, missing_numbers, source_entries, total_batches, range_tag, batch_files_pattern, gui_batch_size_str: str):
         """根据缺失编号推断所属批次。优先用实际 batch_size（来自GUI），必要时回退到批次文件边界分析。"""
+        self._last_number_to_index = None
+        self._last_index_offset = None
+        self._last_batch_size = None
+
+        # 常见情况：源条目编号从首到尾连续递增，此时索引 = 编号 - 首编号，无需过滤列表和建映射
+        # 首尾差只能说明数量吻合，乱序或重复编号（如 [1,2,2,4]、[1,3,2]）需逐项确认严格递增
+        contiguous = bool(source_entries) and (
+            source_entries[-1]['number'] - source_entries[0]['number'] + 1 == len(source_entries)
+        ) and all(
+            source_entries[i]['number'] < source_entries[i + 1]['number']
+            for i in range(len(source_entries) - 1)
+        )
+        fast_first = None  # 连续快速路径下范围内的首编号
+        range_entries = source_entries
+
         # 确定处理范围与基准起点
         baseline_start = None
         if range_tag:
-            m = re.match(r"_(\d+)_(\d+)$", range_tag)
+            m = _RANGE_TAG_RE.match(range_tag)
             if m:
                 start_num = int(m.group(1))
                 end_num = int(m.group(2))
                 baseline_start = start_num
-                range_entries = [e for e in source_entries if start_num <= e['number'] <= end_num]
-            else:
-                range_entries = source_entries
-        else:
-            range_entries = source_entries
+                if contiguous:
+                    fast_first = max(start_num, source_entries[0]['number'])
+                    fast_last = min(end_num, source_entries[-1]['number'])
+                else:
+                    range_entries = [e for e in source_entries if start_num <= e['number'] <= end_num]
+        if contiguous and fast_first is None:
+            fast_first = source_entries[0]['number']
+            fast_last = source_entries[-1]['number']
+        range_count = max(0, fast_last - fast_first + 1) if fast_first is not None else len(range_entries)
 
-        if total_batches <= 0 or len(range_entries) == 0:
+        if total_batches <= 0 or range_count == 0:
             return set()
 
-        # ���Ȱ���现存批文件的编号范围进行定位，确保精确
-        mapping = self._map_missing_to_batches_by_files(missing_numbers, batch_files_pattern, total_batches)
+        # 批次文件列表只枚举一次，供文件边界定位与回退逻辑共用
+        batch_paths = sorted(glob.glob(batch_files_pattern))
+
+        # 优先按现存批文件的编号范围进行定位，确保精确
+        mapping = self._map_missing_to_batches_by_files(missing_numbers, batch_files_pattern, total_batches, batch_paths)
         if mapping:
             return set(mapping.values())
 
@@ -1288,38 +1981,46 @@ class SRTGuiApp:
 
         # 回退：用名义值
         if not batch_size or batch_size <= 0:
-            batch_size = math.ceil(len(range_entries) / total_batches)
+            batch_size = math.ceil(range_count / total_batches)
 
         batches = set()
-        
-        # 【关键修复】：基于字幕条目在列表中的索引位置来计算批次，而不是基于编号值
-        # 创建编号到索引的映射
-        number_to_index = {entry['number']: idx for idx, entry in enumerate(range_entries)}
-        
-        for n in missing_numbers:
-            if n not in number_to_index:
-                continue
-            # 获取该字幕条目在排序列表中的索引位置
-            index = number_to_index[n]
-            # 基于索引位置计算批次号（从1开始）
-            b = (index // batch_size) + 1
-            if b < 1:
-                b = 1
-            if b > total_batches:
-                b = total_batches
-            batches.add(b)
+        self._last_batch_size = batch_size
+
+        if fast_first is not None:
+            # 连续编号快速路径：直接由编号偏移计算批次
+            self._last_index_offset = fast_first
+            for n in missing_numbers:
+                if fast_first <= n <= fast_last:
+                    batches.add(min(max(((n - fast_first) // batch_size) + 1, 1), total_batches))
+        else:
+            # 【关键修复】：基于字幕条目在列表中的索引位置来计算批次，而不是基于编号值
+            # 创建编号到索引的映射
+            number_to_index = self._number_to_index(range_entries)
+            self._last_number_to_index = number_to_index
+            for n in missing_numbers:
+                if n not in number_to_index:
+                    continue
+                # 获取该字幕条目在排序列表中的索引位置
+                index = number_to_index[n]
+                # 基于索引位置计算批次号（从1开始）
+                b = (index // batch_size) + 1
+                if b < 1:
+                    b = 1
+                if b > total_batches:
+                    b = total_batches
+                batches.add(b)
 
         # 回退：利用已有批次文件的编号范围（保持原有逻辑作为双重保险）
         if not batches:
             batch_minmax = {}
-            for path in glob.glob(batch_files_pattern):
-                m = re.search(r"(\d+)\.srt$", path)
+            for path in batch_paths:
+                m = _BATCH_NUM_RE.search(path)
                 if not m:
                     continue
                 bnum = int(m.group(1))
-                entries = self._parse_srt_entries_quick(path)
-                if entries:
-                    nums = [e['number'] for e in entries]
+                # 只需编号范围，用仅扫描编号的解析器
+                nums = self._scan_srt_numbers_quick(path)
+                if nums:
                     batch_minmax[bnum] = (min(nums), max(nums))
             for n in missing_numbers:
                 chosen = None
@@ -1340,33 +2041,36 @@ class SRTGuiApp:
         return batches
 
     def _scan_srt_numbers_quick(self, srt_path: str):
-        """仅按编号+时间轴快速扫描条目编号列表（不依赖内容匹配）。"""
+        """仅按编号+时间轴快速扫描条目编号列表（不依赖内容匹配）。结果按文件状态缓存。"""
+        key = self._srt_cache_key(srt_path)
+        cached = self._srt_nums_cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached
         nums = []
         try:
+            # 逐行流式扫描：仅保留上一行的编号，不物化整文件行列表
+            pending_num = None
             with open(srt_path, 'r', encoding='utf-8', errors='replace') as f:
-                lines = f.read().splitlines()
-            i = 0
-            while i < len(lines):
-                m_num = re.match(r"^\s*(\d+)\s*$", lines[i])
-                if m_num and i + 1 < len(lines):
-                    if re.match(r"^\s*\d{2}:\d{2}:\d{2},\d{3}\s*-->\s*\d{2}:\d{2}:\d{2},\d{3}\s*$", lines[i+1]):
-                        try:
-                            nums.append(int(m_num.group(1)))
-                        except Exception:
-                            pass
-                        i += 2
+                for line in f:
+                    if pending_num is not None and _SRT_TIME_LINE_RE.match(line):
+                        nums.append(pending_num)
+                        pending_num = None
                         continue
-                i += 1
+                    m_num = _SRT_NUM_LINE_RE.match(line)
+                    pending_num = int(m_num.group(1)) if m_num else None
         except Exception:
             return []
+        self._cache_put(self._srt_nums_cache, key, nums)
         return nums
 
-    def _map_missing_to_batches_by_files(self, missing_numbers, batch_files_pattern, total_batches):
-        """基于现存批文件编号范围，为缺失编号生成批次映射。"""
+    def _map_missing_to_batches_by_files(self, missing_numbers, batch_files_pattern, total_batches, batch_paths=None):
+        """基于现存批文件编号范围，为缺失编号生成批次映射。batch_paths 为已排序的批次文件列表（可选）。"""
         mapping = {}
         batch_minmax = {}
-        for path in sorted(glob.glob(batch_files_pattern)):
-            m = re.search(r"(\d+)\.srt$", path)
+        if batch_paths is None:
+            batch_paths = sorted(glob.glob(batch_files_pattern))
+        for path in batch_paths:
+            m = _BATCH_NUM_RE.search(path)
             if not m:
                 continue
             bnum = int(m.group(1))
@@ -1381,65 +2085,79 @@ class SRTGuiApp:
         first_b, (first_min, first_max) = ordered[0]
         last_b, (last_min, last_max) = ordered[-1]
 
+        # 按起始编号排序后二分定位，O(log B) 取代逐批线性查找
+        by_min = sorted(ordered, key=lambda kv: kv[1][0])
+        bnums = [b for b, _ in by_min]
+        mins = [mn for _, (mn, _mx) in by_min]
+        maxs = [mx for _, (_mn, mx) in by_min]
+
         for n in missing_numbers:
-            hit = None
-            for b, (mn, mx) in ordered:
-                if mn <= n <= mx:
-                    hit = b
-                    break
-            if hit is not None:
-                mapping[n] = hit
-                continue
             if n < first_min:
                 mapping[n] = first_b
                 continue
             if n > last_max:
                 mapping[n] = last_b
                 continue
-            for i in range(len(ordered) - 1):
-                b_curr, (mn_curr, mx_curr) = ordered[i]
-                b_next, (mn_next, mx_next) = ordered[i+1]
-                if mx_curr < n < mn_next:
-                    mapping[n] = b_curr
-                    break
+            i = bisect.bisect_right(mins, n) - 1
+            if i < 0:
+                continue
+            if n <= maxs[i]:
+                mapping[n] = bnums[i]
+            elif i + 1 < len(mins) and n < mins[i + 1]:
+                # 夹在相邻两批之间，归入前一批
+                mapping[n] = bnums[i]
 
         return mapping
 
     def auto_fix_and_retranslate(self):
         """一键修复：定位缺失编号→重置对应批次→删除合并文件→断点续翻。"""
-        if not self.validate_checker_inputs():
+        if self._report_input_errors(self.validate_checker_inputs()):
             return
 
+        # 用于“定位进度/批次/删除合并文件”的基础：必须使用用户原始输出路径，而不是临时文件
+        original_source_path = self.source_file_var.get()
+        original_translated_path = self.translated_file_var.get()
+
         # 预处理，确保UTF-8
         try:
-            self.preprocess_srt_files()
+            self.preprocess_srt_files(original_source_path, original_translated_path)
         except Exception as e:
             messagebox.showerror("预处理错误", f"处理文件编码时出错: {str(e)}")
             return
 
         # 用于“校验差异”的解析：优先使用UTF-8临时文件（避免编码问题）
-        source_file = self.temp_source_file or self.source_file_var.get()
-        translated_file = self.temp_translated_file or self.translated_file_var.get()
-        # 用于“定位进度/批次/删除合并文件”的基础：必须使用用户原始输出路径，而不是临时文件
-        original_translated_path = self.translated_file_var.get()
-
-        self.checker_output.insert(tk.END, "开始分析缺失编号…\n")
-        self.checker_output.see(tk.END)
+        source_file = self.temp_source_file or original_source_path
+        translated_file = self.temp_translated_file or original_translated_path
+
+        # 日志先缓冲，每个阶段结束时一次性写入输出框
+        log = []
+        _END = tk.END
+        _insert = self.checker_output.insert
+        _see = self.checker_output.see
+
+        def _log(msg, flush=False):
+            if msg:
+                log.append(msg)
+            if flush and log:
+                _insert(_END, ''.join(log))
+                log.clear()
+                _see(_END)
+
+        _log("开始分析缺失编号…\n", flush=True)
         self.root.update()
 
         src_entries = self._parse_srt_entries_quick(source_file)
         tr_entries = self._parse_srt_entries_quick(translated_file)
-        src_nums = {e['number'] for e in src_entries}
-        tr_nums = {e['number'] for e in tr_entries}
-        missing = sorted(src_nums - tr_nums)
+        # 编号在文件中基本有序，timsort近似线性；随后做一次有序归并求差
+        src_nums = sorted(e['number'] for e in src_entries)
+        tr_nums = sorted(e['number'] for e in tr_entries)
+        missing = _sorted_difference(src_nums, tr_nums)
 
         if not missing:
-            self.checker_output.insert(tk.END, "未检测到缺失编号，无需修复。\n")
-            self.checker_output.see(tk.END)
+            _log("未检测到缺失编号，无需修复。\n", flush=True)
             return
 
-        self.checker_output.insert(tk.END, f"检测到缺失编号: {missing}\n")
-        self.checker_output.see(tk.END)
+        _log(f"检测到缺失编号: {missing}\n", flush=True)
 
         # 定位progress与base：基于原始译文路径进行查找
         progress_path, output_base, range_tag = self._find_progress_and_base(original_translated_path)
@@ -1447,9 +2165,8 @@ class SRTGuiApp:
             messagebox.showerror("错误", "未找到对应的进度文件(progress.json)。请确认翻译输出与工作目录。")
             return
 
-        self.checker_output.insert(tk.END, f"使用进度文件: {progress_path}\n")
-        self.checker_output.insert(tk.END, f"输出基名: {output_base}, 范围标签: {range_tag or '无'}\n")
-        self.checker_output.see(tk.END)
+        _log(f"使用进度文件: {progress_path}\n")
+        _log(f"输出基名: {output_base}, 范围标签: {range_tag or '无'}\n", flush=True)
 
         # 读取progress
         try:
@@ -1462,12 +2179,16 @@ class SRTGuiApp:
         total_batches = int(prog.get('total_batches', 0) or 0)
         completed = set(prog.get('completed_batches', []))
 
+        # 进度目录与批次文件前缀只计算一次，后续路径直接拼接
+        prog_dir = os.path.dirname(progress_path) or '.'
+        batch_prefix = f"{prog_dir}{os.sep}{output_base}_batch{range_tag}"
+
         # 批次文件模式
-        batch_glob_pattern = os.path.join(os.path.dirname(progress_path) or '.', f"{output_base}_batch{range_tag}*.srt")
+        batch_glob_pattern = batch_prefix + "*.srt"
 
         # 【增强日志】：详细记录批次计算过程
         current_batch_size = self.batch_size_var.get() if hasattr(self, 'batch_size_var') else None
-        self.checker_output.insert(tk.END, f"批次计算参数: 总批次={total_batches}, GUI批次大小={current_batch_size}\n")
+        _log(f"批次计算参数: 总批次={total_batches}, GUI批次大小={current_batch_size}\n")
         
         batches_to_reset = self._compute_batches_to_reset(
             missing,
@@ -1478,161 +2199,146 @@ class SRTGuiApp:
             current_batch_size,
         )
         if not batches_to_reset:
+            _log("", flush=True)
             messagebox.showerror("错误", "无法定位需要重翻的批次。请检查日志或手动处理。")
             return
 
-        self.checker_output.insert(tk.END, f"需要重置的批次: {sorted(batches_to_reset)}\n")
+        _log(f"需要重置的批次: {sorted(batches_to_reset)}\n")
         
         # 【调试信息】：显示每个缺失编号对应的批次
+        # 优先复用批次计算时的映射与批次大小，循环外只准备一次
+        index_offset = self._last_index_offset
+        number_to_index = None
+        if index_offset is None:
+            number_to_index = self._last_number_to_index or self._number_to_index(src_entries)
+        batch_size = self._last_batch_size
+        if not batch_size:
+            batch_size = int(float(current_batch_size)) if current_batch_size else math.ceil(len(src_entries) / total_batches)
         for n in missing[:10]:  # 只显示前10个，避免输出过长
-            number_to_index = {entry['number']: idx for idx, entry in enumerate(src_entries)}
-            if n in number_to_index:
-                index = number_to_index[n]
-                batch_size = int(float(current_batch_size)) if current_batch_size else math.ceil(len(src_entries) / total_batches)
+            index = (n - index_offset) if index_offset is not None else number_to_index.get(n)
+            if index is not None and index >= 0:
                 calculated_batch = (index // batch_size) + 1
-                self.checker_output.insert(tk.END, f"  编号{n} → 索引{index} → 批次{calculated_batch}\n")
+                _log(f"  编号{n} → 索引{index} → 批次{calculated_batch}\n")
         if len(missing) > 10:
-            self.checker_output.insert(tk.END, f"  ... 还有 {len(missing)-10} 个缺失编号\n")
-            
-        self.checker_output.see(tk.END)
+            _log(f"  ... 还有 {len(missing)-10} 个缺失编号\n")
+        _log("", flush=True)
 
         # 【强化进度文件更新】：移除完成标记并验证更新结果
-        original_completed = completed.copy()  # 保存原始状态用于对比
-        updated_completed = [b for b in completed if b not in batches_to_reset]
-        removed_batches = [b for b in completed if b in batches_to_reset]
+        # 一次集合运算得到保留与移除的批次，并各排序一次
+        updated_completed = sorted(completed - batches_to_reset)
+        removed_batches = sorted(completed & batches_to_reset)
         
-        prog['completed_batches'] = sorted(updated_completed)
+        prog['completed_batches'] = updated_completed
         
         # 显示详细的进度更新信息
-        self.checker_output.insert(tk.END, f"进度文件更新详情:\n")
-        self.checker_output.insert(tk.END, f"  原有完成批次: {sorted(original_completed)}\n")
-        self.checker_output.insert(tk.END, f"  移除的批次: {sorted(removed_batches)}\n")
-        self.checker_output.insert(tk.END, f"  更新后完成批次: {sorted(updated_completed)}\n")
+        _log(f"进度文件更新详情:\n")
+        _log(f"  原有完成批次: {sorted(completed)}\n")
+        _log(f"  移除的批次: {removed_batches}\n")
+        _log(f"  更新后完成批次: {updated_completed}\n")
         
         try:
-            with open(progress_path, 'w', encoding='utf-8') as f:
-                json.dump(prog, f, ensure_ascii=False, indent=2)
-            self.checker_output.insert(tk.END, "✓ 已成功更新进度文件\n")
-            
-            # 【验证写入】：重新读取文件确认更新成功
+            # 序列化一次，写临时文件后原子替换，避免写到一半的进度文件
+            data = json.dumps(prog, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            tmp_path = progress_path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, progress_path)
+            _log("✓ 已成功更新进度文件\n")
+            
+            # 【验证写入】：按字节比对落盘内容，无需重新解析JSON
             try:
-                with open(progress_path, 'r', encoding='utf-8') as f:
-                    verify_prog = json.load(f)
-                verify_completed = set(verify_prog.get('completed_batches', []))
-                if verify_completed == set(updated_completed):
-                    self.checker_output.insert(tk.END, "✓ 进度文件更新验证通过\n")
+                with open(progress_path, 'rb') as f:
+                    on_disk = f.read()
+                if on_disk == data:
+                    _log("✓ 进度文件更新验证通过\n")
                 else:
-                    self.checker_output.insert(tk.END, f"⚠ 进度文件验证失败: 期望{sorted(updated_completed)}, 实际{sorted(verify_completed)}\n")
+                    _log("⚠ 进度文件验证失败: 落盘内容与写入内容不一致\n")
             except Exception as ve:
-                self.checker_output.insert(tk.END, f"⚠ 进度文件验证失败: {ve}\n")
+                _log(f"⚠ 进度文件验证失败: {ve}\n")
                 
         except Exception as e:
+            _log("", flush=True)
             messagebox.showerror("错误", f"写入进度文件失败: {e}")
             return
+        _log("", flush=True)
 
-        # 【强化文件清理】：删除对应批次文件，包括可能的备份文件
+        # 【强化文件清理】：先收集待删除文件(路径, 类别, 失败是否计入汇总)，再统一删除
         deleted_files = []
         failed_deletions = []
+        to_delete = []
         
         for b in sorted(batches_to_reset):
             # 主批次文件
-            bf = os.path.join(os.path.dirname(progress_path) or '.', f"{output_base}_batch{range_tag}{b}.srt")
-            try:
-                if os.path.exists(bf):
-                    os.remove(bf)
-                    deleted_files.append(bf)
-                    self.checker_output.insert(tk.END, f"✓ 已删除批次文件: {bf}\n")
-            except Exception as e:
-                failed_deletions.append(f"{bf} -> {e}")
-                self.checker_output.insert(tk.END, f"✗ 删除批次文件失败: {bf} -> {e}\n")
-            
-            # 检查并删除可能的备份或临时文件
-            backup_patterns = [
-                f"{output_base}_batch{range_tag}{b}.srt.bak",
-                f"{output_base}_batch{range_tag}{b}.srt.tmp",
-            ]
-            for backup_file in backup_patterns:
-                backup_path = os.path.join(os.path.dirname(progress_path) or '.', backup_file)
-                try:
-                    if os.path.exists(backup_path):
-                        os.remove(backup_path)
-                        deleted_files.append(backup_path)
-                        self.checker_output.insert(tk.END, f"✓ 已删除备份文件: {backup_path}\n")
-                except Exception as e:
-                    self.checker_output.insert(tk.END, f"✗ 删除备份文件失败: {backup_path} -> {e}\n")
+            bf = f"{batch_prefix}{b}.srt"
+            to_delete.append((bf, "批次文件", True))
+            # 可能的备份或临时文件
+            to_delete.append((bf + ".bak", "备份文件", False))
+            to_delete.append((bf + ".tmp", "备份文件", False))
 
         # 【强化合并文件清理】：删除所有相关的合并文件
-        files_to_delete = [
-            original_translated_path,  # 主输出文件
-            original_translated_path + ".bak",  # 可能的备份文件
-            original_translated_path + ".tmp",  # 可能的临时文件
-        ]
-        
-        for file_path in files_to_delete:
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    deleted_files.append(file_path)
-                    self.checker_output.insert(tk.END, f"✓ 已删除合并文件: {file_path}\n")
-            except Exception as e:
-                failed_deletions.append(f"{file_path} -> {e}")
-                self.checker_output.insert(tk.END, f"✗ 删除合并文件失败: {file_path} -> {e}\n")
+        to_delete.append((original_translated_path, "合并文件", True))  # 主输出文件
+        to_delete.append((original_translated_path + ".bak", "合并文件", True))  # 可能的备份文件
+        to_delete.append((original_translated_path + ".tmp", "合并文件", True))  # 可能的临时文件
+
+        # 删除为IO阻塞操作，文件较多时用线程池重叠系统调用延迟；结果保持原顺序
+        paths = [item[0] for item in to_delete]
+        if len(paths) >= 4:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+                results = list(ex.map(_try_remove, paths))
+        else:
+            results = [_try_remove(path) for path in paths]
+
+        ok_lines = []
+        fail_lines = []
+        for (path, kind, count_failure), result in zip(to_delete, results):
+            if result is True:
+                deleted_files.append(path)
+                ok_lines.append(f"✓ 已删除{kind}: {path}")
+            elif isinstance(result, Exception):
+                if count_failure:
+                    failed_deletions.append(f"{path} -> {result}")
+                fail_lines.append(f"✗ 删除{kind}失败: {path} -> {result}")
+        if ok_lines:
+            _log("\n".join(ok_lines) + "\n")
+        if fail_lines:
+            _log("\n".join(fail_lines) + "\n")
         
         # 汇总删除结果
         if deleted_files:
-            self.checker_output.insert(tk.END, f"总共成功删除 {len(deleted_files)} 个文件\n")
+            _log(f"总共成功删除 {len(deleted_files)} 个文件\n")
         if failed_deletions:
-            self.checker_output.insert(tk.END, f"警告: {len(failed_deletions)} 个文件删除失败\n")
-        self.checker_output.see(tk.END)
+            _log(f"警告: {len(failed_deletions)} 个文件删除失败\n")
+        _log("", flush=True)
 
-        # 构建重翻命令：必须使用最初的输出基名(不含range_tag)，以复用同一个progress
-        requested_output = os.path.join(os.path.dirname(progress_path) or '.', f"{output_base}.srt")
+        # 重翻输出：必须使用最初的输出基名(不含range_tag)，以复用同一个progress
+        requested_output = f"{prog_dir}{os.sep}{output_base}.srt"
 
         # 解析范围
         start_arg = None
         end_arg = None
         if range_tag:
-            m = re.match(r"_(\d+)_(\d+)$", range_tag)
+            m = _RANGE_TAG_RE.match(range_tag)
             if m:
                 start_arg = m.group(1)
                 end_arg = m.group(2)
 
-        # 使用当前翻译器配置构建参数（API/KEY/端点/模型/线程数等），但不传 --no-resume
-        cmd = [sys.executable, "srt_translator.py", self.source_file_var.get(), requested_output,
-               "--api", "custom",
-               "--api-key", self.api_key_var.get(),
-               "--api-endpoint", self.api_endpoint_var.get()]
-        if self.model_var.get():
-            cmd.extend(["--model", self.model_var.get()])
-        # 线程数、批次、上下文尽量沿用当前设置（批次大小不会影响resume的批次数，但为安全建议保持与上次一致）
-        if self.batch_size_var.get():
-            cmd.extend(["--batch-size", self.batch_size_var.get()])
-        if self.context_size_var.get():
-            cmd.extend(["--context-size", self.context_size_var.get()])
-        if self.threads_var.get():
-            cmd.extend(["--threads", self.threads_var.get()])
+        # 使用当前翻译器配置（API/KEY/端点/模型/线程数等），以断点续翻方式运行
+        # 每个Tk变量只读取一次
+        src = original_source_path
+        api_key = self.api_key_var.get()
+        endpoint = self.api_endpoint_var.get()
+        model = self.model_var.get().strip()
+        bs = self.batch_size_var.get()
+        cs = self.context_size_var.get()
+        th = self.threads_var.get()
+        temp = self._opt_get("temperature_var", "")
+        la = self._opt_bool("literal_align_var")
+        so = self._opt_bool("structured_output_var")
+        pm = self._opt_bool("professional_mode_var")
         # 用户提示词
         user_prompt = self.user_prompt_text.get(1.0, tk.END).strip()
-        if user_prompt:
-            cmd.extend(["--user-prompt", user_prompt])
-        # 温度
-        if getattr(self, "temperature_var", None) and self.temperature_var.get():
-            cmd.extend(["--temperature", self.temperature_var.get()])
-        # 逐条逐句对齐
-        if getattr(self, "literal_align_var", None) and self.literal_align_var.get():
-            cmd.append("--literal-align")
-        # 结构化输出
-        if getattr(self, "structured_output_var", None) and self.structured_output_var.get():
-            cmd.append("--structured-output")
-        # 专业模式
-        if getattr(self, "professional_mode_var", None) and self.professional_mode_var.get():
-            cmd.append("--professional-mode")
-        # 范围
-        if start_arg and end_arg:
-            cmd.extend(["--start", start_arg, "--end", end_arg])
-
-        self.checker_output.insert(tk.END, "开始断点续翻缺失批次…\n")
-        self.checker_output.see(tk.END)
+
+        _log("开始断点续翻缺失批次…\n", flush=True)
         # 复用后台执行器（以translation类型运行，便于完成后自动填充路径）
         try:
             start_num = int(start_arg) if start_arg else None
@@ -1641,37 +2347,25 @@ class SRTGuiApp:
             start_num = None
             end_num = None
 
-        def _to_int(v, default):
-            try:
-                return int(float(v))
-            except Exception:
-                return default
-
-        def _to_float(v, default):
-            try:
-                return float(v)
-            except Exception:
-                return default
-
         job = TranslationJobConfig(
-            input_file=self.source_file_var.get(),
+            input_file=src,
             output_file=requested_output,
             api_type="custom",
-            api_key=self.api_key_var.get(),
-            api_endpoint=self.api_endpoint_var.get(),
-            model=self.model_var.get().strip(),
-            batch_size=_to_int(self.batch_size_var.get(), 5),
-            context_size=_to_int(self.context_size_var.get(), 2),
-            threads=_to_int(self.threads_var.get(), 1),
-            temperature=_to_float(getattr(self, "temperature_var", tk.StringVar(value="0.8")).get(), 0.8),
+            api_key=api_key,
+            api_endpoint=endpoint,
+            model=model,
+            batch_size=_to_int(bs, 5),
+            context_size=_to_int(cs, 2),
+            threads=_to_int(th, 1),
+            temperature=_to_float(temp or "0.8", 0.8),
             user_prompt=user_prompt,
             resume=True,
             bilingual=False,
             start_num=start_num,
             end_num=end_num,
-            literal_align=bool(getattr(self, "literal_align_var", tk.BooleanVar(value=False)).get()),
-            structured_output=bool(getattr(self, "structured_output_var", tk.BooleanVar(value=False)).get()),
-            professional_mode=bool(getattr(self, "professional_mode_var", tk.BooleanVar(value=False)).get()),
+            literal_align=la,
+            structured_output=so,
+            professional_mode=pm,
         )
 
         self.is_running = True
@@ -2061,37 +2755,40 @@ class SRTGuiApp:
         # 仅对审核表格微调行高（+2px），避免影响其他表格
         try:
             style = ttk.Style()
-            base_rowheight = style.lookup("Treeview", "rowheight")
-            try:
-                base_rowheight = int(base_rowheight) if base_rowheight else None
-            except Exception:
-                base_rowheight = None
+            base_rowheight = type(self)._REVIEW_ROWHEIGHT
             if base_rowheight is None:
+                base_rowheight = style.lookup("Treeview", "rowheight")
                 try:
-                    base_rowheight = int(style.configure("Treeview").get("rowheight", 20))
+                    base_rowheight = int(base_rowheight) if base_rowheight else None
                 except Exception:
-                    base_rowheight = 20
+                    base_rowheight = None
+                if base_rowheight is None:
+                    try:
+                        base_rowheight = int(style.configure("Treeview").get("rowheight", 20))
+                    except Exception:
+                        base_rowheight = 20
+                type(self)._REVIEW_ROWHEIGHT = base_rowheight
             style.configure("Review.Treeview", rowheight=base_rowheight + 2)
         except Exception:
             pass
 
-        # 创建Treeview表格
-        columns = ("编号", "原文", "纠错后", "恢复", "状态")
+        # 创建Treeview表格：含“时长”“原文语速”“纠错语速”列，“编号”“状态”列收窄
+        columns = ("编号", "时长", "原文", "原文语速", "纠错后", "恢复", "纠错语速", "状态")
         self.review_tree = ttk.Treeview(table_frame, columns=columns, show="headings", selectmode="extended", style="Review.Treeview")
         
-        # 配置列
-        self.review_tree.heading("编号", text="编号")
-        self.review_tree.heading("原文", text="原文")  
-        self.review_tree.heading("纠错后", text="纠错后")
-        self.review_tree.heading("恢复", text="↩")
-        self.review_tree.heading("状态", text="状态")
-        
-        # 设置列宽
-        self.review_tree.column("编号", width=55, anchor=tk.CENTER, stretch=False)
-        self.review_tree.column("原文", width=420, anchor=tk.W, stretch=True)
-        self.review_tree.column("纠错后", width=420, anchor=tk.W, stretch=True)
-        self.review_tree.column("恢复", width=55, anchor=tk.CENTER, stretch=False)
-        self.review_tree.column("状态", width=90, anchor=tk.CENTER, stretch=False)
+        # 表头与列宽
+        for col, heading, width, anchor, stretch in (
+            ("编号", "编号", 45, tk.CENTER, False),
+            ("时长", "时长", 55, tk.CENTER, False),
+            ("原文", "原文", 420, tk.W, True),
+            ("原文语速", "原文语速", 90, tk.CENTER, False),
+            ("纠错后", "纠错后", 420, tk.W, True),
+            ("恢复", "↩", 55, tk.CENTER, False),
+            ("纠错语速", "纠错语速", 90, tk.CENTER, False),
+            ("状态", "状态", 70, tk.CENTER, False),
+        ):
+            self.review_tree.heading(col, text=heading)
+            self.review_tree.column(col, width=width, anchor=anchor, stretch=stretch)
         
         # 添加滚动条（包一层以便同步高亮覆盖层）
         self.review_tree_scrollbar_y = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self._on_review_scrollbar_y)
@@ -2114,7 +2811,10 @@ class SRTGuiApp:
         self.review_tree.tag_configure("kept_original", background="#b0ffb0")  # 已处理：更饱和的淡绿
 
         # 用于彩色差异覆盖的内部结构
-        self._review_cell_overlays = {}  # {(item_id, column_name): text_widget}
+        # 按行索引存放覆盖层：每行一个 [原文, 纠错后, 原文语速, 纠错语速] 列表，未创建为None
+        self._review_row_overlays = []
+        self._review_overlay_rows = set()  # 当前持有覆盖层的行索引
+        self.review_item_to_row = {}  # item_id -> 行索引
         self._review_overlay_update_job = None
         
         # 绑定事件
@@ -2146,30 +2846,6 @@ class SRTGuiApp:
         self._review_hover_item = None
         self._review_restore_tooltip = None
         self._review_restore_tooltip_after_id = None
-        # 重新配置审核表格列，新增“时长”“原文语速”“纠错语速”，并收窄“编号”“状态”列宽
-        try:
-            new_columns = ("编号", "时长", "原文", "原文语速", "纠错后", "恢复", "纠错语速", "状态")
-            self.review_tree.configure(columns=new_columns)
-            # 表头
-            self.review_tree.heading("编号", text="编号")
-            self.review_tree.heading("时长", text="时长")
-            self.review_tree.heading("原文", text="原文")
-            self.review_tree.heading("原文语速", text="原文语速")
-            self.review_tree.heading("纠错后", text="纠错后")
-            self.review_tree.heading("恢复", text="↩")
-            self.review_tree.heading("纠错语速", text="纠错语速")
-            self.review_tree.heading("状态", text="状态")
-            # 列宽
-            self.review_tree.column("编号", width=45, anchor=tk.CENTER, stretch=False)
-            self.review_tree.column("时长", width=55, anchor=tk.CENTER, stretch=False)
-            self.review_tree.column("原文", width=420, anchor=tk.W, stretch=True)
-            self.review_tree.column("原文语速", width=90, anchor=tk.CENTER, stretch=False)
-            self.review_tree.column("纠错后", width=420, anchor=tk.W, stretch=True)
-            self.review_tree.column("恢复", width=55, anchor=tk.CENTER, stretch=False)
-            self.review_tree.column("纠错语速", width=90, anchor=tk.CENTER, stretch=False)
-            self.review_tree.column("状态", width=70, anchor=tk.CENTER, stretch=False)
-        except Exception:
-            pass
     
     def create_status_bar(self):
         """创建浮动状态栏"""
@@ -2195,18 +2871,31 @@ class SRTGuiApp:
                                           maximum=100,
                                           length=300)
         self.progress_bar.pack(side=tk.RIGHT, padx=12, pady=8, fill=tk.X, expand=True)
+        # 进度条最近一次设置的模式/最大值/数值，未变化时不再写入Tk
+        self._pb_mode = 'determinate'
+        self._pb_max = 100
+        self._pv_last = 0.0
         
         # 绑定窗口大小变化事件，动态调整状态栏位置
         self.root.bind('<Configure>', self._update_status_bar_position)
         
         # 初始定位状态栏
-        self.root.after(100, self._update_status_bar_position)
+        self.root.after(100, self._do_update_status_bar_position)
     
     def _update_status_bar_position(self, event=None):
-        """动态更新状态栏位置，使其始终浮动在窗口底部"""
+        """窗口大小变化时合并事件，30ms内只重定位一次状态栏"""
         if event and event.widget != self.root:
             return  # 只响应主窗口的大小变化
-            
+        if self._status_bar_after_id is not None:
+            try:
+                self.root.after_cancel(self._status_bar_after_id)
+            except Exception:
+                pass
+        self._status_bar_after_id = self.root.after(30, self._do_update_status_bar_position)
+
+    def _do_update_status_bar_position(self):
+        """动态更新状态栏位置，使其始终浮动在窗口底部"""
+        self._status_bar_after_id = None
         # 获取当前窗口大小
         window_width = self.root.winfo_width()
         window_height = self.root.winfo_height()
@@ -2217,101 +2906,106 @@ class SRTGuiApp:
         # 将状态栏定位在窗口底部
         self.status_frame.place(x=0, y=window_height-status_height, width=window_width, height=status_height)
     
+    _SRT_FILETYPES = [("SRT files", "*.srt"), ("All files", "*.*")]
+
+    def _browse(self, kind, var, *, title, filetypes, save=False, defaultext=None, after=None):
+        """通用文件浏览：弹出对话框，选中后写入变量并执行后续处理"""
+        kwargs = {"title": title, "filetypes": filetypes}
+        if defaultext:
+            kwargs["defaultextension"] = defaultext
+        filename = self._ask_file(kind, save=save, **kwargs)
+        if filename:
+            var.set(filename)
+            if after:
+                after(filename)
+        return filename
+
+    def _ask_file(self, key, save=False, **kwargs):
+        """弹出文件对话框：按类别记住上次所在目录并作为initialdir"""
+        last_dir = self._last_dirs.get(key)
+        if last_dir and os.path.isdir(last_dir):
+            kwargs.setdefault("initialdir", last_dir)
+        ask = filedialog.asksaveasfilename if save else filedialog.askopenfilename
+        filename = ask(**kwargs)
+        if filename:
+            new_dir = os.path.dirname(filename)
+            if new_dir and new_dir != last_dir:
+                self._last_dirs[key] = new_dir
+                self._last_dirs_dirty = True
+        return filename
+
     def browse_input_file(self):
         """浏览输入文件"""
-        filename = filedialog.askopenfilename(
-            title="选择输入SRT文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.input_file_var.set(filename)
-            # 总是自动设置输出文件名（无论输出栏是否为空）
-            base_name = os.path.splitext(filename)[0]
-            self.output_file_var.set(f"{base_name}_translated.srt")
+        self._browse("translator_input", self.input_file_var, title="选择输入SRT文件",
+                     filetypes=self._SRT_FILETYPES, after=self._set_output_from_input)
+
+    def _set_output_from_input(self, path):
+        """根据输入文件设置输出文件名（无论输出栏是否为空）；值未变化时不再set，避免触发多余的trace回调"""
+        target = f"{os.path.splitext(path)[0]}_translated.srt"
+        if self.output_file_var.get() != target:
+            self.output_file_var.set(target)
     
     def on_input_file_change(self, *args):
-        """当输入文件路径变化时自动设置输出文件路径"""
+        """当输入文件路径变化时自动设置输出文件路径（250ms防抖，连续输入只处理最后一次）"""
+        if self._auto_name_after_id is not None:
+            try:
+                self.root.after_cancel(self._auto_name_after_id)
+            except Exception:
+                pass
+        self._auto_name_after_id = self.root.after(250, self._do_auto_name)
+
+    def _do_auto_name(self):
+        """根据输入文件路径生成输出文件路径"""
+        self._auto_name_after_id = None
         input_file = self.input_file_var.get().strip()
         
         # 只有当输入文件路径看起来像一个有效的文件路径时才自动设置输出路径
         if input_file and len(input_file) > 4 and input_file.lower().endswith('.srt'):
-            base_name = os.path.splitext(input_file)[0]
-            self.output_file_var.set(f"{base_name}_translated.srt")
+            self._set_output_from_input(input_file)
     
     def browse_output_file(self):
         """浏览输出文件"""
-        filename = filedialog.asksaveasfilename(
-            title="选择输出SRT文件",
-            defaultextension=".srt",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.output_file_var.set(filename)
+        self._browse("translator_output", self.output_file_var, title="选择输出SRT文件",
+                     filetypes=self._SRT_FILETYPES, save=True, defaultext=".srt")
     
     def browse_source_file(self):
         """浏览源文件"""
-        filename = filedialog.askopenfilename(
-            title="选择源SRT文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.source_file_var.set(filename)
+        self._browse("checker_source", self.source_file_var, title="选择源SRT文件",
+                     filetypes=self._SRT_FILETYPES)
     
     def browse_translated_file(self):
         """浏览翻译文件"""
-        filename = filedialog.askopenfilename(
-            title="选择翻译后的SRT文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.translated_file_var.set(filename)
+        self._browse("checker_translated", self.translated_file_var, title="选择翻译后的SRT文件",
+                     filetypes=self._SRT_FILETYPES)
     
     def browse_report_file(self):
         """浏览报告文件"""
-        filename = filedialog.asksaveasfilename(
-            title="选择报告文件",
-            defaultextension=".md",
-            filetypes=[("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.report_file_var.set(filename)
+        self._browse("checker_report", self.report_file_var, title="选择报告文件",
+                     filetypes=[("Markdown files", "*.md"), ("Text files", "*.txt"), ("All files", "*.*")],
+                     save=True, defaultext=".md")
     
     # 双语转换器的文件浏览功能
     def browse_bilingual_original_file(self):
         """浏览原始英文字幕文件"""
-        filename = filedialog.askopenfilename(
-            title="选择原始英文字幕文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.bilingual_original_var.set(filename)
-            # 如果启用了自动生成文件名，则自动设置输出文件名
-            if self.auto_name_var.get():
-                self.auto_generate_bilingual_output_name()
+        self._browse("bilingual_original", self.bilingual_original_var, title="选择原始英文字幕文件",
+                     filetypes=self._SRT_FILETYPES, after=self._after_bilingual_input_pick)
+
+    def _after_bilingual_input_pick(self, filename):
+        """如果启用了自动生成文件名，则自动设置输出文件名"""
+        if self.auto_name_var.get():
+            self.auto_generate_bilingual_output_name()
     
     def browse_bilingual_translated_file(self):
         """浏览已翻译的字幕文件"""
-        filename = filedialog.askopenfilename(
-            title="选择已翻译的字幕文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.bilingual_translated_var.set(filename)
-            # 如果启用了自动生成文件名，则自动设置输出文件名
-            if self.auto_name_var.get():
-                self.auto_generate_bilingual_output_name()
+        self._browse("bilingual_translated", self.bilingual_translated_var, title="选择已翻译的字幕文件",
+                     filetypes=self._SRT_FILETYPES, after=self._after_bilingual_input_pick)
     
     def browse_bilingual_output_file(self):
         """浏览双语字幕输出文件"""
-        filename = filedialog.asksaveasfilename(
-            title="选择双语字幕输出文件",
-            defaultextension=".srt",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if filename:
-            self.bilingual_output_var.set(filename)
-            # 用户手动选择了输出文件，禁用自动生成
-            self.auto_name_var.set(False)
+        # 用户手动选择了输出文件，禁用自动生成
+        self._browse("bilingual_output", self.bilingual_output_var, title="选择双语字幕输出文件",
+                     filetypes=self._SRT_FILETYPES, save=True, defaultext=".srt",
+                     after=lambda _f: self.auto_name_var.set(False))
     
     def auto_generate_bilingual_output_name(self):
         """自动生成双语字幕输出文件名"""
@@ -2323,7 +3017,8 @@ class SRTGuiApp:
             # 在文件名后添加"_双语"后缀
             base_name = os.path.splitext(translated_file)[0]
             output_file = f"{base_name}_双语.srt"
-            self.bilingual_output_var.set(output_file)
+            if self.bilingual_output_var.get() != output_file:
+                self.bilingual_output_var.set(output_file)
     
     def toggle_auto_naming(self):
         """切换自动命名功能"""
@@ -2332,53 +3027,67 @@ class SRTGuiApp:
             self.auto_generate_bilingual_output_name()
         # 如果禁用自动命名，保持用户手动输入的文件名
     
-    def validate_translator_inputs(self) -> bool:
-        """验证翻译器输入"""
-        if not self.input_file_var.get():
-            messagebox.showerror("错误", "请选择输入SRT文件")
-            return False
-        
-        if not os.path.exists(self.input_file_var.get()):
-            messagebox.showerror("错误", "输入文件不存在")
-            return False
-        
-        if not self.output_file_var.get():
-            messagebox.showerror("错误", "请设置输出SRT文件")
-            return False
-        
-        # 验证API参数
-        if not self.api_endpoint_var.get():
-            messagebox.showerror("错误", "请填写API服务器地址")
-            return False
-        
-        if not self.api_key_var.get():
-            messagebox.showerror("错误", "请输入API密钥")
-            return False
-        
-        # 验证数值参数
-        try:
-            batch_size = int(self.batch_size_var.get())
-            if batch_size < 1 or batch_size > 500:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("错误", "批次大小必须是1-500之间的整数")
-            return False
-        
+    def _check_inputs(self, checks) -> List[str]:
+        """检查 (路径/值, 需存在的文件?, 为空提示, 不存在提示)，返回全部错误提示；同一路径只stat一次"""
+        errs = []
+        exists = {}
+        for value, must_exist, empty_msg, missing_msg in checks:
+            if not value:
+                errs.append(empty_msg)
+                continue
+            if must_exist:
+                ok = exists.get(value)
+                if ok is None:
+                    ok = exists[value] = os.path.isfile(value)
+                if not ok:
+                    errs.append(missing_msg)
+        return errs
+
+    def _report_input_errors(self, errs) -> bool:
+        """有错误时合并为一个对话框显示，返回是否存在错误"""
+        if errs:
+            messagebox.showerror("错误", "\n".join(errs))
+            return True
+        return False
+
+    def _opt_get(self, name, default=None):
+        """读取可选的Tk变量，变量不存在时返回默认值（不创建临时Tk变量）"""
+        v = getattr(self, name, None)
+        return v.get() if v is not None else default
+
+    def _opt_bool(self, name, default=False) -> bool:
+        """读取可选的布尔开关，变量不存在时返回默认值"""
+        return bool(self._opt_get(name, default))
+
+    def _validate_int(self, var, lo, hi, name) -> Optional[str]:
+        """校验整数参数位于 [lo, hi]，不满足时返回错误提示"""
         try:
-            context_size = int(self.context_size_var.get())
-            if context_size < 0 or context_size > 100:
-                raise ValueError()
+            value = int(var.get())
         except ValueError:
-            messagebox.showerror("错误", "上下文大小必须是0-100之间的整数")
-            return False
+            value = None
+        if value is None or value < lo or value > hi:
+            return f"{name}必须是{lo}-{hi}之间的整数"
+        return None
+
+    def validate_translator_inputs(self) -> List[str]:
+        """验证翻译器输入，返回全部错误提示（为空表示通过）"""
+        # 文件与API参数
+        errs = self._check_inputs((
+            (self.input_file_var.get(), True, "请选择输入SRT文件", "输入文件不存在"),
+            (self.output_file_var.get(), False, "请设置输出SRT文件", None),
+            (self.api_endpoint_var.get(), False, "请填写API服务器地址", None),
+            (self.api_key_var.get(), False, "请输入API密钥", None),
+        ))
         
-        try:
-            threads = int(self.threads_var.get())
-            if threads < 1 or threads > 50:
-                raise ValueError()
-        except ValueError:
-            messagebox.showerror("错误", "线程数必须是1-50之间的整数")
-            return False
+        # 验证数值参数
+        for var, lo, hi, name in (
+            (self.batch_size_var, 1, 500, "批次大小"),
+            (self.context_size_var, 0, 100, "上下文大小"),
+            (self.threads_var, 1, 50, "线程数"),
+        ):
+            err = self._validate_int(var, lo, hi, name)
+            if err:
+                errs.append(err)
         
         # 验证范围参数
         start_num = self.start_num_var.get()
@@ -2389,65 +3098,36 @@ class SRTGuiApp:
                 start = int(start_num)
                 end = int(end_num)
                 if start > end:
-                    messagebox.showerror("错误", "开始编号不能大于结束编号")
-                    return False
+                    errs.append("开始编号不能大于结束编号")
             except ValueError:
-                messagebox.showerror("错误", "字幕编号必须是整数")
-                return False
+                errs.append("字幕编号必须是整数")
         elif start_num or end_num:
-            messagebox.showerror("错误", "如果设置范围，必须同时设置开始和结束编号")
-            return False
+            errs.append("如果设置范围，必须同时设置开始和结束编号")
         
-        return True
+        return errs
     
-    def validate_checker_inputs(self) -> bool:
-        """验证校验器输入"""
-        if not self.source_file_var.get():
-            messagebox.showerror("错误", "请选择源SRT文件")
-            return False
-        
-        if not os.path.exists(self.source_file_var.get()):
-            messagebox.showerror("错误", "源文件不存在")
-            return False
-        
-        if not self.translated_file_var.get():
-            messagebox.showerror("错误", "请选择翻译后的SRT文件")
-            return False
-        
-        if not os.path.exists(self.translated_file_var.get()):
-            messagebox.showerror("错误", "翻译后的文件不存在")
-            return False
-        
-        return True
+    def validate_checker_inputs(self) -> List[str]:
+        """验证校验器输入，返回全部错误提示（为空表示通过）"""
+        return self._check_inputs((
+            (self.source_file_var.get(), True, "请选择源SRT文件", "源文件不存在"),
+            (self.translated_file_var.get(), True, "请选择翻译后的SRT文件", "翻译后的文件不存在"),
+        ))
     
-    def validate_bilingual_inputs(self) -> bool:
-        """验证双语转换器输入"""
-        if not self.bilingual_original_var.get():
-            messagebox.showerror("错误", "请选择原始英文字幕文件")
-            return False
-        
-        if not os.path.exists(self.bilingual_original_var.get()):
-            messagebox.showerror("错误", "原始英文字幕文件不存在")
-            return False
-        
-        if not self.bilingual_translated_var.get():
-            messagebox.showerror("错误", "请选择已翻译的字幕文件")
-            return False
-        
-        if not os.path.exists(self.bilingual_translated_var.get()):
-            messagebox.showerror("错误", "已翻译的字幕文件不存在")
-            return False
-        
-        if not self.bilingual_output_var.get():
-            messagebox.showerror("错误", "请设置输出文件路径")
-            return False
+    def validate_bilingual_inputs(self) -> List[str]:
+        """验证双语转换器输入，返回全部错误提示（为空表示通过）"""
+        original = self.bilingual_original_var.get()
+        translated = self.bilingual_translated_var.get()
+        errs = self._check_inputs((
+            (original, True, "请选择原始英文字幕文件", "原始英文字幕文件不存在"),
+            (translated, True, "请选择已翻译的字幕文件", "已翻译的字幕文件不存在"),
+            (self.bilingual_output_var.get(), False, "请设置输出文件路径", None),
+        ))
         
         # 检查原始文件和翻译文件是否相同
-        if self.bilingual_original_var.get() == self.bilingual_translated_var.get():
-            messagebox.showerror("错误", "原始文件和翻译文件不能是同一个文件")
-            return False
+        if original and original == translated:
+            errs.append("原始文件和翻译文件不能是同一个文件")
         
-        return True
+        return errs
 
     def load_polished_to_bilingual(self):
         """从润色结果加载文件到双语转换器"""
@@ -2459,9 +3139,9 @@ class SRTGuiApp:
         except Exception:
             pass
         try:
-            polisher_out = getattr(self, "polisher_output_file_var", None)
-            if polisher_out is not None and polisher_out.get():
-                candidates.append(polisher_out.get())
+            polisher_out = self._opt_get("polisher_output_file_var", "")
+            if polisher_out:
+                candidates.append(polisher_out)
         except Exception:
             pass
 
@@ -2485,7 +3165,7 @@ class SRTGuiApp:
     
     def start_translation(self):
         """开始翻译"""
-        if not self.validate_translator_inputs():
+        if self._report_input_errors(self.validate_translator_inputs()):
             return
         
         if self.is_running:
@@ -2499,18 +3179,6 @@ class SRTGuiApp:
         api_endpoint = self.api_endpoint_var.get()
         model = self.model_var.get().strip()
 
-        def _to_int(v, default):
-            try:
-                return int(float(v))
-            except Exception:
-                return default
-
-        def _to_float(v, default):
-            try:
-                return float(v)
-            except Exception:
-                return default
-
         batch_size = _to_int(self.batch_size_var.get(), 5)
         context_size = _to_int(self.context_size_var.get(), 2)
         threads = _to_int(self.threads_var.get(), 1)
@@ -2518,10 +3186,12 @@ class SRTGuiApp:
 
         start_num = None
         end_num = None
+        start_str = self.start_num_var.get()
+        end_str = self.end_num_var.get()
         try:
-            if self.start_num_var.get() and self.end_num_var.get():
-                start_num = int(self.start_num_var.get())
-                end_num = int(self.end_num_var.get())
+            if start_str and end_str:
+                start_num = int(start_str)
+                end_num = int(end_str)
         except Exception:
             start_num = None
             end_num = None
@@ -2529,6 +3199,11 @@ class SRTGuiApp:
         user_prompt = self.user_prompt_text.get(1.0, tk.END).strip()
         resume = not bool(self.no_resume_var.get())
 
+        # 可选开关：变量不存在时视为关闭
+        literal_align = self._opt_bool("literal_align_var")
+        structured_output = self._opt_bool("structured_output_var")
+        professional_mode = self._opt_bool("professional_mode_var")
+
         job = TranslationJobConfig(
             input_file=input_file,
             output_file=output_file,
@@ -2545,94 +3220,166 @@ class SRTGuiApp:
             bilingual=False,
             start_num=start_num,
             end_num=end_num,
-            literal_align=bool(getattr(self, "literal_align_var", tk.BooleanVar(value=False)).get()),
-            structured_output=bool(getattr(self, "structured_output_var", tk.BooleanVar(value=False)).get()),
-            professional_mode=bool(getattr(self, "professional_mode_var", tk.BooleanVar(value=False)).get()),
+            literal_align=literal_align,
+            structured_output=structured_output,
+            professional_mode=professional_mode,
         )
 
         self.is_running = True
         self.update_ui_state(True, "translation")
         self._start_translation_process(job)
     
-    def preprocess_srt_files(self):
-        """预处理SRT文件以确保编码正确 - 创建临时UTF-8文件"""
-        # 首先在输出中添加提示
-        self.checker_output.insert(tk.END, "正在检查和处理文件编码...\n")
-        self.checker_output.see(tk.END)
-        self.root.update()
-        
-        source_file = self.source_file_var.get()
-        translated_file = self.translated_file_var.get()
-        
-        # 使用安全的临时文件名（避免使用原始文件名可能包含的特殊字符）
-        temp_dir = tempfile.gettempdir()
-        unique_id = str(uuid.uuid4())[:8]
-        
-        self.temp_source_file = os.path.join(temp_dir, f"srt_source_{unique_id}.srt")
-        self.temp_translated_file = os.path.join(temp_dir, f"srt_translated_{unique_id}.srt")
-        
-        self.checker_output.insert(tk.END, f"临时源文件: {self.temp_source_file}\n")
-        self.checker_output.insert(tk.END, f"临时翻译文件: {self.temp_translated_file}\n")
-        
-        # 尝试多种编码读取文件内容
-        encodings = ['utf-8', 'utf-8-sig', 'gbk', 'gb2312', 'iso-8859-1']
-        
-        # 处理源文件
-        source_content = None
-        source_encoding = None
-        for encoding in encodings:
+    def _is_utf8_file(self, path: str, sniff_size: Optional[int] = 65536) -> bool:
+        """嗅探文件开头（sniff_size=None 时校验整个文件）是否为合法UTF-8（结果按文件状态缓存）"""
+        key = self._srt_cache_key(path)
+        if key is None:
+            return False
+        key = key + (sniff_size,)
+        cached = self._utf8_sniff_cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            # 增量解码容忍截断在多字节字符中间的末尾
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            with open(path, 'rb') as f:
+                if sniff_size is None:
+                    while True:
+                        chunk = f.read(1 << 20)
+                        decoder.decode(chunk, final=not chunk)
+                        if not chunk:
+                            break
+                else:
+                    head = f.read(sniff_size)
+                    decoder.decode(head, final=len(head) < sniff_size)
+            ok = True
+        except (OSError, UnicodeDecodeError):
+            ok = False
+        self._cache_put(self._utf8_sniff_cache, key, ok)
+        return ok
+
+    @staticmethod
+    def _copy_as_utf8_temp(src: str, dst: str, chunk_size: int = 1 << 20, known_not_utf8: bool = False):
+        """将字幕文件转存为UTF-8临时文件，返回识别出的源编码；均无法解码时返回None
+
+        known_not_utf8=True 表示调用方已校验过不是UTF-8，跳过UTF-8尝试，只读取开头用于探测编码。
+        """
+        head = b''
+        if known_not_utf8:
+            with open(src, 'rb') as fin:
+                head = fin.read(chunk_size)
+        else:
+            # 先按UTF-8处理：边校验边按字节原样复制，省去整份解码再编码
+            decoder = codecs.getincrementaldecoder('utf-8')()
             try:
-                with open(source_file, 'r', encoding=encoding) as f:
-                    source_content = f.read()
-                source_encoding = encoding
-                break
+                with open(src, 'rb') as fin, open(dst, 'wb') as fout:
+                    while True:
+                        chunk = fin.read(chunk_size)
+                        if not head:
+                            head = chunk
+                        decoder.decode(chunk, final=not chunk)
+                        if not chunk:
+                            break
+                        fout.write(chunk)
+                return 'utf-8'
             except UnicodeDecodeError:
-                continue
-        
-        if source_content is None:
-            raise Exception(f"无法解码源文件，请尝试使用其他编码方式打开")
-        
-        # 处理翻译文件
-        translated_content = None
-        translated_encoding = None
+                pass
+
+        # 对文件开头探测一次编码并优先尝试，避免逐个编码整份试错
+        encodings = ['gbk', 'gb2312', 'iso-8859-1']
+        try:
+            # 可选依赖（通常随 requests 安装）；缺失时退回固定编码列表
+            import charset_normalizer
+        except ImportError:
+            charset_normalizer = None
+        if charset_normalizer is not None and head:
+            try:
+                best = charset_normalizer.from_bytes(head).best()
+            except Exception:
+                best = None
+            if best is not None and best.encoding:
+                detected = codecs.lookup(best.encoding).name
+                if detected not in ('utf-8', 'utf-8-sig'):
+                    encodings = [detected] + [e for e in encodings if codecs.lookup(e).name != detected]
+
+        # 其他编码按块流式解码并写为UTF-8，整份内容不驻留内存
         for encoding in encodings:
             try:
-                with open(translated_file, 'r', encoding=encoding) as f:
-                    translated_content = f.read()
-                translated_encoding = encoding
-                break
+                with open(src, 'r', encoding=encoding) as fin, open(dst, 'w', encoding='utf-8') as fout:
+                    while True:
+                        text = fin.read(chunk_size)
+                        if not text:
+                            break
+                        fout.write(text)
+                return encoding
             except UnicodeDecodeError:
                 continue
+        return None
+
+    def preprocess_srt_files(self, source_file=None, translated_file=None):
+        """预处理SRT文件以确保编码正确 - 非UTF-8文件转存为临时UTF-8文件"""
+        # 状态行先缓冲，结束时一次性写入输出框
+        msgs = ["正在检查和处理文件编码..."]
         
-        if translated_content is None:
-            raise Exception(f"无法解码翻译文件，请尝试使用其他编码方式打开")
+        if source_file is None:
+            source_file = self.source_file_var.get()
+        if translated_file is None:
+            translated_file = self.translated_file_var.get()
+        
+        # 使用安全的临时文件名（避免使用原始文件名可能包含的特殊字符）
+        temp_dir = tempfile.gettempdir()
+        unique_id = str(uuid.uuid4())[:8]
         
-        # 将内容保存为UTF-8格式的临时文件
+        self.temp_source_file = None
+        self.temp_translated_file = None
+        
+        # 已是UTF-8的文件直接使用原路径；其他编码才转存为UTF-8临时文件
+        encodings = {}
+        failed = None
         try:
-            with open(self.temp_source_file, 'w', encoding='utf-8') as f:
-                f.write(source_content)
-            
-            with open(self.temp_translated_file, 'w', encoding='utf-8') as f:
-                f.write(translated_content)
-                
-            # 验证文件是否创建成功
-            if not os.path.exists(self.temp_source_file) or not os.path.exists(self.temp_translated_file):
-                raise Exception("临时文件创建失败")
+            for key, label, path, temp_name in (
+                ("source", "源文件", source_file, f"srt_source_{unique_id}.srt"),
+                ("translated", "翻译文件", translated_file, f"srt_translated_{unique_id}.srt"),
+            ):
+                if self._is_utf8_file(path, sniff_size=None):
+                    encodings[key] = "utf-8"
+                    msgs.append(f"{label}已是UTF-8，跳过转码")
+                    continue
+                temp_path = os.path.join(temp_dir, temp_name)
+                setattr(self, f"temp_{key}_file", temp_path)
+                msgs.append(f"临时{label}: {temp_path}")
+                # 上面已整份校验过不是UTF-8，转存时不再重复校验
+                encodings[key] = self._copy_as_utf8_temp(path, temp_path, known_not_utf8=True)
+                if encodings[key] is None:
+                    failed = key
+                    break
+                # 验证文件是否创建成功
+                if not os.path.exists(temp_path):
+                    raise Exception("临时文件创建失败")
                 
         except Exception as e:
-            self.checker_output.insert(tk.END, f"错误：创建临时文件失败 - {str(e)}\n")
+            msgs.append(f"错误：创建临时文件失败 - {str(e)}")
+            self.checker_output.insert(tk.END, "\n".join(msgs) + "\n")
             self.checker_output.see(tk.END)
             raise Exception(f"创建临时文件时出错: {str(e)}")
+
+        if failed is not None:
+            self.checker_output.insert(tk.END, "\n".join(msgs) + "\n")
+            self.checker_output.see(tk.END)
+            if failed == "source":
+                raise Exception(f"无法解码源文件，请尝试使用其他编码方式打开")
+            raise Exception(f"无法解码翻译文件，请尝试使用其他编码方式打开")
         
-        self.checker_output.insert(tk.END, f"源文件编码: {source_encoding}\n")
-        self.checker_output.insert(tk.END, f"翻译文件编码: {translated_encoding}\n")
-        self.checker_output.insert(tk.END, f"已创建临时UTF-8文件用于校验\n")
+        msgs.append(f"源文件编码: {encodings['source']}")
+        msgs.append(f"翻译文件编码: {encodings['translated']}")
+        if self.temp_source_file or self.temp_translated_file:
+            msgs.append("已创建临时UTF-8文件用于校验")
+        self.checker_output.insert(tk.END, "\n".join(msgs) + "\n")
         self.checker_output.see(tk.END)
-        self.root.update()
+        self.root.update_idletasks()
     
     def start_bilingual_conversion(self):
         """开始双语转换"""
-        if not self.validate_bilingual_inputs():
+        if self._report_input_errors(self.validate_bilingual_inputs()):
             return
         
         if self.is_running:
@@ -2644,7 +3391,7 @@ class SRTGuiApp:
     
     def start_checking(self):
         """开始校验"""
-        if not self.validate_checker_inputs():
+        if self._report_input_errors(self.validate_checker_inputs()):
             return
         
         if self.is_running:
@@ -2655,232 +3402,75 @@ class SRTGuiApp:
         self.temp_source_file = None
         self.temp_translated_file = None
         
+        source_file = self.source_file_var.get()
+        translated_file = self.translated_file_var.get()
+        
         # 尝试预处理文件确保编码正确
         try:
-            self.preprocess_srt_files()
+            self.preprocess_srt_files(source_file, translated_file)
         except Exception as e:
             messagebox.showerror("预处理错误", f"处理文件编码时出错: {str(e)}")
             return
         
-        src = self.temp_source_file or self.source_file_var.get()
-        dst = self.temp_translated_file or self.translated_file_var.get()
+        src = self.temp_source_file or source_file
+        dst = self.temp_translated_file or translated_file
         report = self.report_file_var.get().strip()
 
         self.is_running = True
         self.update_ui_state(True, "checking")
         self._start_checker_process(CheckerJobConfig(source_file=src, translated_file=dst, report_file=report))
     
-    def run_command(self, cmd, task_type):
-        """在后台线程中运行命令"""
-        def worker():
-            try:
-                self.is_running = True
-                # 所有UI更新在主线程执行
-                self.root.after(0, lambda: self.update_ui_state(True, task_type))
-                
-                # 设置环境变量以解决控制台输出编码问题
-                env = os.environ.copy()
-                env['PYTHONIOENCODING'] = 'utf-8'
-                
-                # 启动进程
-                self.current_process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    encoding='utf-8',
-                    bufsize=1,
-                    env=env  # 使用修改后的环境变量
-                )
-                
-                # 读取输出
-                if self.current_process.stdout:
-                    for line in iter(self.current_process.stdout.readline, ''):
-                        if line is None:
-                            break
-                        # 立即调度最小UI刷新，避免长时阻塞造成“未响应”感
-                        self.root.after(0, lambda: None)
-                        line = line.strip()
-                        if line:
-                            self.output_queue.put((task_type, line))
-                
-                # 等待进程结束
-                return_code = self.current_process.wait()
-                
-                if return_code == 0:
-                    self.output_queue.put((task_type, f"\n{'='*50}\n[OK] DONE\n{'='*50}"))
-                    self.output_queue.put(("status", "任务完成"))
-                    # 如果是翻译任务完成，自动填充校验器和双语转换器文件路径
-                    if task_type == "translation":
-                        self.output_queue.put(("auto_fill_checker", None))
-                        self.output_queue.put(("auto_fill_bilingual_no_switch", None))
-                else:
-                    self.output_queue.put((task_type, f"\n{'='*50}\n[FAIL] EXIT CODE: {return_code}\n{'='*50}"))
-                    self.output_queue.put(("status", f"任务失败 (退出码: {return_code})"))
-                
-            except Exception as e:
-                self.output_queue.put((task_type, f"\n错误: {str(e)}"))
-                self.output_queue.put(("status", f"错误: {str(e)}"))
-            finally:
-                self.is_running = False
-                self.current_process = None
-                self.output_queue.put(("ui_update", task_type))
-                
-                # 清理临时文件
-                self.clean_temp_files()
-        
-        # 启动工作线程
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-    
-    def run_bilingual_command(self, cmd):
-        """在后台线程中运行双语转换命令"""
-        def worker():
-            try:
-                self.is_running = True
-                # 所有UI更新在主线程执行
-                self.root.after(0, lambda: self.update_bilingual_ui_state(True))
-                
-                # 设置环境变量以解决控制台输出编码问题
-                env = os.environ.copy()
-                env['PYTHONIOENCODING'] = 'utf-8'
-                env['PYTHONUNBUFFERED'] = '1'  # 强制子进程无缓冲输出
-                
-                # 启动进程
-                # 在命令中插入 -u 以确保Python子进程无缓冲
-                launch_cmd = list(cmd)
-                try:
-                    if launch_cmd and launch_cmd[0] == sys.executable and (len(launch_cmd) == 1 or launch_cmd[1] != '-u'):
-                        launch_cmd.insert(1, '-u')
-                except Exception:
-                    pass
-
-                self.current_process = subprocess.Popen(
-                    launch_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    encoding='utf-8',
-                    bufsize=1,
-                    env=env  # 使用修改后的环境变量
-                )
-                
-                # 读取输出
-                if self.current_process.stdout:
-                    for line in iter(self.current_process.stdout.readline, ''):
-                        if line is None:
-                            break
-                        self.root.after(0, lambda: None)
-                        # 将双语转换的输出发送到双语输出区域
-                        s = line.strip()
-                        if s:
-                            self.output_queue.put(("bilingual", s))
-                
-                # 等待进程结束
-                return_code = self.current_process.wait()
-                
-                if return_code == 0:
-                    self.output_queue.put(("bilingual", f"\n{'='*50}\n✅ 双语转换完成！\n{'='*50}"))
-                    self.output_queue.put(("status", "双语转换完成"))
-                    # 显示输出文件路径
-                    self.output_queue.put(("bilingual", f"双语字幕文件已生成: {self.bilingual_output_var.get()}"))
-                else:
-                    self.output_queue.put(("bilingual", f"\n{'='*50}\n❌ 转换失败 (退出码: {return_code})\n{'='*50}"))
-                    self.output_queue.put(("status", f"转换失败 (退出码: {return_code})"))
-                
-            except Exception as e:
-                self.output_queue.put(("bilingual", f"\n错误: {str(e)}"))
-                self.output_queue.put(("status", f"错误: {str(e)}"))
-            finally:
-                self.is_running = False
-                self.current_process = None
-                self.output_queue.put(("bilingual_ui_update", None))
-        
-        # 启动工作线程
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-    
     def run_bilingual_conversion_threaded(self):
-        """使用多线程直接调用转换函数"""
-        def worker():
-            try:
-                self.is_running = True
-                self.bilingual_stop_event = threading.Event()
-                
-                # 更新UI状态
-                self.root.after(0, lambda: self.update_bilingual_ui_state(True))
-                
-                # 获取文件路径
-                original_file = self.bilingual_original_var.get()
-                translated_file = self.bilingual_translated_var.get()
-                output_file = self.bilingual_output_var.get()
-                
-                # 获取CPU核心数，默认使用所有核心
-                max_workers = os.cpu_count()
-                
-                # 定义进度回调函数
-                def progress_callback(progress, message):
-                    # 格式化进度信息
-                    progress_text = f"[INFO] 进度: {progress:.1%} - {message}"
-                    self.output_queue.put(("bilingual", progress_text))
-                    
-                    # 更新状态栏
-                    status_text = f"双语转换中... {progress:.1%}"
-                    self.output_queue.put(("status", status_text))
-                    
-                    # 强制UI立即更新 - 缩短检查间隔以获得更流畅的进度显示
-                    self.root.after_idle(lambda: None)
-                    self.root.update_idletasks()
-                
-                # 初始化信息
-                self.output_queue.put(("bilingual", f"[INFO] 开始双语字幕转换"))
-                self.output_queue.put(("bilingual", f"[INFO] 原文件: {original_file}"))
-                self.output_queue.put(("bilingual", f"[INFO] 译文件: {translated_file}"))
-                self.output_queue.put(("bilingual", f"[INFO] 输出文件: {output_file}"))
-                self.output_queue.put(("bilingual", f"[INFO] 使用 {max_workers} 个线程并行处理"))
-                self.output_queue.put(("status", "双语转换中..."))
-                
-                # 调用转换函数
-                success = convert_to_bilingual(
-                    original_file=original_file,
-                    translated_file=translated_file, 
-                    output_file=output_file,
-                    max_workers=max_workers,
-                    progress_callback=progress_callback,
-                    stop_event=self.bilingual_stop_event
-                )
-                
-                if success:
-                    self.output_queue.put(("bilingual", f"\n{'='*50}\n✅ 双语转换完成！\n{'='*50}"))
-                    self.output_queue.put(("status", "双语转换完成"))
-                    self.output_queue.put(("bilingual", f"[OK] 双语字幕文件已生成: {output_file}"))
-                else:
-                    if self.bilingual_stop_event.is_set():
-                        self.output_queue.put(("bilingual", f"\n{'='*50}\n⏹️ 转换已被用户停止\n{'='*50}"))
-                        self.output_queue.put(("status", "转换已停止"))
-                    else:
-                        self.output_queue.put(("bilingual", f"\n{'='*50}\n❌ 转换失败\n{'='*50}"))
-                        self.output_queue.put(("status", "转换失败"))
-                
-            except Exception as e:
-                self.output_queue.put(("bilingual", f"\n[ERROR] 转换过程中发生错误: {str(e)}"))
-                self.output_queue.put(("status", f"错误: {str(e)}"))
-            finally:
-                self.is_running = False
-                self.bilingual_stop_event = None
-                self.output_queue.put(("bilingual_ui_update", None))
-        
-        # 启动工作线程
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-    
+        """在独立子进程中执行双语转换，避免与界面线程争用GIL"""
+        self.is_running = True
+        self.bilingual_stop_event = self._mp_ctx.Event()
+        self.update_bilingual_ui_state(True)
+
+        # 获取文件路径
+        original_file = self.bilingual_original_var.get()
+        translated_file = self.bilingual_translated_var.get()
+        output_file = self.bilingual_output_var.get()
+
+        # 获取CPU核心数，默认使用所有核心
+        max_workers = os.cpu_count()
+
+        # 初始化信息
+        self.output_queue.put(("bilingual", f"[INFO] 开始双语字幕转换"))
+        self.output_queue.put(("bilingual", f"[INFO] 原文件: {original_file}"))
+        self.output_queue.put(("bilingual", f"[INFO] 译文件: {translated_file}"))
+        self.output_queue.put(("bilingual", f"[INFO] 输出文件: {output_file}"))
+        self.output_queue.put(("bilingual", f"[INFO] 使用 {max_workers} 个线程并行处理"))
+        self.output_queue.put(("status", "双语转换中..."))
+
+        job = BilingualJobConfig(
+            original_file=original_file,
+            translated_file=translated_file,
+            output_file=output_file,
+            max_workers=max_workers,
+        )
+
+        def on_error(err):
+            self.output_queue.put(("bilingual_error", err))
+
+        self._spawn_worker_process(
+            "bilingual_process", run_bilingual_job, job, on_error,
+            extra_args=(self.bilingual_stop_event,),
+        )
+
+    def _finish_bilingual_conversion(self):
+        """双语转换结束（完成/停止/出错）后的收尾"""
+        self.is_running = False
+        self.bilingual_stop_event = None
+        self.bilingual_process = None
+        self.update_bilingual_ui_state(False)
+
     def clean_temp_files(self):
         """清理临时文件"""
         try:
-            if hasattr(self, 'temp_source_file') and self.temp_source_file and os.path.exists(self.temp_source_file):
+            if hasattr(self, 'temp_source_file') and self.temp_source_file and os.path.isfile(self.temp_source_file):
                 os.remove(self.temp_source_file)
             
-            if hasattr(self, 'temp_translated_file') and self.temp_translated_file and os.path.exists(self.temp_translated_file):
+            if hasattr(self, 'temp_translated_file') and self.temp_translated_file and os.path.isfile(self.temp_translated_file):
                 os.remove(self.temp_translated_file)
         except Exception as e:
             safe_file_log(f"clean_temp_files error: {e}")
@@ -2925,6 +3515,7 @@ class SRTGuiApp:
 
         # Worker processes: translation/checking
         for attr, label in [("translation_process", "翻译"), ("checking_process", "校验")]:
+            self._cancel_pending_spawn(attr)
             try:
                 p = getattr(self, attr, None)
                 if p is not None and p.is_alive():
@@ -2948,86 +3539,206 @@ class SRTGuiApp:
         except Exception:
             pass
 
-    def _start_corrector_process(self, job: CorrectorJobConfig):
+    def _spawn_worker_process(self, attr, target, job, on_error, extra_args=()):
+        """在短生命周期线程中启动工作进程，避免spawn启动解释器时阻塞界面。
+        结果经 output_queue 以 proc_ready / proc_err 消息回到主线程。"""
+        token = object()
+        self._spawn_tokens[attr] = token
+        gen = self._worker_gen.get(attr, 0) + 1
+        self._worker_gen[attr] = gen
+        old = getattr(self, attr, None)
+        setattr(self, attr, None)
+        self._spawn_error_handlers[attr] = on_error
+        # 旧进程在独立线程中回收，不等待其退出即可启动新进程
+        if old is not None:
+            threading.Thread(target=self._reap_process, args=(old,), daemon=True).start()
+
+        def _spawn():
+            parent_conn, child_conn = self._mp_ctx.Pipe(duplex=False)
+            try:
+                proc = self._mp_ctx.Process(target=target, args=(job, PipeQueue(child_conn), *extra_args))
+                proc.daemon = True
+                proc.start()
+            except Exception as e:
+                parent_conn.close()
+                child_conn.close()
+                self.output_queue.put(("proc_err", (attr, str(e), token)))
+                return
+            # 父进程不再持有写端，子进程退出后读端才能收到EOF
+            child_conn.close()
+            self._register_worker_conn(parent_conn, attr, gen)
+            self.output_queue.put(("proc_ready", (attr, proc, token)))
+
+        threading.Thread(target=_spawn, daemon=True).start()
+
+    @staticmethod
+    def _reap_process(proc):
+        """（后台线程）终止并回收被取代的工作进程，必要时强制结束"""
         try:
-            if self.corrector_process is not None and self.corrector_process.is_alive():
-                self.corrector_process.terminate()
-                self.corrector_process.join(timeout=1)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=2)
+                if proc.is_alive():
+                    proc.kill()
+                    proc.join(timeout=1)
         except Exception:
             pass
 
-        try:
-            proc = self._mp_ctx.Process(target=run_corrector_job, args=(job, self.worker_queue))
-            proc.daemon = True
-            proc.start()
-            self.corrector_process = proc
-        except Exception as e:
-            self._add_corrector_output(f"\n[ERROR] 启动纠错进程失败: {str(e)}\n")
+    def _register_worker_conn(self, conn, attr, gen):
+        """登记工作进程管道的读端，并唤醒读取线程重新等待"""
+        with self._worker_conn_lock:
+            self._worker_conns[conn] = (attr, gen)
+            self._worker_wakeup_w.send(None)
+
+    def _worker_pipe_reader(self):
+        """后台线程：阻塞等待任一工作进程管道可读，收到的消息转入 output_queue（Tk只在主线程调用）"""
+        wakeup = self._worker_wakeup_r
+        while True:
+            with self._worker_conn_lock:
+                conns = list(self._worker_conns)
+            for conn in mp_wait(conns + [wakeup]):
+                if conn is wakeup:
+                    try:
+                        wakeup.recv()
+                    except (EOFError, OSError):
+                        return
+                    continue
+                try:
+                    msg = conn.recv()
+                except (EOFError, OSError):
+                    # 子进程已退出：注销并关闭读端
+                    with self._worker_conn_lock:
+                        self._worker_conns.pop(conn, None)
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                    continue
+                attr, gen = self._worker_conns.get(conn, (None, None))
+                if attr is not None and self._worker_gen.get(attr) != gen:
+                    # 已被新启动的同类任务取代
+                    continue
+                self.output_queue.put(msg)
+
+    def _cancel_pending_spawn(self, attr):
+        """任务在进程启动完成前被停止：作废启动令牌，进程就绪后立即终止"""
+        self._spawn_tokens.pop(attr, None)
+
+    def _on_proc_ready(self, attr, proc, token):
+        if self._spawn_tokens.get(attr) is not token:
+            # 启动期间已被停止或被更新的启动取代
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+            return
+        self._spawn_tokens.pop(attr, None)
+        setattr(self, attr, proc)
+
+    def _on_proc_err(self, attr, err, token):
+        if self._spawn_tokens.get(attr) is not token:
+            return
+        self._spawn_tokens.pop(attr, None)
+        handler = self._spawn_error_handlers.get(attr)
+        if handler is not None:
+            handler(err)
+        messagebox.showerror("错误", f"启动后台进程失败: {err}")
+
+    def _start_corrector_process(self, job: CorrectorJobConfig):
+        def on_error(err):
+            self._add_corrector_output(f"\n[ERROR] 启动纠错进程失败: {err}\n")
             self.status_var.set("纠错启动失败")
             self._restore_corrector_buttons()
-            raise
 
-    def _start_polisher_process(self, job: PolisherJobConfig):
-        try:
-            if self.polisher_process is not None and self.polisher_process.is_alive():
-                self.polisher_process.terminate()
-                self.polisher_process.join(timeout=1)
-        except Exception:
-            pass
+        self._spawn_worker_process("corrector_process", run_corrector_job, job, on_error)
 
-        try:
-            proc = self._mp_ctx.Process(target=run_polisher_job, args=(job, self.worker_queue))
-            proc.daemon = True
-            proc.start()
-            self.polisher_process = proc
-        except Exception as e:
-            self._add_polisher_output(f"\n[ERROR] 启动润色进程失败: {str(e)}\n")
+    def _start_polisher_process(self, job: PolisherJobConfig):
+        def on_error(err):
+            self._add_polisher_output(f"\n[ERROR] 启动润色进程失败: {err}\n")
             self.status_var.set("润色启动失败")
             self._restore_polisher_ui()
-            raise
 
-    def _start_translation_process(self, job: TranslationJobConfig):
-        try:
-            if self.translation_process is not None and self.translation_process.is_alive():
-                self.translation_process.terminate()
-                self.translation_process.join(timeout=1)
-        except Exception:
-            pass
+        self._spawn_worker_process("polisher_process", run_polisher_job, job, on_error)
 
-        try:
-            proc = self._mp_ctx.Process(target=run_translation_job, args=(job, self.worker_queue))
-            proc.daemon = True
-            proc.start()
-            self.translation_process = proc
-        except Exception as e:
-            self.translator_output.insert(tk.END, f"\n[ERROR] 启动翻译进程失败: {str(e)}\n")
+    def _start_translation_process(self, job: TranslationJobConfig):
+        def on_error(err):
+            self.translator_output.insert(tk.END, f"\n[ERROR] 启动翻译进程失败: {err}\n")
             self.translator_output.see(tk.END)
             self.status_var.set("翻译启动失败")
             self.update_ui_state(False, "translation")
-            raise
 
-    def _start_checker_process(self, job: CheckerJobConfig):
-        try:
-            if self.checking_process is not None and self.checking_process.is_alive():
-                self.checking_process.terminate()
-                self.checking_process.join(timeout=1)
-        except Exception:
-            pass
+        self._spawn_worker_process("translation_process", run_translation_job, job, on_error)
 
-        try:
-            proc = self._mp_ctx.Process(target=run_checker_job, args=(job, self.worker_queue))
-            proc.daemon = True
-            proc.start()
-            self.checking_process = proc
-        except Exception as e:
-            self.checker_output.insert(tk.END, f"\n[ERROR] 启动校验进程失败: {str(e)}\n")
+    def _start_checker_process(self, job: CheckerJobConfig):
+        def on_error(err):
+            self.checker_output.insert(tk.END, f"\n[ERROR] 启动校验进程失败: {err}\n")
             self.checker_output.see(tk.END)
             self.status_var.set("校验启动失败")
             self.update_ui_state(False, "checking")
-            raise
+
+        self._spawn_worker_process("checking_process", run_checker_job, job, on_error)
     
+    def _set_pb(self, mode=None, maximum=None):
+        """设置进度条模式/最大值，仅在与当前值不同时写入Tk"""
+        opts = {}
+        if mode is not None and mode != self._pb_mode:
+            opts['mode'] = self._pb_mode = mode
+        if maximum is not None and maximum != self._pb_max:
+            opts['maximum'] = self._pb_max = maximum
+        if opts:
+            self.progress_bar.configure(**opts)
+
+    def _set_progress(self, value):
+        """设置进度值，与上次相同则跳过"""
+        if value != self._pv_last:
+            self._pv_last = value
+            self.progress_var.set(value)
+
+    def _post_progress(self, mode=None, maximum=None, value=None, status=None):
+        """记录最新的进度状态，33ms 内的多次更新合并为一次写入"""
+        st = self._progress_state
+        if mode is not None:
+            st['mode'] = mode
+        if maximum is not None:
+            st['maximum'] = maximum
+        if value is not None:
+            st['value'] = value
+        if status is not None:
+            st['status'] = status
+        if not self._progress_dirty:
+            self._progress_dirty = True
+            self.root.after(33, self._flush_progress)
+
+    def _flush_progress(self):
+        """把记录的进度状态写入进度条与状态栏"""
+        if not self._progress_dirty:
+            return
+        self._progress_dirty = False
+        st = self._progress_state
+        self._progress_state = {}
+        if 'mode' in st or 'maximum' in st:
+            self._set_pb(mode=st.get('mode'), maximum=st.get('maximum'))
+        if 'value' in st:
+            self._set_progress(st['value'])
+        if 'status' in st:
+            self.status_var.set(st['status'])
+
+    def _discard_pending_progress(self):
+        """任务状态切换时丢弃尚未写入的进度，避免旧进度覆盖新状态"""
+        self._progress_dirty = False
+        self._progress_state = {}
+
+    def _current_progress(self):
+        """当前进度值（含尚未写入的部分）"""
+        value = self._progress_state.get('value', self._pv_last)
+        return value if value is not None else self.progress_var.get()
+
     def update_ui_state(self, running, task_type):
         """更新界面状态"""
+        self._discard_pending_progress()
+        if not running and self._ui_state.get(task_type) is False:
+            return
+        self._ui_state[task_type] = bool(running)
         if task_type == "translation":
             if running:
                 self.translate_button.configure(state=tk.DISABLED, style='Running.TButton')
@@ -3039,8 +3750,8 @@ class SRTGuiApp:
                     self.progress_bar.stop()
                 except Exception:
                     pass
-                self.progress_bar.configure(mode='determinate', maximum=100)
-                self.progress_var.set(0)
+                self._set_pb(mode='determinate', maximum=100)
+                self._set_progress(0)
                 self.status_var.set("正在翻译... 批次 0/?")
             else:
                 self.translate_button.configure(state=tk.NORMAL, style='TButton')
@@ -3049,24 +3760,30 @@ class SRTGuiApp:
                     self.progress_bar.stop()
                 except Exception:
                     pass
-                self.progress_bar.configure(mode='determinate', maximum=100)
-                self.progress_var.set(0)
+                self._set_pb(mode='determinate', maximum=100)
+                self._set_progress(0)
         elif task_type == "checking":
             if running:
                 self.check_button.configure(state=tk.DISABLED, style='Running.TButton')
                 self.stop_check_button.configure(state=tk.NORMAL)
                 self.status_var.set("正在校验...")
-                self.progress_bar.configure(mode='indeterminate')
+                self._set_pb(mode='indeterminate')
                 self.progress_bar.start()
+                # 不确定模式的动画会改动进度值，缓存失效
+                self._pv_last = None
             else:
                 self.check_button.configure(state=tk.NORMAL, style='TButton')
                 self.stop_check_button.configure(state=tk.DISABLED)
                 self.progress_bar.stop()
-                self.progress_bar.configure(mode='determinate', maximum=100)
-                self.progress_var.set(0)
+                self._set_pb(mode='determinate', maximum=100)
+                self._set_progress(0)
     
     def update_bilingual_ui_state(self, running):
         """更新双语转换器界面状态"""
+        self._discard_pending_progress()
+        if not running and self._ui_state.get("bilingual") is False:
+            return
+        self._ui_state["bilingual"] = bool(running)
         if running:
             self.bilingual_convert_button.configure(state=tk.DISABLED, style='Running.TButton')
             self.bilingual_stop_button.configure(state=tk.NORMAL)
@@ -3077,8 +3794,8 @@ class SRTGuiApp:
                 self.progress_bar.stop()
             except Exception:
                 pass
-            self.progress_bar.configure(mode='determinate', maximum=100)
-            self.progress_var.set(0)
+            self._set_pb(mode='determinate', maximum=100)
+            self._set_progress(0)
             self.status_var.set("正在转换双语字幕... 0%")
         else:
             self.bilingual_convert_button.configure(state=tk.NORMAL, style='TButton')
@@ -3087,264 +3804,368 @@ class SRTGuiApp:
                 self.progress_bar.stop()
             except Exception:
                 pass
-            self.progress_bar.configure(mode='determinate', maximum=100)
-            self.progress_var.set(0)
+            self._set_pb(mode='determinate', maximum=100)
+            self._set_progress(0)
     
+    # 纯文本输出消息：类型 -> (输出框属性, 进度解析方法)；同一轮内按输出框合并写入
+    _TEXT_CHANNELS = {
+        "translation": ("translator_output", None),
+        "checking": ("checker_output", None),
+        "bilingual": ("bilingual_output", "_maybe_update_bilingual_progress"),
+        "corrector": ("corrector_output_text", None),
+        "polisher": ("polisher_output", "_maybe_update_polisher_progress"),
+    }
+
+    # 只更新进度的消息：不影响输出框顺序，分发前无需写出缓冲
+    _PROGRESS_ONLY_TYPES = frozenset({"translation_progress"})
+
+    # 每次最多处理的消息数，余下的留到下一轮，避免长时间占用Tk而不刷新界面
+    _POLL_MAX_ITEMS = 200
+
     def check_output_queue(self):
-        """检查输出队列并更新界面"""
+        """检查输出队列并更新界面；有消息时 after_idle 继续处理，空闲时逐步退避到500ms"""
+        items = []
+        limit = self._POLL_MAX_ITEMS
         try:
-            while True:
-                item = self.output_queue.get_nowait()
-                self._dispatch_message(item)
+            while len(items) < limit:
+                items.append(self.output_queue.get_nowait())
         except queue.Empty:
             pass
 
-        try:
-            while True:
-                item = self.worker_queue.get_nowait()
-                self._dispatch_message(item)
-        except Exception:
-            pass
+        if items:
+            try:
+                self._flush_batch(items)
+            finally:
+                self._poll_delay = 20
+                self.root.after_idle(self.check_output_queue)
+            return
 
-        check_interval = 50 if self.is_running else 100
-        self.root.after(check_interval, self.check_output_queue)
+        self._poll_delay = min(500, int(self._poll_delay * 1.5))
+        self.root.after(self._poll_delay, self.check_output_queue)
+
+    def _flush_batch(self, items):
+        """按顺序分发本轮消息；文本行按输出框缓冲，整轮只写入一次。
+        其他消息（仅更新状态栏的除外）分发前先写出缓冲，保证输出顺序不变"""
+        channels = self._TEXT_CHANNELS
+        pending = {}
+
+        def flush():
+            for widget_name, texts in pending.items():
+                getattr(self, widget_name).insert_lines(texts)
+            pending.clear()
+
+        for item in items:
+            msg_type = item[0] if isinstance(item, tuple) and item else None
+            channel = channels.get(msg_type)
+            if channel is None:
+                if msg_type not in self._PROGRESS_ONLY_TYPES:
+                    if pending and msg_type != "status":
+                        flush()
+                    # 先写出已解析的进度，保证其后的状态消息不会被旧进度覆盖
+                    self._flush_progress()
+                self._dispatch_message(item)
+                continue
+            text = item[1] if len(item) > 1 else ""
+            widget_name, progress_name = channel
+            if progress_name:
+                getattr(self, progress_name)(text)
+            pending.setdefault(widget_name, []).append(text if text.endswith("\n") else text + "\n")
+        flush()
 
     def _dispatch_message(self, item):
         if not isinstance(item, tuple) or not item:
             return
-        msg_type = item[0]
+        handler = self._message_handlers.get(item[0])
+        if handler is not None:
+            handler(item)
+
+    def _build_message_handlers(self):
+        """消息类型 -> 处理方法（纯文本消息由 _flush_batch 直接写入输出框）"""
+        return {
+            "proc_ready": self._msg_proc_ready,
+            "proc_err": self._msg_proc_err,
+            "io_result": self._msg_io_result,
+            "translation_progress": self._msg_translation_progress,
+            "translation_error": self._msg_translation_error,
+            "translation_done": self._msg_translation_done,
+            "checking_done": self._msg_checking_done,
+            "bilingual_progress": self._msg_bilingual_progress,
+            "status": self._msg_status,
+            "ui_update": self._msg_ui_update,
+            "bilingual_ui_update": self._msg_bilingual_ui_update,
+            "bilingual_done": self._msg_bilingual_done,
+            "bilingual_error": self._msg_bilingual_error,
+            "auto_fill_checker": self._msg_auto_fill_checker,
+            "auto_fill_bilingual": self._msg_auto_fill_bilingual,
+            "auto_fill_bilingual_no_switch": self._msg_auto_fill_bilingual_no_switch,
+            "auto_fill_review": self._msg_auto_fill_review,
+            "corrector_progress": self._msg_corrector_progress,
+            "corrector_done": self._msg_corrector_done,
+            "corrector_error": self._msg_corrector_error,
+            "polisher_done": self._msg_polisher_done,
+            "polisher_error": self._msg_polisher_error,
+            "api_test_result": self._msg_api_test_result,
+            "api_test_done": self._msg_api_test_done,
+        }
 
-        if msg_type == "translation":
-            content = item[1] if len(item) > 1 else ""
-            self._maybe_update_translation_progress(content)
-            self.translator_output.insert(tk.END, content + "\n")
-            self.translator_output.see(tk.END)
-            return
-        if msg_type == "translation_error":
-            err = item[1] if len(item) > 1 else "Unknown error"
-            self.translator_output.insert(tk.END, f"\n[ERROR] {err}\n")
-            self.translator_output.see(tk.END)
-            return
-        if msg_type == "translation_done":
-            ok = bool(item[1]) if len(item) > 1 else False
-            self.translation_process = None
-            self.is_running = False
-            banner = "\n" + ("=" * 50) + "\n"
-            if ok:
-                self.translator_output.insert(tk.END, f"{banner}[OK] DONE{banner}")
-                self.status_var.set("任务完成")
-                try:
-                    self.auto_fill_checker_files()
-                    self.auto_fill_bilingual_files_no_switch()
-                except Exception:
-                    pass
-            else:
-                self.translator_output.insert(tk.END, f"{banner}[FAIL] STOPPED/FAILED{banner}")
-                self.status_var.set("任务失败/中止")
-            self.translator_output.see(tk.END)
-            try:
-                self.update_ui_state(False, "translation")
-            except Exception:
-                pass
-            return
-        if msg_type == "checking":
-            content = item[1] if len(item) > 1 else ""
-            self.checker_output.insert(tk.END, content + "\n")
-            self.checker_output.see(tk.END)
-            return
-        if msg_type == "checking_done":
-            ok = bool(item[1]) if len(item) > 1 else False
-            self.checking_process = None
-            self.is_running = False
-            banner = "\n" + ("=" * 50) + "\n"
-            if ok:
-                self.checker_output.insert(tk.END, f"{banner}[OK] DONE{banner}")
-                self.status_var.set("校验通过")
-            else:
-                self.checker_output.insert(tk.END, f"{banner}[WARN] MISMATCH/STOPPED{banner}")
-                self.status_var.set("校验不通过/中止")
-            self.checker_output.see(tk.END)
+    def _msg_proc_ready(self, item):
+        self._on_proc_ready(*item[1])
+
+    def _msg_proc_err(self, item):
+        self._on_proc_err(*item[1])
+
+    def _msg_io_result(self, item):
+        on_done, result = item[1]
+        on_done(result)
+
+    def _msg_api_test_result(self, item):
+        self._show_api_test_result(*item[1])
+
+    def _msg_api_test_done(self, item):
+        self.test_api_btn.config(state="normal", text="测试API连接")
+
+    def _msg_translation_progress(self, item):
+        """翻译子进程已解析好的批次进度 (总批次或None, 已完成批次)"""
+        total = item[1] if len(item) > 1 else None
+        completed = item[2] if len(item) > 2 else 0
+        self.total_batches = total
+        self.completed_batches = completed
+        if total:
+            self._post_progress(maximum=max(1, total), value=completed,
+                                status=f"正在翻译... 批次 {completed}/{total}")
+        else:
+            # 未知总数时，用百分比无法准确，显示已完成计数
+            self._post_progress(status=f"正在翻译... 已完成批次 {completed}")
+
+    def _msg_translation_error(self, item):
+        err = item[1] if len(item) > 1 else "Unknown error"
+        self.translator_output.insert(tk.END, f"\n[ERROR] {err}\n")
+        self.translator_output.see(tk.END)
+
+    def _msg_translation_done(self, item):
+        ok = bool(item[1]) if len(item) > 1 else False
+        self.translation_process = None
+        self.is_running = False
+        if ok:
+            self.translator_output.insert(tk.END, f"{_BANNER}[OK] DONE{_BANNER}")
+            self.status_var.set("任务完成")
             try:
-                self.update_ui_state(False, "checking")
+                self.auto_fill_checker_files()
+                self.auto_fill_bilingual_files_no_switch()
             except Exception:
                 pass
+        else:
+            self.translator_output.insert(tk.END, f"{_BANNER}[FAIL] STOPPED/FAILED{_BANNER}")
+            self.status_var.set("任务失败/中止")
+        self.translator_output.see(tk.END)
+        try:
+            self.update_ui_state(False, "translation")
+        except Exception:
+            pass
+
+    def _msg_checking_done(self, item):
+        ok = bool(item[1]) if len(item) > 1 else False
+        self.checking_process = None
+        self.is_running = False
+        if ok:
+            self.checker_output.insert(tk.END, f"{_BANNER}[OK] DONE{_BANNER}")
+            self.status_var.set("校验通过")
+        else:
+            self.checker_output.insert(tk.END, f"{_BANNER}[WARN] MISMATCH/STOPPED{_BANNER}")
+            self.status_var.set("校验不通过/中止")
+        self.checker_output.see(tk.END)
+        try:
+            self.update_ui_state(False, "checking")
+        except Exception:
+            pass
+        try:
+            self.clean_temp_files()
+        except Exception:
+            pass
+
+    def _msg_bilingual_progress(self, item):
+        progress, message = item[1]
+        content = f"[INFO] 进度: {progress:.1%} - {message}"
+        self._maybe_update_bilingual_progress(content)
+        self.bilingual_output.insert(tk.END, content + "\n")
+        self.bilingual_output.see(tk.END)
+        self.status_var.set(f"双语转换中... {progress:.1%}")
+
+    def _msg_status(self, item):
+        self.status_var.set(item[1] if len(item) > 1 else "")
+
+    def _msg_ui_update(self, item):
+        self.update_ui_state(False, item[1] if len(item) > 1 else "")
+
+    def _msg_bilingual_ui_update(self, item):
+        self.update_bilingual_ui_state(False)
+
+    def _msg_bilingual_done(self, item):
+        ok = bool(item[1]) if len(item) > 1 else False
+        output_file = item[2] if len(item) > 2 else ""
+        stopped = bool(item[3]) if len(item) > 3 else False
+        if ok:
+            text = f"\n{_RULE}\n✅ 双语转换完成！\n{_RULE}\n[OK] 双语字幕文件已生成: {output_file}\n"
+            self.status_var.set("双语转换完成")
+        elif stopped:
+            text = f"\n{_RULE}\n⏹️ 转换已被用户停止\n{_RULE}\n"
+            self.status_var.set("转换已停止")
+        else:
+            text = f"\n{_RULE}\n❌ 转换失败\n{_RULE}\n"
+            self.status_var.set("转换失败")
+        self.bilingual_output.insert(tk.END, text)
+        self.bilingual_output.see(tk.END)
+        self._finish_bilingual_conversion()
+
+    def _msg_bilingual_error(self, item):
+        err = item[1] if len(item) > 1 else ""
+        self.bilingual_output.insert(tk.END, f"\n[ERROR] 转换过程中发生错误: {err}\n")
+        self.bilingual_output.see(tk.END)
+        self.status_var.set(f"错误: {err}")
+        self._finish_bilingual_conversion()
+
+    def _msg_auto_fill_checker(self, item):
+        self.auto_fill_checker_files()
+
+    def _msg_auto_fill_bilingual(self, item):
+        self.auto_fill_bilingual_files()
+
+    def _msg_auto_fill_bilingual_no_switch(self, item):
+        self.auto_fill_bilingual_files_no_switch()
+
+    def _msg_auto_fill_review(self, item):
+        content = item[1] if len(item) > 1 else None
+        if isinstance(content, (list, tuple)) and len(content) == 2:
+            input_file, output_file = content
+            self.auto_fill_review_files(input_file, output_file)
+
+    def _msg_corrector_progress(self, item):
+        progress = item[1] if len(item) > 1 else 0.0
+        message = item[2] if len(item) > 2 else ""
+        try:
+            pct = float(progress) * 100.0
+        except Exception:
+            pct = 0.0
+        pct = max(0.0, min(100.0, pct))
+        try:
+            self.progress_bar.stop()
+        except Exception:
+            pass
+        self._set_pb(mode='determinate', maximum=100)
+        self._set_progress(pct)
+        self.status_var.set(f"纠错进度: {pct:.1f}%")
+        if message:
+            self.corrector_output_text.insert_colored(f"进度: {pct:.1f}% - {message}\n")
+
+    def _msg_corrector_done(self, item):
+        ok = bool(item[1]) if len(item) > 1 else False
+        input_file = item[2] if len(item) > 2 else ""
+        output_file = item[3] if len(item) > 3 else ""
+        self.corrector_process = None
+        if ok:
+            self._set_pb(mode='determinate', maximum=100)
+            self._set_progress(100)
+            self.status_var.set("纠错完成")
             try:
-                self.clean_temp_files()
+                self.output_queue.put(("auto_fill_review", (input_file, output_file)))
             except Exception:
                 pass
-            return
-        if msg_type == "bilingual":
-            content = item[1] if len(item) > 1 else ""
-            self._maybe_update_bilingual_progress(content)
-            self.bilingual_output.insert(tk.END, content + "\n")
-            self.bilingual_output.see(tk.END)
-            return
-        if msg_type == "status":
-            self.status_var.set(item[1] if len(item) > 1 else "")
-            return
-        if msg_type == "ui_update":
-            self.update_ui_state(False, item[1] if len(item) > 1 else "")
-            return
-        if msg_type == "bilingual_ui_update":
-            self.update_bilingual_ui_state(False)
-            return
-        if msg_type == "auto_fill_checker":
-            self.auto_fill_checker_files()
-            return
-        if msg_type == "auto_fill_bilingual":
-            self.auto_fill_bilingual_files()
-            return
-        if msg_type == "auto_fill_bilingual_no_switch":
-            self.auto_fill_bilingual_files_no_switch()
-            return
-        if msg_type == "auto_fill_review":
-            content = item[1] if len(item) > 1 else None
-            if isinstance(content, (list, tuple)) and len(content) == 2:
-                input_file, output_file = content
-                self.auto_fill_review_files(input_file, output_file)
-            return
+        else:
+            self.status_var.set("纠错失败/中止")
+            self._set_progress(0)
+        self._restore_corrector_buttons()
 
-        if msg_type == "corrector":
-            text = item[1] if len(item) > 1 else ""
-            if text and not text.endswith("\n"):
-                text += "\n"
-            self.corrector_output_text.insert_colored(text)
-            return
-        if msg_type == "corrector_progress":
-            progress = item[1] if len(item) > 1 else 0.0
-            message = item[2] if len(item) > 2 else ""
+    def _msg_corrector_error(self, item):
+        err = item[1] if len(item) > 1 else "未知错误"
+        self.corrector_process = None
+        self.corrector_output_text.insert_colored(f"\n[ERROR] 纠错进程异常: {err}\n")
+        self.status_var.set("纠错异常")
+        self._set_progress(0)
+        self._restore_corrector_buttons()
+
+    def _msg_polisher_done(self, item):
+        ok = bool(item[1]) if len(item) > 1 else False
+        input_file = item[2] if len(item) > 2 else ""
+        output_file = item[3] if len(item) > 3 else ""
+        summary = item[4] if len(item) > 4 else None
+        self.polisher_process = None
+        if ok:
+            # 记录最后一次润色输出，供“双语转换器 -> 从润色加载”使用
             try:
-                pct = float(progress) * 100.0
-            except Exception:
-                pct = 0.0
-            pct = max(0.0, min(100.0, pct))
-            try:
-                self.progress_bar.stop()
+                self.last_polished_file = output_file
             except Exception:
                 pass
-            self.progress_bar.configure(mode='determinate', maximum=100)
-            self.progress_var.set(pct)
-            self.status_var.set(f"纠错进度: {pct:.1f}%")
-            if message:
-                self.corrector_output_text.insert_colored(f"进度: {pct:.1f}% - {message}\n")
-            return
-        if msg_type == "corrector_done":
-            ok = bool(item[1]) if len(item) > 1 else False
-            input_file = item[2] if len(item) > 2 else ""
-            output_file = item[3] if len(item) > 3 else ""
-            self.corrector_process = None
-            if ok:
-                self.progress_bar.configure(mode='determinate', maximum=100)
-                self.progress_var.set(100)
-                self.status_var.set("纠错完成")
-                try:
-                    self.output_queue.put(("auto_fill_review", (input_file, output_file)))
-                except Exception:
-                    pass
-            else:
-                self.status_var.set("纠错失败/中止")
-                self.progress_var.set(0)
-            self._restore_corrector_buttons()
-            return
-        if msg_type == "corrector_error":
-            err = item[1] if len(item) > 1 else "未知错误"
-            self.corrector_process = None
-            self.corrector_output_text.insert_colored(f"\n[ERROR] 纠错进程异常: {err}\n")
-            self.status_var.set("纠错异常")
-            self.progress_var.set(0)
-            self._restore_corrector_buttons()
-            return
-
-        if msg_type == "polisher":
-            text = item[1] if len(item) > 1 else ""
-            if text and not text.endswith("\n"):
-                text += "\n"
-            self._maybe_update_polisher_progress(text)
-            self.polisher_output.insert_colored(text)
-            return
-        if msg_type == "polisher_done":
-            ok = bool(item[1]) if len(item) > 1 else False
-            input_file = item[2] if len(item) > 2 else ""
-            output_file = item[3] if len(item) > 3 else ""
-            summary = item[4] if len(item) > 4 else None
-            self.polisher_process = None
-            if ok:
-                # 记录最后一次润色输出，供“双语转换器 -> 从润色加载”使用
-                try:
-                    self.last_polished_file = output_file
-                except Exception:
-                    pass
-                self.progress_bar.configure(mode='determinate', maximum=100)
-                self.progress_var.set(100)
-                self._restore_polisher_ui()
-                self.status_var.set("润色完成")
-                if isinstance(summary, dict):
-                    try:
-                        if summary.get("perfect"):
-                            self.polisher_output.insert_colored("[OK] 校验通过\n")
-                        else:
-                            self.polisher_output.insert_colored("[WARN] 校验发现不匹配\n")
-                    except Exception:
-                        pass
+            self._set_pb(mode='determinate', maximum=100)
+            self._set_progress(100)
+            self._restore_polisher_ui()
+            self.status_var.set("润色完成")
+            if isinstance(summary, dict):
                 try:
-                    self.output_queue.put(("auto_fill_review", (input_file, output_file)))
+                    if summary.get("perfect"):
+                        self.polisher_output.insert_colored("[OK] 校验通过\n")
+                    else:
+                        self.polisher_output.insert_colored("[WARN] 校验发现不匹配\n")
                 except Exception:
                     pass
-            else:
-                self.progress_var.set(0)
-                self._restore_polisher_ui()
-                self.status_var.set("润色失败/中止")
-            return
-        if msg_type == "polisher_error":
-            err = item[1] if len(item) > 1 else "未知错误"
-            self.polisher_process = None
-            self.polisher_output.insert_colored(f"\n[ERROR] 润色进程异常: {err}\n")
-            self.progress_var.set(0)
+            try:
+                self.output_queue.put(("auto_fill_review", (input_file, output_file)))
+            except Exception:
+                pass
+        else:
+            self._set_progress(0)
             self._restore_polisher_ui()
-            self.status_var.set("润色异常")
-            return
+            self.status_var.set("润色失败/中止")
+
+    def _msg_polisher_error(self, item):
+        err = item[1] if len(item) > 1 else "未知错误"
+        self.polisher_process = None
+        self.polisher_output.insert_colored(f"\n[ERROR] 润色进程异常: {err}\n")
+        self._set_progress(0)
+        self._restore_polisher_ui()
+        self.status_var.set("润色异常")
 
     def _maybe_update_bilingual_progress(self, line: str):
         """尝试从双语转换输出中提取进度。若无法解析，则做简单的已处理计数提示。"""
+        # 先用子串判断过滤掉不含进度信息的行，避免逐行跑正则
+        if not any(key in line for key in _BILINGUAL_PROGRESS_KEYS):
+            return
         try:
             # 匹配新的进度格式：[INFO] 进度: 45.6% - 已处理 123/300 个条目
-            m1 = re.search(r"进度:\s*(\d+(?:\.\d+)?)%", line)
+            m1 = _PROGRESS_PCT_RE.search(line)
             if m1:
                 pct = float(m1.group(1))
                 pct = max(0, min(100, pct))
-                self.progress_bar.configure(maximum=100)
-                self.progress_var.set(pct)
+                self._post_progress(maximum=100, value=pct)
                 return
             
             # 备用：匹配简单的百分比格式
-            m2 = re.search(r"(\d{1,3})%", line)
+            m2 = _PERCENT_RE.search(line)
             if m2:
                 pct = int(m2.group(1))
                 pct = max(0, min(100, pct))
-                self.progress_bar.configure(maximum=100)
-                self.progress_var.set(pct)
+                self._post_progress(maximum=100, value=pct)
                 return
-            m2 = re.search(r"(\d+)\s*/\s*(\d+)", line)
+            m2 = _FRACTION_RE.search(line)
             if m2:
                 done = int(m2.group(1))
                 total = max(1, int(m2.group(2)))
                 pct = int(done * 100 / total)
-                self.progress_bar.configure(maximum=100)
-                self.progress_var.set(pct)
-                self.status_var.set(f"正在转换双语字幕... {pct}% ({done}/{total})")
+                self._post_progress(maximum=100, value=pct, status=f"正在转换双语字幕... {pct}% ({done}/{total})")
                 return
             # 若无法解析具体比例，显示“进行中”提示但不改变数值
-            if any(key in line for key in ["processing", "convert", "转换", "处理"]):
-                cur = int(self.progress_var.get()) if self.progress_var.get() else 0
-                self.progress_var.set(min(99, cur + 1))
-                self.status_var.set(f"正在转换双语字幕... {int(self.progress_var.get())}%")
+            if any(key in line for key in ("processing", "convert", "转换", "处理")):
+                pct = min(99, int(self._current_progress() or 0) + 1)
+                self._post_progress(value=pct, status=f"正在转换双语字幕... {pct}%")
         except Exception:
             pass
 
     def _maybe_update_polisher_progress(self, line: str):
         """从润色器日志中解析批次进度并刷新进度条。"""
+        # 绝大多数日志行不含批次信息，直接跳过正则匹配
+        if "批次" not in line and "润色已完成" not in line:
+            return
         try:
-            m = re.search(r"总计\\s+(\\d+)\\s+个批次，剩余\\s+(\\d+)\\s+个需要处理", line)
+            m = _BATCH_TOTAL_RE.search(line)
             if m:
                 total = int(m.group(1))
                 remaining = int(m.group(2))
@@ -3354,272 +4175,187 @@ class SRTGuiApp:
                 if done > len(self._polisher_done_batches):
                     # 不知道具体批次号时，仅同步计数到状态显示
                     pass
-                self.progress_bar.configure(mode='determinate', maximum=max(1, total))
-                self.progress_var.set(min(done, total))
-                self.status_var.set(f"润色进度: 批次 {min(done, total)}/{total}")
+                self._post_progress(mode='determinate', maximum=max(1, total), value=min(done, total),
+                                    status=f"润色进度: 批次 {min(done, total)}/{total}")
                 return
 
-            m2 = re.search(r"已将润色批次\\s+(\\d+)\\s+写入", line)
+            m2 = _POLISH_BATCH_WROTE_RE.search(line)
             if m2:
                 batch_no = int(m2.group(1))
                 self._polisher_done_batches.add(batch_no)
                 total = self._polisher_total_batches
                 if total:
                     done = min(len(self._polisher_done_batches), total)
-                    self.progress_bar.configure(mode='determinate', maximum=max(1, total))
-                    self.progress_var.set(done)
-                    self.status_var.set(f"润色进度: 批次 {done}/{total}")
+                    self._post_progress(mode='determinate', maximum=max(1, total), value=done,
+                                        status=f"润色进度: 批次 {done}/{total}")
                 else:
                     # 总数未知时用百分比展示不可靠，只显示已完成数
-                    self.status_var.set(f"润色进度: 已完成批次 {len(self._polisher_done_batches)}")
+                    self._post_progress(status=f"润色进度: 已完成批次 {len(self._polisher_done_batches)}")
                 return
 
             if "润色已完成" in line or "所有批次已完成" in line:
                 total = self._polisher_total_batches
                 if total:
-                    self.progress_bar.configure(mode='determinate', maximum=max(1, total))
-                    self.progress_var.set(total)
-                    self.status_var.set(f"润色进度: 批次 {total}/{total}")
+                    self._post_progress(mode='determinate', maximum=max(1, total), value=total,
+                                        status=f"润色进度: 批次 {total}/{total}")
                 else:
-                    self.progress_bar.configure(mode='determinate', maximum=100)
-                    self.progress_var.set(100)
-                    self.status_var.set("润色完成")
+                    self._post_progress(mode='determinate', maximum=100, value=100, status="润色完成")
         except Exception:
             pass
 
-    def _maybe_update_translation_progress(self, line: str):
-        """从翻译器输出行中解析批次总数与已完成批次数，并刷新进度条与状态文本。"""
-        try:
-            # 解析总批次数与剩余批次
-            m = re.search(r"总计\s+(\d+)\s+个批次，剩余\s+(\d+)\s+个需要处理", line)
-            if m:
-                total = int(m.group(1))
-                remaining = int(m.group(2))
-                completed = max(0, total - remaining)
-                self.total_batches = total
-                self.completed_batches = completed
-                # 更新进度条最大值与当前值
-                self.progress_bar.configure(maximum=max(1, total))
-                self.progress_var.set(completed)
-                self.status_var.set(f"正在翻译... 批次 {completed}/{total}")
-                return
+    def _submit_io(self, fn, args, on_done):
+        """在后台线程执行文件系统操作，结果（或异常）经 output_queue 回到主线程交给 on_done"""
+        def run():
+            try:
+                result = fn(*args)
+            except Exception as e:
+                result = e
+            self.output_queue.put(("io_result", (on_done, result)))
 
-            # 解析单个批次完成
-            if re.search(r"已将批次\s+\d+\s+写入", line):
-                # 不依赖批次号自增；多线程下也只是累计
-                self.completed_batches = (getattr(self, 'completed_batches', 0) or 0) + 1
-                total = getattr(self, 'total_batches', None)
-                if total:
-                    self.progress_bar.configure(maximum=max(1, total))
-                    # 限制不要超过总数
-                    self.progress_var.set(min(self.completed_batches, total))
-                    self.status_var.set(f"正在翻译... 批次 {min(self.completed_batches, total)}/{total}")
-                else:
-                    # 未知总数时，用百分比无法准确，显示已完成计数
-                    self.status_var.set(f"正在翻译... 已完成批次 {self.completed_batches}")
-                return
+        _IO_EXECUTOR.submit(run)
 
-            # 所有批次已完成（开始合并）
-            if "所有批次已完成" in line or "翻译完成。输出在" in line:
-                total = getattr(self, 'total_batches', None)
-                if total:
-                    self.progress_bar.configure(maximum=max(1, total))
-                    self.progress_var.set(total)
-                    self.status_var.set(f"正在翻译... 批次 {total}/{total}")
-        except Exception:
-            # 安静失败，不影响主流程
-            pass
-    
     def auto_fill_checker_files(self):
-        """自动填充校验器文件路径"""
+        """自动填充校验器文件路径（文件检查在后台线程进行）"""
+        # 获取翻译器的输入和输出文件路径
+        input_file = self.input_file_var.get()
+        output_file = self.output_file_var.get()
+        self._submit_io(_resolve_translation_files, (input_file, output_file),
+                        lambda result: self._apply_checker_autofill(result, output_file))
+
+    def _apply_checker_autofill(self, result, output_file):
+        """在主线程中把检查结果填入校验器"""
+        out = self.translator_output
         try:
-            # 获取翻译器的输入和输出文件路径
-            input_file = self.input_file_var.get()
-            output_file = self.output_file_var.get()
-            
-            # 检查文件是否存在
-            if input_file and os.path.exists(input_file):
-                self.source_file_var.set(input_file)
-                self.translator_output.insert(tk.END, f"✅ 已自动设置校验器源文件: {input_file}\n")
-                self.translator_output.see(tk.END)
-            
-            # 检查输出文件是否存在（可能包含范围标记）
+            if isinstance(result, Exception):
+                raise result
+            source, translated = result
+            if source:
+                self.source_file_var.set(source)
+                out.insert(tk.END, f"✅ 已自动设置校验器源文件: {source}\n")
+            
+            # 输出文件不存在时已尝试查找带范围标记的文件
             if output_file:
-                # 首先检查原始输出文件
-                if os.path.exists(output_file):
-                    self.translated_file_var.set(output_file)
-                    self.translator_output.insert(tk.END, f"✅ 已自动设置校验器翻译文件: {output_file}\n")
-                    self.translator_output.see(tk.END)
+                if translated:
+                    self.translated_file_var.set(translated)
+                    out.insert(tk.END, f"✅ 已自动设置校验器翻译文件: {translated}\n")
                 else:
-                    # 如果原始文件不存在，可能是范围翻译，查找带范围标记的文件
-                    base_name = os.path.splitext(output_file)[0]
-                    dir_name = os.path.dirname(output_file) if os.path.dirname(output_file) else "."
-                    
-                    # 查找可能的范围翻译文件
-                    import glob
-                    pattern = f"{base_name}_*_*.srt"
-                    range_files = glob.glob(pattern)
-                    
-                    if range_files:
-                        # 使用最新创建的范围文件
-                        latest_file = max(range_files, key=os.path.getctime)
-                        self.translated_file_var.set(latest_file)
-                        self.translator_output.insert(tk.END, f"✅ 已自动设置校验器翻译文件: {latest_file}\n")
-                        self.translator_output.see(tk.END)
-                    else:
-                        self.translator_output.insert(tk.END, f"⚠️ 无法找到翻译输出文件: {output_file}\n")
-                        self.translator_output.see(tk.END)
+                    out.insert(tk.END, f"⚠️ 无法找到翻译输出文件: {output_file}\n")
             
             # 自动切换到校验器标签页并提示用户
             self.notebook.select(self.checker_frame)
-            self.translator_output.insert(tk.END, f"🔄 已切换到校验器标签页，您可以立即开始校验！\n")
-            self.translator_output.see(tk.END)
+            out.insert(tk.END, f"🔄 已切换到校验器标签页，您可以立即开始校验！\n")
             
             # 在校验器输出中也添加提示
             self.checker_output.insert(tk.END, "📂 文件路径已自动填充，点击'开始校验'即可开始校验翻译质量。\n")
-            self.checker_output.see(tk.END)
             
         except Exception as e:
-            self.translator_output.insert(tk.END, f"❌ 自动填充校验器文件路径时出错: {str(e)}\n")
-            self.translator_output.see(tk.END)
+            out.insert(tk.END, f"❌ 自动填充校验器文件路径时出错: {str(e)}\n")
     
     def auto_fill_bilingual_files(self):
         """自动填充双语转换器文件路径"""
-        try:
-            # 获取翻译器的输入和输出文件路径
-            input_file = self.input_file_var.get()
-            output_file = self.output_file_var.get()
-            
-            # 检查文件是否存在
-            if input_file and os.path.exists(input_file):
-                self.bilingual_original_var.set(input_file)
-                self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器原始文件: {input_file}\n")
-                self.translator_output.see(tk.END)
-            
-            # 检查输出文件是否存在（可能包含范围标记）
-            if output_file:
-                # 首先检查原始输出文件
-                if os.path.exists(output_file):
-                    self.bilingual_translated_var.set(output_file)
-                    self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器翻译文件: {output_file}\n")
-                    self.translator_output.see(tk.END)
-                else:
-                    # 如果原始文件不存在，可能是范围翻译，查找带范围标记的文件
-                    base_name = os.path.splitext(output_file)[0]
-                    dir_name = os.path.dirname(output_file) if os.path.dirname(output_file) else "."
-                    
-                    # 查找可能的范围翻译文件
-                    import glob
-                    pattern = f"{base_name}_*_*.srt"
-                    range_files = glob.glob(pattern)
-                    
-                    if range_files:
-                        # 使用最新创建的范围文件
-                        latest_file = max(range_files, key=os.path.getctime)
-                        self.bilingual_translated_var.set(latest_file)
-                        self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器翻译文件: {latest_file}\n")
-                        self.translator_output.see(tk.END)
-                    else:
-                        self.translator_output.insert(tk.END, f"⚠️ 无法找到翻译输出文件: {output_file}\n")
-                        self.translator_output.see(tk.END)
-            
-            # 自动设置输出文件名
-            if output_file:
-                base_name = os.path.splitext(output_file)[0]
-                bilingual_output_file = f"{base_name}_双语.srt"
-                self.bilingual_output_var.set(bilingual_output_file)
-                self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器输出文件: {bilingual_output_file}\n")
-                self.translator_output.see(tk.END)
-            
-            # 自动切换到双语转换器标签页并提示用户
-            self.notebook.select(self.bilingual_frame)
-            self.translator_output.insert(tk.END, f"🔄 已切换到双语转换器标签页，您可以立即开始转换！\n")
-            self.translator_output.see(tk.END)
-            
-            # 在双语转换器输出中也添加提示
-            self.bilingual_output.insert(tk.END, "📂 文件路径已自动填充，点击'开始转换'即可开始生成双语字幕。\n")
-            self.bilingual_output.see(tk.END)
-            
-        except Exception as e:
-            self.translator_output.insert(tk.END, f"❌ 自动填充双语转换器文件路径时出错: {str(e)}\n")
-            self.translator_output.see(tk.END)
+        return self._auto_fill_bilingual(True)
     
     def auto_fill_bilingual_files_no_switch(self):
         """自动填充双语转换器文件路径但不切换标签页"""
+        return self._auto_fill_bilingual(False)
+
+    def _auto_fill_bilingual(self, switch_tab: bool):
+        """两个双语自动填充入口的共同实现；文件查找在后台线程进行"""
+        self._ensure_tab_built(self.bilingual_frame)
+        input_file = self.input_file_var.get()
+        output_file = self.output_file_var.get()
+        self._submit_io(_resolve_translation_files, (input_file, output_file),
+                        lambda result: self._apply_bilingual_autofill(result, output_file, switch_tab))
+
+    def _apply_bilingual_autofill(self, result, output_file, switch_tab):
+        """在主线程中把检查结果填入双语转换器"""
+        out = self.translator_output
         try:
-            # 获取翻译器的输入和输出文件路径
-            input_file = self.input_file_var.get()
-            output_file = self.output_file_var.get()
-            
-            # 检查文件是否存在
-            if input_file and os.path.exists(input_file):
-                self.bilingual_original_var.set(input_file)
-                self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器原始文件: {input_file}\n")
-                self.translator_output.see(tk.END)
-            
-            # 检查输出文件是否存在（可能包含范围标记）
+            if isinstance(result, Exception):
+                raise result
+            source, translated = result
+            if source:
+                self.bilingual_original_var.set(source)
+                out.insert(tk.END, f"✅ 已自动设置双语转换器原始文件: {source}\n")
+            
+            # 输出文件不存在时已尝试查找带范围标记的文件
             if output_file:
-                # 首先检查原始输出文件
-                if os.path.exists(output_file):
-                    self.bilingual_translated_var.set(output_file)
-                    self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器翻译文件: {output_file}\n")
-                    self.translator_output.see(tk.END)
+                if translated:
+                    self.bilingual_translated_var.set(translated)
+                    out.insert(tk.END, f"✅ 已自动设置双语转换器翻译文件: {translated}\n")
                 else:
-                    # 如果原始文件不存在，可能是范围翻译，查找带范围标记的文件
-                    base_name = os.path.splitext(output_file)[0]
-                    dir_name = os.path.dirname(output_file) if os.path.dirname(output_file) else "."
-                    
-                    # 查找可能的范围翻译文件
-                    import glob
-                    pattern = f"{base_name}_*_*.srt"
-                    range_files = glob.glob(pattern)
-                    
-                    if range_files:
-                        # 使用最新创建的范围文件
-                        latest_file = max(range_files, key=os.path.getctime)
-                        self.bilingual_translated_var.set(latest_file)
-                        self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器翻译文件: {latest_file}\n")
-                        self.translator_output.see(tk.END)
-                    else:
-                        self.translator_output.insert(tk.END, f"⚠️ 无法找到翻译输出文件: {output_file}\n")
-                        self.translator_output.see(tk.END)
-            
-            # 自动设置输出文件名
-            if output_file:
-                base_name = os.path.splitext(output_file)[0]
-                bilingual_output_file = f"{base_name}_双语.srt"
+                    out.insert(tk.END, f"⚠️ 无法找到翻译输出文件: {output_file}\n")
+
+                # 自动设置输出文件名
+                bilingual_output_file = f"{os.path.splitext(output_file)[0]}_双语.srt"
                 self.bilingual_output_var.set(bilingual_output_file)
-                self.translator_output.insert(tk.END, f"✅ 已自动设置双语转换器输出文件: {bilingual_output_file}\n")
-                self.translator_output.see(tk.END)
-            
-            # 不切换标签页，只在输出中提示
-            self.translator_output.insert(tk.END, f"📂 双语转换器文件路径已自动填充，可在双语转换器标签页中查看。\n")
-            self.translator_output.see(tk.END)
+                out.insert(tk.END, f"✅ 已自动设置双语转换器输出文件: {bilingual_output_file}\n")
+            
+            if switch_tab:
+                # 自动切换到双语转换器标签页并提示用户
+                self.notebook.select(self.bilingual_frame)
+                out.insert(tk.END, f"🔄 已切换到双语转换器标签页，您可以立即开始转换！\n")
+                # 在双语转换器输出中也添加提示
+                self.bilingual_output.insert(tk.END, "📂 文件路径已自动填充，点击'开始转换'即可开始生成双语字幕。\n")
+            else:
+                # 不切换标签页，只在输出中提示
+                out.insert(tk.END, f"📂 双语转换器文件路径已自动填充，可在双语转换器标签页中查看。\n")
             
         except Exception as e:
-            self.translator_output.insert(tk.END, f"❌ 自动填充双语转换器文件路径时出错: {str(e)}\n")
-            self.translator_output.see(tk.END)
+            out.insert(tk.END, f"❌ 自动填充双语转换器文件路径时出错: {str(e)}\n")
     
-    def load_config(self):
-        """从文件加载配置"""
+    def _write_initial_config(self, raw):
+        """（后台线程）写出初始配置文件；若期间已保存过配置（文件已存在）则不覆盖"""
+        try:
+            with open(self.config_file, 'xb') as fw:
+                fw.write(raw)
+        except Exception:
+            pass
+
+    def _load_config_raw(self):
+        """读取并解析配置文件，结果存入 self._config_cache；没有配置文件时返回 None"""
+        self._config_cache = None
         config_path = self.config_file
         if not os.path.exists(config_path):
             rp = resource_path("srt_gui_config.json")
             if rp and os.path.exists(rp):
                 config_path = rp
-
         if not os.path.exists(config_path):
+            return None
+
+        with open(config_path, 'rb') as f:
+            raw = f.read()
+        config = json.loads(raw)
+
+        if config_path != self.config_file:
+            # 首次运行：在后台把内置配置原样写到用户目录，不阻塞启动
+            threading.Thread(target=self._write_initial_config, args=(raw,), daemon=True).start()
+        self._config_cache = config
+        return config
+
+    def load_config(self):
+        """从文件加载配置。启动时只应用翻译器/API等常用设置，
+        纠错器与润色器的配置段在对应标签页首次显示时才应用"""
+        self._applied_sections = set()
+        try:
+            config = self._load_config_raw()
+        except Exception as e:
+            safe_file_log(f"load_config error: {e}")
+            return
+
+        if config is None:
             # 初始化默认API配置结构
-            self.api_configs = {
+            self.api_configs = OrderedDict({
                 "Default": {
                     "api_endpoint": "https://api.deepseek.com/v1/chat/completions",
                     "api_key": "",
                     "model": "deepseek-chat"
                 }
-            }
+            })
             self.current_api_config = "Default"
-            if hasattr(self, 'api_preset_combo'):
-                self.api_preset_combo['values'] = ["Default"]
+            self._api_config_keys_tuple = ("Default",)
+            if self.api_preset_combo is not None:
+                self._sync_api_preset_combo()
                 self.api_preset_combo.set("Default")
             return
         
@@ -3627,18 +4363,8 @@ class SRTGuiApp:
         self._loading_config = True
         
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-
-            if config_path != self.config_file:
-                try:
-                    with open(self.config_file, 'w', encoding='utf-8') as fw:
-                        json.dump(config, fw, ensure_ascii=False, indent=2)
-                except Exception:
-                    pass
-            
             # --- API多配置加载与迁移 ---
-            self.api_configs = config.get("api_configs", {})
+            self.api_configs = OrderedDict(config.get("api_configs", {}))
             self.current_api_config = config.get("current_api_config", "Default")
             
             # 迁移旧配置：如果不存在api_configs，则使用旧的顶层配置创建默认配置
@@ -3647,18 +4373,19 @@ class SRTGuiApp:
                 old_key = config.get("api_key", "")
                 old_model = config.get("model", "deepseek-chat")
                 
-                self.api_configs = {
+                self.api_configs = OrderedDict({
                     "Default": {
                         "api_endpoint": old_endpoint,
                         "api_key": old_key,
                         "model": old_model
                     }
-                }
+                })
                 self.current_api_config = "Default"
             
             # 更新UI下拉框
-            if hasattr(self, 'api_preset_combo'):
-                self.api_preset_combo['values'] = list(self.api_configs.keys())
+            self._api_config_keys_tuple = tuple(self.api_configs)
+            if self.api_preset_combo is not None:
+                self._sync_api_preset_combo()
                 self.api_preset_combo.set(self.current_api_config)
             
             # 应用当前选中的API配置
@@ -3678,97 +4405,8 @@ class SRTGuiApp:
             if should_be_visible != self.api_details_visible:
                 self.toggle_api_details()
             
-            # 加载纠错器配置
-            corrector_config = config.get("corrector", {})
-            if corrector_config:
-                # 安全地设置纠错器参数（检查变量是否存在）
-                if hasattr(self, 'corrector_batch_size_var'):
-                    self.corrector_batch_size_var.set(corrector_config.get("batch_size", "5"))
-                if hasattr(self, 'corrector_threads_var'):
-                    self.corrector_threads_var.set(corrector_config.get("threads", "3"))
-                if hasattr(self, 'corrector_temperature_var'):
-                    self.corrector_temperature_var.set(corrector_config.get("temperature", "0.3"))
-                if hasattr(self, 'corrector_context_window_var'):
-                    self.corrector_context_window_var.set(corrector_config.get("context_window", "2"))
-                if hasattr(self, 'corrector_batch_mode_var'):
-                    self.corrector_batch_mode_var.set(corrector_config.get("batch_mode", "逐条处理"))
-                if hasattr(self, 'corrector_timeout_var'):
-                    self.corrector_timeout_var.set(corrector_config.get("timeout_seconds", "180"))
-                
-                # 加载格式规范化选项（检查变量是否存在）
-                format_options = corrector_config.get("format_options", {})
-                if hasattr(self, 'clean_newlines_var'):
-                    self.clean_newlines_var.set(format_options.get("clean_newlines", True))
-                if hasattr(self, 'remove_spaces_var'):
-                    self.remove_spaces_var.set(format_options.get("remove_spaces", True))
-                if hasattr(self, 'normalize_punctuation_var'):
-                    self.normalize_punctuation_var.set(format_options.get("normalize_punctuation", True))
-                if hasattr(self, 'smart_line_break_var'):
-                    self.smart_line_break_var.set(format_options.get("smart_line_break", True))
-                if hasattr(self, 'smart_spacing_var'):
-                    self.smart_spacing_var.set(format_options.get("smart_spacing", True))
-                if hasattr(self, 'smart_punctuation_var'):
-                    self.smart_punctuation_var.set(format_options.get("smart_punctuation", True))
-                if hasattr(self, 'fluency_optimization_var'):
-                    self.fluency_optimization_var.set(format_options.get("fluency_optimization", True))
-                
-                # 加载纠错器用户提示词
-                if hasattr(self, 'corrector_user_prompt_text'):
-                    user_prompt = corrector_config.get("user_prompt", "")
-                    self.corrector_user_prompt_text.delete(1.0, tk.END)
-                    if user_prompt:
-                        self.corrector_user_prompt_text.insert(1.0, user_prompt)
-            
-            # 加载预设内容
-            saved_presets = config.get("presets", {})
-            if saved_presets:
-                # 检查是否为旧格式（直接存储字符串）并转换为新格式
-                for key, value in saved_presets.items():
-                    if isinstance(value, str):
-                        # 旧格式：直接是字符串内容
-                        preset_id = int(key) if str(key).isdigit() else None
-                        if preset_id and preset_id in self.presets:
-                            # 保留默认名称，更新内容
-                            self.presets[preset_id]["content"] = value
-                    elif isinstance(value, dict) and "name" in value and "content" in value:
-                        # 新格式：包含name和content的字典
-                        preset_id = int(key) if str(key).isdigit() else None
-                        if preset_id:
-                            self.presets[preset_id] = value
-            
-            # 更新翻译器预设按钮的ToolTip文本
-            if hasattr(self, 'translator_preset_tooltips'):
-                for preset_id in range(1, 11):  # 1-10个预设
-                    if preset_id in self.translator_preset_tooltips and preset_id in self.presets:
-                        name = self.presets[preset_id].get("name", f"预设{preset_id}")
-                        self.translator_preset_tooltips[preset_id].text = name
-            
-            # 加载纠错器预设内容
-            saved_corrector_presets = config.get("corrector_presets", {})
-            if saved_corrector_presets:
-                for key, value in saved_corrector_presets.items():
-                    if isinstance(value, dict) and "name" in value and "content" in value:
-                        preset_id = int(key) if str(key).isdigit() else None
-                        if preset_id:
-                            self.corrector_presets[preset_id] = value
-                
-                # 统一更新所有按钮文本（确保界面同步）
-                if hasattr(self, 'corrector_preset_buttons'):
-                    for preset_id in range(1, 9):  # 更新为1-8个预设
-                        if preset_id in self.corrector_preset_buttons and preset_id in self.corrector_presets:
-                            full_name = self.corrector_presets[preset_id]["name"]
-                            display_name = truncate_text(full_name, 10)
-                            self.corrector_preset_buttons[preset_id].config(text=display_name)
-                            
-                            # 更新tooltip
-                            if preset_id in self.corrector_preset_tooltips:
-                                self.corrector_preset_tooltips[preset_id].text = full_name
-                            elif len(full_name) > 10:
-                                # 创建新的tooltip
-                                self.corrector_preset_tooltips[preset_id] = ToolTip(
-                                    self.corrector_preset_buttons[preset_id], full_name)
-
-                            debug_file_log(f"preset_button updated: id={preset_id} name={display_name}")
+            # 预设内容（纠错器预设按钮文本在纠错器标签页显示时更新）
+            self._apply_presets()
 
             # 恢复翻译器的直译对齐选项
             if hasattr(self, 'literal_align_var'):
@@ -3778,58 +4416,239 @@ class SRTGuiApp:
             if hasattr(self, 'professional_mode_var'):
                 self.professional_mode_var.set(bool(config.get("professional_mode", False)))
 
-            # 加载润色器配置
-            polisher_config = config.get("polisher", {})
-            if polisher_config:
-                # 安全地设置润色器参数（检查变量是否存在）
-                if hasattr(self, 'polisher_batch_size_var'):
-                    self.polisher_batch_size_var.set(polisher_config.get("batch_size", "10"))
-                if hasattr(self, 'polisher_context_size_var'):
-                    self.polisher_context_size_var.set(polisher_config.get("context_size", "2"))
-                if hasattr(self, 'polisher_threads_var'):
-                    self.polisher_threads_var.set(polisher_config.get("threads", "3"))
-                if hasattr(self, 'polisher_temperature_var'):
-                    self.polisher_temperature_var.set(polisher_config.get("temperature", "0.3"))
-                if hasattr(self, 'polisher_resume_var'):
-                    self.polisher_resume_var.set(polisher_config.get("resume", True))
-                if hasattr(self, 'polisher_auto_verify_var'):
-                    self.polisher_auto_verify_var.set(polisher_config.get("auto_verify", True))
-                if hasattr(self, 'polisher_length_policy_var'):
-                    self.polisher_length_policy_var.set(polisher_config.get("length_policy", "cn_balanced"))
-                if hasattr(self, 'polisher_corner_quotes_var'):
-                    self.polisher_corner_quotes_var.set(polisher_config.get("corner_quotes", False))
-
-            # 加载语速阈值设定
-            speed_thresholds = config.get("speed_thresholds", {})
-            if speed_thresholds:
-                self.cn_speed_min = speed_thresholds.get("cn_speed_min", 2.0)
-                self.cn_speed_max = speed_thresholds.get("cn_speed_max", 4.0)
-
-                # 更新界面控件（如果已创建）
-                if hasattr(self, 'cn_speed_min_var'):
-                    self.cn_speed_min_var.set(self.cn_speed_min)
-                if hasattr(self, 'cn_speed_max_var'):
-                    self.cn_speed_max_var.set(self.cn_speed_max)
-                if hasattr(self, 'min_speed_label'):
-                    self.min_speed_label.config(text=f"{self.cn_speed_min:.1f}")
-                if hasattr(self, 'max_speed_label'):
-                    self.max_speed_label.config(text=f"{self.cn_speed_max:.1f}")
+            # 加载文件对话框目录
+            last_dirs = config.get("last_dirs")
+            if isinstance(last_dirs, dict):
+                self._last_dirs = {k: v for k, v in last_dirs.items() if isinstance(v, str)}
+
+            # 语速阈值只是两个数值，审核/校验流程也会读取，直接应用
+            self._apply_speed_thresholds()
 
         except Exception as e:
             safe_file_log(f"load_config error: {e}")
         finally:
             # 重新启用自动保存
             self._loading_config = False
+
+    # 延迟应用的配置段 -> 应用方法；方法在控件尚未创建时返回 False
+    _CONFIG_SECTION_APPLIERS = {
+        "corrector": "_apply_corrector_config",
+        "polisher": "_apply_polisher_config",
+    }
+
+    # 配置段中的简单字段：(Tk变量属性名, 配置键, 默认值)
+    _CORRECTOR_SPEC = (
+        ("corrector_batch_size_var", "batch_size", "5"),
+        ("corrector_threads_var", "threads", "3"),
+        ("corrector_temperature_var", "temperature", "0.3"),
+        ("corrector_context_window_var", "context_window", "2"),
+        ("corrector_timeout_var", "timeout_seconds", "180"),
+        ("corrector_batch_mode_var", "batch_mode", "逐条处理"),
+    )
+    _FORMAT_OPTIONS_SPEC = (
+        ("clean_newlines_var", "clean_newlines", True),
+        ("remove_spaces_var", "remove_spaces", True),
+        ("normalize_punctuation_var", "normalize_punctuation", True),
+        ("smart_line_break_var", "smart_line_break", True),
+        ("smart_spacing_var", "smart_spacing", True),
+        ("smart_punctuation_var", "smart_punctuation", True),
+        ("fluency_optimization_var", "fluency_optimization", True),
+    )
+    _POLISHER_SPEC = (
+        ("polisher_batch_size_var", "batch_size", "10"),
+        ("polisher_context_size_var", "context_size", "2"),
+        ("polisher_threads_var", "threads", "3"),
+        ("polisher_temperature_var", "temperature", "0.3"),
+        ("polisher_resume_var", "resume", True),
+        ("polisher_auto_verify_var", "auto_verify", True),
+        ("polisher_length_policy_var", "length_policy", "cn_balanced"),
+        ("polisher_corner_quotes_var", "corner_quotes", False),
+    )
+
+    def _collect(self, spec):
+        """按字段表读取界面变量，变量不存在时取默认值"""
+        return {key: self._opt_get(attr, default) for attr, key, default in spec}
+
+    def _apply_spec(self, spec, section_config):
+        """按字段表把配置值写入已存在的界面变量"""
+        for attr, key, default in spec:
+            var = getattr(self, attr, None)
+            if var is not None:
+                var.set(section_config.get(key, default))
+
+    # 缓存序列化结果的顶层配置段；其余字段体积很小，每次保存重新序列化
+    _FRAGMENT_KEYS = frozenset({"presets", "corrector_presets", "corrector", "polisher"})
+
+    def _track_config_vars(self, spec, key):
+        """界面变量被修改时把所属配置段标记为待重新序列化"""
+        for attr, _, _ in spec:
+            var = getattr(self, attr, None)
+            if var is not None:
+                var.trace_add("write", lambda *_, k=key: self._dirty_keys.add(k))
+
+    def _on_corrector_prompt_modified(self, event=None):
+        self._dirty_keys.add("corrector")
+        try:
+            # 复位修改标志，下一次修改才会再次触发
+            self.corrector_user_prompt_text.edit_modified(False)
+        except Exception:
+            pass
+
+    def _serialize_config(self, config):
+        """按顶层键拼出与 json.dumps(indent=2) 相同的文本，未改动的大配置段复用上次的序列化结果"""
+        fragments = self._config_fragments
+        dirty = self._dirty_keys
+        parts = []
+        for key, value in config.items():
+            frag = fragments.get(key) if key not in dirty else None
+            if frag is None:
+                # 嵌套在顶层对象中，每个换行后多缩进两格
+                frag = json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+                if key in self._FRAGMENT_KEYS:
+                    fragments[key] = frag
+            parts.append(f"  {json.dumps(key, ensure_ascii=False)}: {frag}")
+        return "{\n" + ",\n".join(parts) + "\n}"
+
+    def _apply_once(self, section):
+        """应用一个延迟的配置段（只执行一次），应用期间不触发自动保存"""
+        applied = getattr(self, '_applied_sections', None)
+        if applied is None or section in applied:
+            return
+        prev = getattr(self, '_loading_config', False)
+        self._loading_config = True
+        try:
+            if getattr(self, self._CONFIG_SECTION_APPLIERS[section])():
+                applied.add(section)
+        except Exception as e:
+            applied.add(section)
+            safe_file_log(f"apply config section {section} error: {e}")
+        finally:
+            self._loading_config = prev
+
+    def _pending_config_section(self, section):
+        """配置段尚未应用到界面时返回已加载的原始配置（供保存时原样写回），否则返回 None"""
+        if section in getattr(self, '_applied_sections', ()):
+            return None
+        return dict((self._config_cache or {}).get(section) or {})
+
+    def _apply_presets(self):
+        """合并配置文件中的翻译器/纠错器预设"""
+        config = self._config_cache or {}
+        self._dirty_keys.update(("presets", "corrector_presets"))
+        self._presets_version += 1
+        saved_presets = config.get("presets", {})
+        if saved_presets:
+            # 检查是否为旧格式（直接存储字符串）并转换为新格式
+            for key, value in saved_presets.items():
+                if isinstance(value, str):
+                    # 旧格式：直接是字符串内容
+                    preset_id = int(key) if str(key).isdigit() else None
+                    if preset_id and preset_id in self.presets:
+                        # 保留默认名称，更新内容
+                        self.presets[preset_id]["content"] = value
+                elif isinstance(value, dict) and "name" in value and "content" in value:
+                    # 新格式：包含name和content的字典
+                    preset_id = int(key) if str(key).isdigit() else None
+                    if preset_id:
+                        self.presets[preset_id] = value
+        
+        # 更新翻译器预设按钮的ToolTip文本
+        if hasattr(self, 'translator_preset_tooltips'):
+            for preset_id in range(1, 11):  # 1-10个预设
+                if preset_id in self.translator_preset_tooltips and preset_id in self.presets:
+                    name = self.presets[preset_id].get("name", f"预设{preset_id}")
+                    self.translator_preset_tooltips[preset_id].text = name
+        
+        saved_corrector_presets = config.get("corrector_presets", {})
+        for key, value in saved_corrector_presets.items():
+            if isinstance(value, dict) and "name" in value and "content" in value:
+                preset_id = int(key) if str(key).isdigit() else None
+                if preset_id:
+                    self.corrector_presets[preset_id] = value
+
+    def _apply_speed_thresholds(self):
+        """应用语速阈值设定，并同步已创建的审核页控件"""
+        speed_thresholds = (self._config_cache or {}).get("speed_thresholds", {})
+        if not speed_thresholds:
+            return
+        self.cn_speed_min = speed_thresholds.get("cn_speed_min", 2.0)
+        self.cn_speed_max = speed_thresholds.get("cn_speed_max", 4.0)
+
+        # 更新界面控件（如果已创建）
+        if hasattr(self, 'cn_speed_min_var'):
+            self.cn_speed_min_var.set(self.cn_speed_min)
+        if hasattr(self, 'cn_speed_max_var'):
+            self.cn_speed_max_var.set(self.cn_speed_max)
+        if hasattr(self, 'min_speed_label'):
+            self.min_speed_label.config(text=f"{self.cn_speed_min:.1f}")
+        if hasattr(self, 'max_speed_label'):
+            self.max_speed_label.config(text=f"{self.cn_speed_max:.1f}")
+
+    def _apply_corrector_config(self):
+        """将纠错器配置与预设按钮文本写入纠错器界面"""
+        if self.corrector_batch_size_var is None:
+            return False
+        corrector_config = (self._config_cache or {}).get("corrector", {})
+        if corrector_config:
+            self._apply_spec(self._CORRECTOR_SPEC, corrector_config)
+            # 加载格式规范化选项
+            self._apply_spec(self._FORMAT_OPTIONS_SPEC, corrector_config.get("format_options", {}))
+            
+            # 加载纠错器用户提示词
+            if self.corrector_user_prompt_text is not None:
+                user_prompt = corrector_config.get("user_prompt", "")
+                self.corrector_user_prompt_text.delete(1.0, tk.END)
+                if user_prompt:
+                    self.corrector_user_prompt_text.insert(1.0, user_prompt)
+
+        # 统一更新所有预设按钮文本（确保界面同步）
+        if hasattr(self, 'corrector_preset_buttons'):
+            for preset_id in range(1, 9):  # 更新为1-8个预设
+                if preset_id in self.corrector_preset_buttons and preset_id in self.corrector_presets:
+                    full_name = self.corrector_presets[preset_id]["name"]
+                    display_name = truncate_text(full_name, 10)
+                    btn = self.corrector_preset_buttons[preset_id]
+                    # 文本未变化时不重复设置
+                    if btn.cget("text") != display_name:
+                        btn.config(text=display_name)
+                    
+                    # 更新tooltip
+                    if preset_id in self.corrector_preset_tooltips:
+                        self.corrector_preset_tooltips[preset_id].text = full_name
+                    elif len(full_name) > 10:
+                        # 创建新的tooltip
+                        self.corrector_preset_tooltips[preset_id] = ToolTip(
+                            self.corrector_preset_buttons[preset_id], full_name)
+
+                    debug_file_log(f"preset_button updated: id={preset_id} name={display_name}")
+        return True
     
+    def _apply_polisher_config(self):
+        """将润色器配置写入润色器界面变量"""
+        if not hasattr(self, 'polisher_batch_size_var'):
+            return False
+        polisher_config = (self._config_cache or {}).get("polisher", {})
+        if not polisher_config:
+            return True
+        self._apply_spec(self._POLISHER_SPEC, polisher_config)
+        return True
+
     def save_config(self, quiet=False):
         """保存配置到文件"""
         if getattr(self, '_loading_config', False):
             return
+        # 本次保存已包含所有修改，取消尚未执行的自动保存
+        if self._save_after_id is not None:
+            try:
+                self.root.after_cancel(self._save_after_id)
+            except Exception:
+                pass
+            self._save_after_id = None
             
         # 更新当前API配置
         current_name = getattr(self, "current_api_config", "Default")
         if not hasattr(self, "api_configs"):
-             self.api_configs = {}
+             self.api_configs = OrderedDict()
         
         self.api_configs[current_name] = {
             "api_endpoint": self.api_endpoint_var.get(),
@@ -3852,52 +4671,40 @@ class SRTGuiApp:
             "threads": self.threads_var.get(),
             "no_resume": self.no_resume_var.get(),
             "temperature": self.temperature_var.get(),
-            "literal_align": getattr(self, 'literal_align_var', tk.BooleanVar(value=False)).get(),
-            "structured_output": getattr(self, 'structured_output_var', tk.BooleanVar(value=False)).get(),
-            "professional_mode": getattr(self, 'professional_mode_var', tk.BooleanVar(value=False)).get(),
+            "literal_align": self._opt_bool('literal_align_var'),
+            "structured_output": self._opt_bool('structured_output_var'),
+            "professional_mode": self._opt_bool('professional_mode_var'),
             "presets": self.presets,  # 保存翻译器预设内容
             "corrector_presets": self.corrector_presets,  # 保存纠错器预设内容
-            # 字幕纠错器配置
-            "corrector": {
-                "batch_size": self.corrector_batch_size_var.get(),
-                "threads": self.corrector_threads_var.get(),
-                "temperature": self.corrector_temperature_var.get(),
-                "context_window": self.corrector_context_window_var.get(),
-                "timeout_seconds": self.corrector_timeout_var.get(),
-                "batch_mode": self.corrector_batch_mode_var.get(),
+            # 字幕纠错器配置（标签页尚未显示过时沿用已加载的配置，避免被默认值覆盖）
+            "corrector": self._pending_config_section("corrector") or {
+                **self._collect(self._CORRECTOR_SPEC),
                 # 格式规范化选项
-                "format_options": {
-                    "clean_newlines": self.clean_newlines_var.get(),
-                    "remove_spaces": self.remove_spaces_var.get(),
-                    "normalize_punctuation": self.normalize_punctuation_var.get(),
-                    "smart_line_break": self.smart_line_break_var.get(),
-                    "smart_spacing": self.smart_spacing_var.get(),
-                    "smart_punctuation": self.smart_punctuation_var.get(),
-                    "fluency_optimization": self.fluency_optimization_var.get(),
-                },
-                "user_prompt": self.corrector_user_prompt_text.get(1.0, tk.END).strip()
-            },
-            # 字幕润色器配置
-            "polisher": {
-                "batch_size": getattr(self, 'polisher_batch_size_var', tk.StringVar(value="10")).get(),
-                "context_size": getattr(self, 'polisher_context_size_var', tk.StringVar(value="2")).get(),
-                "threads": getattr(self, 'polisher_threads_var', tk.StringVar(value="3")).get(),
-                "temperature": getattr(self, 'polisher_temperature_var', tk.StringVar(value="0.3")).get(),
-                "resume": getattr(self, 'polisher_resume_var', tk.BooleanVar(value=True)).get(),
-                "auto_verify": getattr(self, 'polisher_auto_verify_var', tk.BooleanVar(value=True)).get(),
-                "length_policy": getattr(self, 'polisher_length_policy_var', tk.StringVar(value="cn_balanced")).get(),
-                "corner_quotes": getattr(self, 'polisher_corner_quotes_var', tk.BooleanVar(value=False)).get()
+                "format_options": self._collect(self._FORMAT_OPTIONS_SPEC),
+                "user_prompt": (self.corrector_user_prompt_text.get(1.0, tk.END).strip()
+                                if self.corrector_user_prompt_text is not None else "")
             },
+            # 字幕润色器配置（标签页未构建时沿用已加载的配置，避免被默认值覆盖）
+            "polisher": self._collect(self._POLISHER_SPEC)
+            if hasattr(self, 'polisher_batch_size_var') else self._pending_config_section("polisher") or {},
             # 语速阈值设定
             "speed_thresholds": {
                 "cn_speed_min": getattr(self, 'cn_speed_min', 2.0),
                 "cn_speed_max": getattr(self, 'cn_speed_max', 4.0)
-            }
+            },
+            # 文件对话框上次使用的目录
+            "last_dirs": self._last_dirs
         }
         
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+            data = self._serialize_config(config)
+            # 先写临时文件再替换，避免中途失败留下残缺的配置
+            tmp_path = self.config_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_file)
+            self._dirty_keys.clear()
+            self._last_dirs_dirty = False
             if not quiet:
                 # 使用状态栏提示，不弹窗
                 self.status_var.set("✓ 配置已保存")
@@ -3918,21 +4725,30 @@ class SRTGuiApp:
     
     def on_closing(self):
         """关闭窗口时的处理"""
+        # 对话框目录有变化或自动保存尚未执行时顺带保存，下次启动沿用
+        if self._last_dirs_dirty or self._save_after_id is not None:
+            try:
+                self.save_config(quiet=True)
+            except Exception:
+                pass
         if self.is_running:
             if messagebox.askokcancel("确认", "有任务正在运行，确定要退出吗？"):
                 self.stop_current_task()
-                try:
-                    if self.corrector_process is not None and self.corrector_process.is_alive():
-                        self.corrector_process.terminate()
-                        self.corrector_process.join(timeout=1)
-                except Exception:
-                    pass
-                try:
-                    if self.polisher_process is not None and self.polisher_process.is_alive():
-                        self.polisher_process.terminate()
-                        self.polisher_process.join(timeout=1)
-                except Exception:
-                    pass
+                # 先向所有仍在运行的子进程发出终止信号，再共用1秒的等待时间
+                procs = []
+                for p in (self.corrector_process, self.polisher_process, self.bilingual_process):
+                    try:
+                        if p is not None and p.is_alive():
+                            p.terminate()
+                            procs.append(p)
+                    except Exception:
+                        pass
+                deadline = time.monotonic() + 1.0
+                for p in procs:
+                    try:
+                        p.join(max(0.0, deadline - time.monotonic()))
+                    except Exception:
+                        pass
                 self.clean_temp_files()  # 确保关闭前清理临时文件
                 self.root.destroy()
         else:
@@ -3953,42 +4769,58 @@ class SRTGuiApp:
     
     def test_api_connection(self):
         """测试API连接"""
-        import threading
-        
+        # Tk控件与变量只在主线程访问；后台线程的日志与结果经 output_queue 回到主线程
+        api_endpoint = self.api_endpoint_var.get().strip()
+        api_key = self.api_key_var.get().strip()
+        model = self.model_var.get().strip()
+
+        # 验证必要参数：输入有误时不必加载 requests，也不启动后台线程
+        if not api_endpoint:
+            self._show_api_test_result("[ERROR] 失败", "API服务器地址不能为空", "red")
+            return
+        if not api_key:
+            self._show_api_test_result("[ERROR] 失败", "API密钥不能为空", "red")
+            return
+        if not model:
+            self._show_api_test_result("[ERROR] 失败", "模型名称不能为空", "red")
+            return
+
+        self.test_api_btn.config(state="disabled", text="测试中...")
+        self.api_status_label.config(text="正在测试...", foreground="orange")
+
         def test_in_background():
-            self.test_api_btn.config(state="disabled", text="测试中...")
-            self.api_status_label.config(text="正在测试...", foreground="orange")
-            
+            # 日志行先缓存，分批写入
+            log_buf = []
+            log = log_buf.append
+
+            def flush_log():
+                for line in log_buf:
+                    self.output_queue.put(("translation", line))
+                log_buf.clear()
+
+            def show_result(status_text, message, color):
+                self.output_queue.put(("api_test_result", (status_text, message, color)))
+
+            # 下面的 except 子句会引用 requests，导入失败须在 try 之外处理
+            try:
+                requests = _get_requests()
+            except ImportError as e:
+                show_result("[ERROR] 失败", f"缺少 requests 库: {str(e)}", "red")
+                log(f"[ERROR] 无法导入 requests: {str(e)}\n")
+                log(f"[INFO] 请先执行 pip install -r requirements.txt\n")
+                log(f"{_RULE}\n")
+                flush_log()
+                self.output_queue.put(("api_test_done",))
+                return
+
             try:
-                # 获取API配置
-                api_endpoint = self.api_endpoint_var.get().strip()
-                api_key = self.api_key_var.get().strip()
-                model = self.model_var.get().strip()
-                
-                # 验证必要参数
-                if not api_endpoint:
-                    self._show_api_test_result("[ERROR] 失败", "API服务器地址不能为空", "red")
-                    return
-                
-                if not api_key:
-                    self._show_api_test_result("[ERROR] 失败", "API密钥不能为空", "red")
-                    return
-                
-                if not model:
-                    self._show_api_test_result("[ERROR] 失败", "模型名称不能为空", "red")
-                    return
-                
                 # 添加详细的测试日志
-                self.translator_output.insert(tk.END, f"[INFO] 开始测试API连接...\n")
-                self.translator_output.insert(tk.END, f"[INFO] 服务器: {api_endpoint}\n")
-                self.translator_output.insert(tk.END, f"[INFO] 模型: {model}\n")
-                self.translator_output.insert(tk.END, f"[INFO] 密钥: {'*' * (len(api_key) - 4) + api_key[-4:] if len(api_key) > 4 else '****'}\n")
-                self.translator_output.see(tk.END)
+                log(f"[INFO] 开始测试API连接...\n")
+                log(f"[INFO] 服务器: {api_endpoint}\n")
+                log(f"[INFO] 模型: {model}\n")
+                log(f"[INFO] 密钥: {'*' * (len(api_key) - 4) + api_key[-4:] if len(api_key) > 4 else '****'}\n")
                 
                 # 发送测试请求
-                import requests
-                import json
-                
                 headers = {
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {api_key}"
@@ -4003,88 +4835,103 @@ class SRTGuiApp:
                     "temperature": 0.1
                 }
                 
-                self.translator_output.insert(tk.END, f"[INFO] 发送测试请求...\n")
-                self.translator_output.see(tk.END)
+                log(f"[INFO] 发送测试请求...\n")
+                # 请求最长可能等待30秒，先显示已有的日志
+                flush_log()
                 
-                response = requests.post(
+                session = self._api_session
+                if session is None:
+                    session = requests.Session()
+                    adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=2, max_retries=0)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._api_session = session
+                with session.post(
                     api_endpoint,
                     headers=headers,
                     json=test_data,
-                    timeout=30
-                )
-                
-                # 分析响应
-                if response.status_code == 200:
-                    try:
-                        result = response.json()
-                        if 'choices' in result and len(result['choices']) > 0:
-                            self._show_api_test_result("[OK] 成功", "API连接正常，模型响应正常", "green")
-                            self.translator_output.insert(tk.END, f"[OK] API测试成功！\n")
-                            self.translator_output.insert(tk.END, f"[INFO] 响应内容: {result['choices'][0].get('message', {}).get('content', '无内容')}\n")
-                        else:
-                            self._show_api_test_result("[WARN] 部分成功", "API连接成功但响应格式异常", "orange")
-                            self.translator_output.insert(tk.END, f"[WARN] API连接成功但响应格式异常\n")
-                            self.translator_output.insert(tk.END, f"[INFO] 原始响应: {result}\n")
-                    except json.JSONDecodeError:
-                        self._show_api_test_result("[WARN] 部分成功", "API连接成功但响应不是有效JSON", "orange")
-                        self.translator_output.insert(tk.END, f"[WARN] API连接成功但响应格式错误\n")
-                        self.translator_output.insert(tk.END, f"[INFO] 响应内容: {response.text[:200]}...\n")
+                    timeout=30,
+                    stream=True
+                ) as response:
+                    # 分析响应
+                    if response.status_code == 200:
+                        body = b""
+                        try:
+                            # 测试回复很短：先只读取有限长度的正文，确实更长时才读完
+                            response.raw.decode_content = True
+                            body = response.raw.read(_API_TEST_BODY_LIMIT)
+                            if len(body) >= _API_TEST_BODY_LIMIT:
+                                body += response.raw.read()
+                            result = json.loads(body)
+                            if 'choices' in result and len(result['choices']) > 0:
+                                show_result("[OK] 成功", "API连接正常，模型响应正常", "green")
+                                log(f"[OK] API测试成功！\n")
+                                log(f"[INFO] 响应内容: {result['choices'][0].get('message', {}).get('content', '无内容')}\n")
+                            else:
+                                show_result("[WARN] 部分成功", "API连接成功但响应格式异常", "orange")
+                                log(f"[WARN] API连接成功但响应格式异常\n")
+                                log(f"[INFO] 原始响应: {result}\n")
+                        except ValueError:
+                            # JSONDecodeError 或正文编码错误
+                            show_result("[WARN] 部分成功", "API连接成功但响应不是有效JSON", "orange")
+                            log(f"[WARN] API连接成功但响应格式错误\n")
+                            log(f"[INFO] 响应内容: {body[:200].decode('utf-8', 'replace')}...\n")
                         
-                elif response.status_code == 401:
-                    self._show_api_test_result("[ERROR] 失败", "API密钥无效或已过期", "red")
-                    self.translator_output.insert(tk.END, f"[ERROR] 认证失败 (401): API密钥无效\n")
-                    self.translator_output.insert(tk.END, f"[INFO] 请检查API密钥是否正确\n")
+                    elif response.status_code == 401:
+                        show_result("[ERROR] 失败", "API密钥无效或已过期", "red")
+                        log(f"[ERROR] 认证失败 (401): API密钥无效\n")
+                        log(f"[INFO] 请检查API密钥是否正确\n")
                     
-                elif response.status_code == 403:
-                    self._show_api_test_result("[ERROR] 失败", "API密钥权限不足", "red")
-                    self.translator_output.insert(tk.END, f"[ERROR] 权限不足 (403): API密钥权限不够\n")
-                    self.translator_output.insert(tk.END, f"[INFO] 请检查API密钥是否有调用此模型的权限\n")
+                    elif response.status_code == 403:
+                        show_result("[ERROR] 失败", "API密钥权限不足", "red")
+                        log(f"[ERROR] 权限不足 (403): API密钥权限不够\n")
+                        log(f"[INFO] 请检查API密钥是否有调用此模型的权限\n")
                     
-                elif response.status_code == 404:
-                    self._show_api_test_result("[ERROR] 失败", "API端点不存在或模型不存在", "red")
-                    self.translator_output.insert(tk.END, f"[ERROR] 未找到 (404): API端点或模型不存在\n")
-                    self.translator_output.insert(tk.END, f"[INFO] 请检查API服务器地址和模型名称是否正确\n")
+                    elif response.status_code == 404:
+                        show_result("[ERROR] 失败", "API端点不存在或模型不存在", "red")
+                        log(f"[ERROR] 未找到 (404): API端点或模型不存在\n")
+                        log(f"[INFO] 请检查API服务器地址和模型名称是否正确\n")
                     
-                elif response.status_code == 429:
-                    self._show_api_test_result("[ERROR] 失败", "API调用频率超限", "red")
-                    self.translator_output.insert(tk.END, f"[ERROR] 频率超限 (429): API调用过于频繁\n")
-                    self.translator_output.insert(tk.END, f"[INFO] 请稍后重试或检查API配额\n")
+                    elif response.status_code == 429:
+                        show_result("[ERROR] 失败", "API调用频率超限", "red")
+                        log(f"[ERROR] 频率超限 (429): API调用过于频繁\n")
+                        log(f"[INFO] 请稍后重试或检查API配额\n")
                     
-                elif response.status_code == 500:
-                    self._show_api_test_result("[ERROR] 失败", "API服务器内部错误", "red")
-                    self.translator_output.insert(tk.END, f"[ERROR] 服务器错误 (500): API服务器内部错误\n")
-                    self.translator_output.insert(tk.END, f"[INFO] 请稍后重试或联系API服务商\n")
+                    elif response.status_code == 500:
+                        show_result("[ERROR] 失败", "API服务器内部错误", "red")
+                        log(f"[ERROR] 服务器错误 (500): API服务器内部错误\n")
+                        log(f"[INFO] 请稍后重试或联系API服务商\n")
                     
-                else:
-                    self._show_api_test_result("[ERROR] 失败", f"HTTP错误 {response.status_code}", "red")
-                    self.translator_output.insert(tk.END, f"[ERROR] HTTP错误 ({response.status_code})\n")
-                    self.translator_output.insert(tk.END, f"[INFO] 错误详情: {response.text[:200]}...\n")
+                    else:
+                        show_result("[ERROR] 失败", f"HTTP错误 {response.status_code}", "red")
+                        log(f"[ERROR] HTTP错误 ({response.status_code})\n")
+                        log(f"[INFO] 错误详情: {response.text[:200]}...\n")
                 
             except requests.exceptions.ConnectTimeout:
-                self._show_api_test_result("[ERROR] 失败", "连接超时", "red")
-                self.translator_output.insert(tk.END, f"[ERROR] 连接超时: 无法在30秒内连接到API服务器\n")
-                self.translator_output.insert(tk.END, f"[INFO] 请检查网络连接和API服务器地址\n")
+                show_result("[ERROR] 失败", "连接超时", "red")
+                log(f"[ERROR] 连接超时: 无法在30秒内连接到API服务器\n")
+                log(f"[INFO] 请检查网络连接和API服务器地址\n")
                 
             except requests.exceptions.ConnectionError:
-                self._show_api_test_result("[ERROR] 失败", "网络连接错误", "red")
-                self.translator_output.insert(tk.END, f"[ERROR] 连接错误: 无法连接到API服务器\n")
-                self.translator_output.insert(tk.END, f"[INFO] 请检查网络连接和防火墙设置\n")
+                show_result("[ERROR] 失败", "网络连接错误", "red")
+                log(f"[ERROR] 连接错误: 无法连接到API服务器\n")
+                log(f"[INFO] 请检查网络连接和防火墙设置\n")
                 
             except requests.exceptions.SSLError:
-                self._show_api_test_result("[ERROR] 失败", "SSL证书验证失败", "red")
-                self.translator_output.insert(tk.END, f"[ERROR] SSL错误: 证书验证失败\n")
-                self.translator_output.insert(tk.END, f"[INFO] 请检查API服务器的SSL证书\n")
+                show_result("[ERROR] 失败", "SSL证书验证失败", "red")
+                log(f"[ERROR] SSL错误: 证书验证失败\n")
+                log(f"[INFO] 请检查API服务器的SSL证书\n")
                 
             except Exception as e:
-                self._show_api_test_result("[ERROR] 失败", f"未知错误: {str(e)}", "red")
-                self.translator_output.insert(tk.END, f"[ERROR] 未知错误: {str(e)}\n")
-                self.translator_output.insert(tk.END, f"[INFO] 请检查所有配置参数\n")
+                show_result("[ERROR] 失败", f"未知错误: {str(e)}", "red")
+                log(f"[ERROR] 未知错误: {str(e)}\n")
+                log(f"[INFO] 请检查所有配置参数\n")
             
             finally:
-                self.translator_output.insert(tk.END, f"{'='*50}\n")
-                self.translator_output.see(tk.END)
+                log(f"{_RULE}\n")
+                flush_log()
                 # 恢复按钮状态
-                self.test_api_btn.config(state="normal", text="测试API连接")
+                self.output_queue.put(("api_test_done",))
         
         # 在后台线程中执行测试
         threading.Thread(target=test_in_background, daemon=True).start()
@@ -4112,220 +4959,43 @@ class SRTGuiApp:
         """清空用户提示词"""
         self.user_prompt_text.delete(1.0, tk.END)
     
-    def set_preset_1(self):
-        """设置预设提示词1"""
-        preset_data = self.presets.get(1, {})
-        prompt = preset_data.get("content", 
-            "请将AI翻译为人工智能，Machine Learning翻译为机器学习，Deep Learning翻译为深度学习。"
-            "保留所有英文缩写如CPU、GPU、API、JSON等。"
-            "技术术语优先使用业界通用的中文译名。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_2(self):
-        """设置预设提示词2"""
-        preset_data = self.presets.get(2, {})
-        prompt = preset_data.get("content",
-            "对于日本人名请保持日式发音的中文音译，如田中、山田、佐藤等。"
-            "对于韩国人名请保持韩式发音的中文音译，如金、朴、李等。"
-            "非著名的欧美地名、人名请直接保留英文原文，不要强行翻译。"
-            "确保同一人名在整个字幕中翻译一致。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_3(self):
-        """设置预设提示词3"""
-        preset_data = self.presets.get(3, {})
-        prompt = preset_data.get("content", 
-            "请使用更加口语化、生活化的翻译风格，避免过于正式的书面语。"
-            "对话要符合中文表达习惯，自然流畅。"
-            "保持原文的语气和情感色彩。"
-            "网络用语和俚语请翻译为对应的中文网络用语。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_4(self):
-        """设置预设提示词4"""
-        preset_data = self.presets.get(4, {})
-        prompt = preset_data.get("content",
-            "对于影视作品名称、角色名称请保持一致性翻译。"
-            "影视术语如导演、制片人、演员等使用标准中文术语。"
-            "对于电影、电视剧、综艺节目的台词要符合观众的观看习惯。"
-            "保持娱乐内容的轻松幽默感，不要过于严肃。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_5(self):
-        """设置预设提示词5"""
-        preset_data = self.presets.get(5, {})
-        prompt = preset_data.get("content",
-            "使用正式的商务中文表达，避免过于口语化。"
-            "商务术语如CEO、CFO、董事会等使用标准翻译。"
-            "数字、金额、百分比等要准确翻译。"
-            "保持专业性和严谨性，符合商务场合的表达习惯。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_6(self):
-        """设置预设提示词6"""
-        preset_data = self.presets.get(6, {})
-        prompt = preset_data.get("content",
-            "使用规范的学术中文表达，保持严谨性。"
-            "学术术语要使用标准的中文翻译。"
-            "引用、参考文献、图表等要按中文学术规范翻译。"
-            "保持客观性和准确性，避免主观色彩。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_7(self):
-        """设置预设提示词7"""
-        preset_data = self.presets.get(7, {})
-        prompt = preset_data.get("content",
-            "使用自然流畅的中文日常对话表达。"
-            "俚语、口头禅要翻译为对应的中文表达。"
-            "保持对话的自然感和亲切感。"
-            "年龄、性别、社会身份要体现在语言风格中。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_8(self):
-        """设置预设提示词8"""
-        preset_data = self.presets.get(8, {})
-        prompt = preset_data.get("content",
-            "翻译时保持新闻播报的正式性和客观性。"
-            "使用标准的新闻用语和表达方式。"
-            "人名地名采用通用译名，数据要准确。"
-            "保持新闻的严肃性和权威性。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_9(self):
-        """设置预设提示词9"""
-        preset_data = self.presets.get(9, {})
-        prompt = preset_data.get("content",
-            "翻译医学健康类内容时保持专业准确。"
-            "医学术语使用标准中文表达。"
-            "药物名称、疾病名称使用通用译名。"
-            "涉及健康建议时保持严谨客观的表述。"
-        )
-        self.user_prompt_text.delete(1.0, tk.END)
-        self.user_prompt_text.insert(1.0, prompt)
-    
-    def set_preset_10(self):
-        """设置预设提示词10"""
-        preset_data = self.presets.get(10, {})
-        prompt = preset_data.get("content",
-            "翻译美食烹饪类内容时保持生动诱人的表达。"
-            "食材名称使用中文常见名称。"
-            "烹饪方法和步骤要清晰易懂。"
-            "保持美食内容的诱人和温馨感。"
-        )
+    def set_preset(self, preset_id: int):
+        """把指定编号的预设提示词填入用户提示词"""
+        preset_data = self.presets.get(preset_id, {})
+        prompt = preset_data.get("content", _DEFAULT_PRESETS[preset_id]["content"])
         self.user_prompt_text.delete(1.0, tk.END)
         self.user_prompt_text.insert(1.0, prompt)
     
     def init_default_presets(self):
         """初始化默认预设内容"""
-        # 翻译器预设
-        self.presets = {
-            1: {
-                "name": "技术术语",
-                "content": (
-                    "请将AI翻译为人工智能，Machine Learning翻译为机器学习，Deep Learning翻译为深度学习。"
-                    "保留所有英文缩写如CPU、GPU、API、JSON等。"
-                    "技术术语优先使用业界通用的中文译名。"
-                )
-            },
-            2: {
-                "name": "人名地名",
-                "content": (
-                    "对于日本人名请保持日式发音的中文音译，如田中、山田、佐藤等。"
-                    "对于韩国人名请保持韩式发音的中文音译，如金、朴、李等。"
-                    "非著名的欧美地名、人名请直接保留英文原文，不要强行翻译。"
-                    "确保同一人名在整个字幕中翻译一致。"
-                )
-            },
-            3: {
-                "name": "语言风格",
-                "content": (
-                    "请使用更加口语化、生活化的翻译风格，避免过于正式的书面语。"
-                    "对话要符合中文表达习惯，自然流畅。"
-                    "保持原文的语气和情感色彩。"
-                    "网络用语和俚语请翻译为对应的中文网络用语。"
-                )
-            },
-            4: {
-                "name": "影视娱乐",
-                "content": (
-                    "对于影视作品名称、角色名称请保持一致性翻译。"
-                    "影视术语如导演、制片人、演员等使用标准中文术语。"
-                    "对于电影、电视剧、综艺节目的台词要符合观众的观看习惯。"
-                    "保持娱乐内容的轻松幽默感，不要过于严肃。"
-                )
-            },
-            5: {
-                "name": "商务用语",
-                "content": (
-                    "使用正式的商务中文表达，避免过于口语化。"
-                    "商务术语如CEO、CFO、董事会等使用标准翻译。"
-                    "数字、金额、百分比等要准确翻译。"
-                    "保持专业性和严谨性，符合商务场合的表达习惯。"
-                )
-            },
-            6: {
-                "name": "学术文献",
-                "content": (
-                    "使用规范的学术中文表达，保持严谨性。"
-                    "学术术语要使用标准的中文翻译。"
-                    "引用、参考文献、图表等要按中文学术规范翻译。"
-                    "保持客观性和准确性，避免主观色彩。"
-                )
-            },
-            7: {
-                "name": "日常对话",
-                "content": (
-                    "使用自然流畅的中文日常对话表达。"
-                    "俚语、口头禅要翻译为对应的中文表达。"
-                    "保持对话的自然感和亲切感。"
-                    "年龄、性别、社会身份要体现在语言风格中。"
-                )
-            },
-            8: {
-                "name": "新闻播报",
-                "content": (
-                    "翻译时保持新闻播报的正式性和客观性。"
-                    "使用标准的新闻用语和表达方式。"
-                    "人名地名采用通用译名，数据要准确。"
-                    "保持新闻的严肃性和权威性。"
-                )
-            },
-            9: {
-                "name": "医学健康",
-                "content": (
-                    "翻译医学健康类内容时保持专业准确。"
-                    "医学术语使用标准中文表达。"
-                    "药物名称、疾病名称使用通用译名。"
-                    "涉及健康建议时保持严谨客观的表述。"
-                )
-            },
-            10: {
-                "name": "美食烹饪",
-                "content": (
-                    "翻译美食烹饪类内容时保持生动诱人的表达。"
-                    "食材名称使用中文常见名称。"
-                    "烹饪方法和步骤要清晰易懂。"
-                    "保持美食内容的诱人和温馨感。"
-                )
-            }
-        }
+        # 翻译器预设（复制一份，编辑预设时不影响默认值）
+        self.presets = {k: dict(v) for k, v in _DEFAULT_PRESETS.items()}
+        self._presets_version += 1
+        # 纠错器预设（纠错器标签页延迟构建，load_config 时就需要存在）
+        self.corrector_presets = {k: dict(v) for k, v in _DEFAULT_CORRECTOR_PRESETS.items()}
     
+    def _preset_options(self):
+        """预设下拉列表的选项文本；预设未变化时复用上次的结果"""
+        cache = self._preset_options_cache
+        if cache is not None and cache[0] == self._presets_version:
+            return cache[1]
+        ids = sorted(self.presets.keys())
+        options = [f"预设{i} ({self.presets.get(i, {}).get('name', '未命名')})" for i in ids]
+        # (版本号, 选项列表, 预设编号 -> 列表下标)
+        self._preset_options_cache = (self._presets_version, options, {pid: idx for idx, pid in enumerate(ids)})
+        return options
+
+    def _update_preset_option(self, preset_id, name):
+        """单个预设改名后只替换对应的选项，不重建整个列表"""
+        cache = self._preset_options_cache
+        current = cache is not None and cache[0] == self._presets_version
+        self._presets_version += 1
+        if not current or preset_id not in cache[2]:
+            return
+        options, index_of = cache[1], cache[2]
+        options[index_of[preset_id]] = f"预设{preset_id} ({name})"
+        self._preset_options_cache = (self._presets_version, options, index_of)
+
     def edit_presets(self):
         """编辑预设提示词"""
         # 创建编辑窗口
@@ -4342,7 +5012,7 @@ class SRTGuiApp:
         ttk.Label(select_frame, text="选择预设:").pack(side=tk.LEFT)
         preset_var = tk.StringVar()
         # 创建显示文本列表：预设1 (技术术语)
-        preset_options = [f"预设{i} ({self.presets.get(i, {}).get('name', '未命名')})" for i in sorted(self.presets.keys())]
+        preset_options = self._preset_options()
         preset_combo = ttk.Combobox(select_frame, textvariable=preset_var, 
                                    values=preset_options, state="readonly")
         preset_combo.pack(side=tk.LEFT, padx=(5, 0), fill=tk.X, expand=True)
@@ -4406,10 +5076,15 @@ class SRTGuiApp:
                     "name": name,
                     "content": content
                 }
+                self._dirty_keys.add("presets")
+                self._update_preset_option(preset_id, name)
+                # 同步翻译器预设按钮的ToolTip
+                tooltip = getattr(self, 'translator_preset_tooltips', {}).get(preset_id)
+                if tooltip is not None:
+                    tooltip.text = name
                 
                 # 更新下拉列表
-                new_options = [f"预设{i} ({self.presets.get(i, {}).get('name', '未命名')})" for i in sorted(self.presets.keys())]
-                preset_combo['values'] = new_options
+                preset_combo['values'] = self._preset_options()
                 
                 # 保持当前选择
                 current_selection = f"预设{preset_id} ({name})"
@@ -4494,47 +5169,6 @@ class SRTGuiApp:
                               foreground="#2d6a4f", anchor=tk.W, justify=tk.LEFT)
         info_label.pack(fill=tk.X, pady=2)
         
-        # 初始化纠错器预设（确保在按钮创建前已初始化）
-        # 注意：这里只是临时初始化，实际值会在load_config()中被覆盖
-        if not hasattr(self, 'corrector_presets'):
-            self.corrector_presets = {
-                1: {
-                    "name": "标准纠错",
-                    "content": (
-                        "修正常见的错别字、同音字错误，如'的得'、'在再'、'做作'等。"
-                        "保持原文的语言风格和表达习惯，不要改变原意。"
-                    )
-                },
-                2: {
-                    "name": "保守纠错", 
-                    "content": (
-                        "只修正明显的错别字，对于可能是专有名词或技术术语的内容保持谨慎，"
-                        "确实不确定的词汇保持原样。注重保持原文的语言风格。"
-                    )
-                },
-                3: {
-                    "name": "口语化纠错",
-                    "content": (
-                        "注意修正口语化表达中的语法错误，将不规范的口语表达调整为更标准的书面语，"
-                        "但保持自然的表达方式，不要过于正式。"
-                    )
-                },
-                4: {
-                    "name": "技术内容纠错",
-                    "content": (
-                        "对于技术术语和专业词汇格外小心，优先保持原样。"
-                        "重点修正语音识别导致的技术词汇错误，确保技术表达的准确性。"
-                    )
-                },
-                5: {
-                    "name": "标点符号纠错",
-                    "content": (
-                        "除了修正错别字外，也要注意标点符号的使用，"
-                        "修正明显的标点错误，确保句子结构清晰。"
-                    )
-                }
-            }
-        
         # 用户提示词部分
         prompt_frame = ttk.LabelFrame(parent, text="纠错提示词", padding=(5, 5, 5, 5))
         prompt_frame.pack(fill=tk.X, pady=5)
@@ -4543,6 +5177,7 @@ class SRTGuiApp:
         
         self.corrector_user_prompt_text = scrolledtext.ScrolledText(prompt_frame, height=5, wrap=tk.WORD)
         self.corrector_user_prompt_text.pack(fill=tk.X, expand=True, pady=(0, 5))
+        self.corrector_user_prompt_text.bind("<<Modified>>", self._on_corrector_prompt_modified)
         
         # 功能按钮行（独立）
         function_row = ttk.Frame(prompt_frame)
@@ -4561,18 +5196,8 @@ class SRTGuiApp:
         for i in range(1, 9):  # 1-8个预设
             # 处理超出预设数量的情况，初始化默认预设
             if i not in self.corrector_presets:
-                default_names = {
-                    6: "商务纠错", 7: "学术纠错", 8: "娱乐纠错"
-                }
-                default_prompts = {
-                    6: "请修正语音识别错误，保持商务用语的正式性和准确性。",
-                    7: "请修正语音识别错误，保持学术术语的专业性和严谨性。",
-                    8: "请修正语音识别错误，保持娱乐内容的生动性和口语化特点。"
-                }
-                self.corrector_presets[i] = {
-                    "name": default_names.get(i, f"预设{i}"),
-                    "content": default_prompts.get(i, f"预设提示词{i}")
-                }
+                self.corrector_presets[i] = dict(_DEFAULT_CORRECTOR_PRESETS[i])
+                self._dirty_keys.add("corrector_presets")
             
             preset_name = self.corrector_presets[i]["name"]
             # 截断显示名称，但保留完整名称用于tooltip
@@ -4757,25 +5382,26 @@ class SRTGuiApp:
 
     def browse_corrector_input_file(self):
         """浏览纠错器输入文件"""
-        file_path = filedialog.askopenfilename(
-            title="选择输入SRT文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if file_path:
-            self.corrector_input_file_var.set(file_path)
+        self._browse("corrector_input", self.corrector_input_file_var, title="选择输入SRT文件",
+                     filetypes=self._SRT_FILETYPES)
 
     def browse_corrector_output_file(self):
         """浏览纠错器输出文件"""
-        file_path = filedialog.asksaveasfilename(
-            title="选择输出SRT文件",
-            defaultextension=".srt",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if file_path:
-            self.corrector_output_file_var.set(file_path)
+        self._browse("corrector_output", self.corrector_output_file_var, title="选择输出SRT文件",
+                     filetypes=self._SRT_FILETYPES, save=True, defaultext=".srt")
 
     def on_corrector_input_file_change(self, *args):
-        """当纠错器输入文件改变时自动设置输出文件"""
+        """当纠错器输入文件改变时自动设置输出文件（150ms防抖，连续输入只处理最后一次）"""
+        if self._corrector_auto_name_after_id is not None:
+            try:
+                self.root.after_cancel(self._corrector_auto_name_after_id)
+            except Exception:
+                pass
+        self._corrector_auto_name_after_id = self.root.after(150, self._do_corrector_auto_name)
+
+    def _do_corrector_auto_name(self):
+        """根据纠错器输入文件生成输出文件路径"""
+        self._corrector_auto_name_after_id = None
         input_file = self.corrector_input_file_var.get()
         if input_file:
             # 自动生成输出文件名（总是更新，不管输出文件是否已有值）
@@ -4786,6 +5412,13 @@ class SRTGuiApp:
 
     def start_correction(self):
         """开始字幕纠错"""
+        # 输入文件刚修改、自动命名尚未执行时立即执行
+        if self._corrector_auto_name_after_id is not None:
+            try:
+                self.root.after_cancel(self._corrector_auto_name_after_id)
+            except Exception:
+                pass
+            self._do_corrector_auto_name()
         # 验证输入
         input_file = self.corrector_input_file_var.get().strip()
         output_file = self.corrector_output_file_var.get().strip()
@@ -4799,7 +5432,7 @@ class SRTGuiApp:
             messagebox.showerror("错误", "请选择输入SRT文件")
             return
         
-        if not os.path.exists(input_file):
+        if not os.path.isfile(input_file):
             messagebox.showerror("错误", "输入文件不存在")
             return
         
@@ -4873,8 +5506,8 @@ class SRTGuiApp:
             self.progress_bar.stop()
         except Exception:
             pass
-        self.progress_bar.configure(mode='determinate', maximum=100)
-        self.progress_var.set(0)
+        self._set_pb(mode='determinate', maximum=100)
+        self._set_progress(0)
         self.status_var.set("纠错进度: 0.0%")
 
         job = CorrectorJobConfig(
@@ -4900,7 +5533,7 @@ class SRTGuiApp:
         """在后台线程中运行字幕纠错"""
         try:
             # 初始化进度条
-            self.progress_var.set(0)
+            self._set_progress(0)
             
             # 添加初始消息
             self._add_corrector_output("开始字幕纠错和优化...\n")
@@ -4976,7 +5609,7 @@ class SRTGuiApp:
                 if self.is_running:
                     # 更新进度条（0-100）
                     progress_percent = progress * 100
-                    self.progress_var.set(progress_percent)
+                    self._set_progress(progress_percent)
                     
                     # 更新输出和状态栏
                     self._add_corrector_output(f"进度: {progress:.1%} - {message}\n")
@@ -4989,7 +5622,7 @@ class SRTGuiApp:
                 # 统计信息已经通过 _print_stats() 发送到GUI，这里只需要设置状态
                 self.status_var.set("处理完成")
                 # 完成时进度条设为100%
-                self.progress_var.set(100)
+                self._set_progress(100)
                 
                 # 纠错完成后自动跳转到纠错审核标签页并填充文件路径
                 self.output_queue.put(("auto_fill_review", (input_file, output_file)))
@@ -5013,19 +5646,19 @@ class SRTGuiApp:
                 self._add_corrector_output("\n纠错已停止\n")
                 self.status_var.set("纠错已停止")
                 # 停止时重置进度条
-                self.progress_var.set(0)
+                self._set_progress(0)
             else:
                 self._add_corrector_output("\n纠错失败，请查看日志文件了解详情\n")
                 self.status_var.set("纠错失败")
                 # 失败时重置进度条
-                self.progress_var.set(0)
+                self._set_progress(0)
                 
         except Exception as e:
             if self.is_running:
                 self._add_corrector_output(f"\n纠错过程中出现错误: {str(e)}\n")
                 self.status_var.set("纠错出错")
                 # 出错时重置进度条
-                self.progress_var.set(0)
+                self._set_progress(0)
         finally:
             # 恢复按钮状态
             self.root.after(0, self._restore_corrector_buttons)
@@ -5048,6 +5681,7 @@ class SRTGuiApp:
         self.is_running = False
         self._add_corrector_output("\n[WARN] 正在强制停止纠错...\n")
         self.status_var.set("正在停止纠错...")
+        self._cancel_pending_spawn("corrector_process")
         try:
             proc = getattr(self, "corrector_process", None)
             if proc is not None and proc.is_alive():
@@ -5060,8 +5694,8 @@ class SRTGuiApp:
             self.progress_bar.stop()
         except Exception:
             pass
-        self.progress_bar.configure(mode='determinate', maximum=100)
-        self.progress_var.set(0)
+        self._set_pb(mode='determinate', maximum=100)
+        self._set_progress(0)
         self.status_var.set("纠错已停止")
         self._restore_corrector_buttons()
 
@@ -5069,26 +5703,15 @@ class SRTGuiApp:
 
     def browse_polisher_input_file(self):
         """浏览润色器输入文件"""
-        file_path = filedialog.askopenfilename(
-            title="选择要润色的SRT文件",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if file_path:
-            self.polisher_input_file_var.set(file_path)
-            # 自动生成输出文件名
-            base_name = os.path.splitext(file_path)[0]
-            output_file = f"{base_name}_polished.srt"
-            self.polisher_output_file_var.set(output_file)
+        # 选中后自动生成输出文件名
+        self._browse("polisher_input", self.polisher_input_file_var, title="选择要润色的SRT文件",
+                     filetypes=self._SRT_FILETYPES,
+                     after=lambda f: self.polisher_output_file_var.set(f"{os.path.splitext(f)[0]}_polished.srt"))
 
     def browse_polisher_output_file(self):
         """浏览润色器输出文件"""
-        file_path = filedialog.asksaveasfilename(
-            title="选择润色后的SRT文件保存位置",
-            defaultextension=".srt",
-            filetypes=[("SRT files", "*.srt"), ("All files", "*.*")]
-        )
-        if file_path:
-            self.polisher_output_file_var.set(file_path)
+        self._browse("polisher_output", self.polisher_output_file_var, title="选择润色后的SRT文件保存位置",
+                     filetypes=self._SRT_FILETYPES, save=True, defaultext=".srt")
 
     def start_polisher(self):
         """开始字幕润色"""
@@ -5115,7 +5738,7 @@ class SRTGuiApp:
             messagebox.showerror("参数错误", "请在翻译器标签页中设置API密钥")
             return
 
-        if not os.path.exists(input_file):
+        if not os.path.isfile(input_file):
             messagebox.showerror("文件错误", f"输入文件不存在: {input_file}")
             return
 
@@ -5166,15 +5789,14 @@ class SRTGuiApp:
                 from srt_polisher import SRTPolisher
 
                 # 初始化进度条
-                self.progress_var.set(0)
+                self._set_progress(0)
                 
                 # 解析输入文件获取总条目数，用于计算进度
                 try:
                     with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
                         content = f.read()
                     # 简单计算字幕条目数（匹配时间轴行）
-                    import re
-                    total_entries = len(re.findall(r'\d{2}:\d{2}:\d{2},\d{3}\s*-->', content))
+                    total_entries = len(_TIMECODE_ARROW_RE.findall(content))
                     total_batches = (total_entries + batch_size - 1) // batch_size if total_entries > 0 else 1
                 except Exception:
                     total_batches = 1
@@ -5189,7 +5811,7 @@ class SRTGuiApp:
                         if '润色批次' in text and ('已将' in text or '写入' in text):
                             completed_batches[0] += 1
                             progress = min(completed_batches[0] / total_batches * 100, 99)
-                            self.progress_var.set(progress)
+                            self._set_progress(progress)
                             self.status_var.set(f"润色进度: {progress:.0f}%")
 
                 # 将SRT-Polisher日志导入GUI输出：附加一个Tk处理器
@@ -5202,7 +5824,7 @@ class SRTGuiApp:
                             polisher_logger.removeHandler(h)
                     # 添加GUI日志处理器（去重添加）
                     if not any(isinstance(h, TkTextLogHandler) for h in polisher_logger.handlers):
-                        gui_handler = TkTextLogHandler(self.root, polisher_log_callback)
+                        gui_handler = TkTextLogHandler(self.root, polisher_log_callback, self.polisher_output)
                         gui_handler.setLevel(logging.INFO)
                         gui_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
                         polisher_logger.addHandler(gui_handler)
@@ -5224,7 +5846,7 @@ class SRTGuiApp:
                     api_endpoint=api_endpoint if api_type == "custom" else None,  # 直接传递API端点
                     length_policy=self.polisher_length_policy_var.get(),
                     fallback_on_timecode=False,
-                    corner_quotes=getattr(self, 'polisher_corner_quotes_var', tk.BooleanVar(value=False)).get()
+                    corner_quotes=self._opt_bool('polisher_corner_quotes_var')
                 )
 
                 # 获取选项
@@ -5243,7 +5865,7 @@ class SRTGuiApp:
                     # 记录最后一次润色的输出文件
                     self.last_polished_file = output_file
                     # 进度条设为100%
-                    self.progress_var.set(100)
+                    self._set_progress(100)
                     self.status_var.set("润色完成")
                     self.root.after(0, lambda: self._add_polisher_output(f"\n[OK] 润色完成！输出文件: {output_file}\n"))
                     if auto_verify:
@@ -5310,8 +5932,8 @@ class SRTGuiApp:
             self.progress_bar.stop()
         except Exception:
             pass
-        self.progress_bar.configure(mode='determinate', maximum=100)
-        self.progress_var.set(0)
+        self._set_pb(mode='determinate', maximum=100)
+        self._set_progress(0)
         self.status_var.set("润色进度: 0%")
 
         job = PolisherJobConfig(
@@ -5327,7 +5949,7 @@ class SRTGuiApp:
             temperature=temperature,
             user_prompt=user_prompt,
             length_policy=self.polisher_length_policy_var.get(),
-            corner_quotes=getattr(self, 'polisher_corner_quotes_var', tk.BooleanVar(value=False)).get(),
+            corner_quotes=self._opt_bool('polisher_corner_quotes_var'),
             resume=resume,
             auto_verify=auto_verify,
         )
@@ -5339,6 +5961,7 @@ class SRTGuiApp:
         self.is_running = False
         self._add_polisher_output("\n[WARN] 正在强制停止润色...\n")
         self.status_var.set("正在停止润色...")
+        self._cancel_pending_spawn("polisher_process")
         try:
             proc = getattr(self, "polisher_process", None)
             if proc is not None and proc.is_alive():
@@ -5351,8 +5974,8 @@ class SRTGuiApp:
             self.progress_bar.stop()
         except Exception:
             pass
-        self.progress_bar.configure(mode='determinate', maximum=100)
-        self.progress_var.set(0)
+        self._set_pb(mode='determinate', maximum=100)
+        self._set_progress(0)
         self._restore_polisher_ui()
         self.status_var.set("润色已停止")
 
@@ -5405,8 +6028,8 @@ class SRTGuiApp:
             base_no_ext = os.path.splitext(os.path.basename(output_file))[0]
 
             # 尝试匹配可能的range_tag
-            m = re.search(r"(_\\d+_\\d+)$", base_no_ext)
-            range_tag = m.group(1) if m else ""
+            m = _RANGE_TAG_RE.search(base_no_ext)
+            range_tag = m.group(0) if m else ""
             pure_base = base_no_ext[: -len(range_tag)] if range_tag else base_no_ext
 
             progress_candidates = [
@@ -5464,7 +6087,7 @@ class SRTGuiApp:
             batch_glob = os.path.join(tr_dir, f"{pure_base}_polish_batch*.srt")
             deleted = 0
             for p in glob.glob(batch_glob):
-                m2 = re.search(r"_polish_batch(\d+)\\.srt$", p)
+                m2 = _POLISH_BATCH_FILE_RE.search(p)
                 if not m2:
                     continue
                 bnum = int(m2.group(1))
@@ -5551,8 +6174,8 @@ class SRTGuiApp:
 
                         # 定位progress文件/输出基名
                         base_no_ext2 = os.path.splitext(os.path.basename(output_file))[0]
-                        mrg = re.search(r"(_\d+_\d+)$", base_no_ext2)
-                        range_tag2 = mrg.group(1) if mrg else ""
+                        mrg = _RANGE_TAG_RE.search(base_no_ext2)
+                        range_tag2 = mrg.group(0) if mrg else ""
                         pure_base2 = base_no_ext2[: -len(range_tag2)] if range_tag2 else base_no_ext2
                         progress_candidates2 = [
                             os.path.join(os.path.dirname(output_file) or '.', f"{pure_base2}_progress{range_tag2}.json"),
@@ -5578,7 +6201,7 @@ class SRTGuiApp:
                             json.dump(prog2, f, ensure_ascii=False, indent=2)
                         # 删除批次文件与合并文件
                         for p in glob.glob(batch_glob2):
-                            m2 = re.search(r"_polish_batch(\d+)\\.srt$", p)
+                            m2 = _POLISH_BATCH_FILE_RE.search(p)
                             if m2 and int(m2.group(1)) in batches_to_reset2:
                                 try:
                                     os.remove(p)
@@ -5604,6 +6227,7 @@ class SRTGuiApp:
 
     def _restore_polisher_ui(self):
         """恢复润色器UI状态"""
+        self._discard_pending_progress()
         self.polisher_start_button.config(state=tk.NORMAL)
         self.polisher_stop_button.config(state=tk.DISABLED)
         self.is_running = False
@@ -5681,19 +6305,26 @@ class SRTGuiApp:
         # 如果正在加载配置，跳过自动保存
         if getattr(self, '_loading_config', False):
             return
-            
-        try:
-            self.save_config(quiet=True)  # 静默保存，不显示成功提示
-        except Exception as e:
-            # 静默处理保存错误，避免干扰用户体验
-            pass
+        self._schedule_save()
     
     def on_corrector_option_change(self, *args):
         """当纠错器选项改变时自动保存配置"""
         # 如果正在加载配置，跳过自动保存
         if getattr(self, '_loading_config', False):
             return
-            
+        self._schedule_save()
+
+    def _schedule_save(self, delay=500):
+        """延迟静默保存；期间的新修改会重新计时，只写一次"""
+        if self._save_after_id is not None:
+            try:
+                self.root.after_cancel(self._save_after_id)
+            except Exception:
+                pass
+        self._save_after_id = self.root.after(delay, self._do_save)
+
+    def _do_save(self):
+        self._save_after_id = None
         try:
             self.save_config(quiet=True)  # 静默保存，不显示成功提示
         except Exception as e:
@@ -5809,6 +6440,7 @@ class SRTGuiApp:
             # 更新预设
             self.corrector_presets[preset_id]["name"] = new_name
             self.corrector_presets[preset_id]["content"] = new_content
+            self._dirty_keys.add("corrector_presets")
             debug_file_log(f"preset updated: id={preset_id} name={new_name} len={len(new_content)}")
             
             # 更新按钮文字（使用截断显示）
@@ -5839,17 +6471,9 @@ class SRTGuiApp:
         """重置纠错器预设为默认值"""
         current_name = self.corrector_presets[preset_id]["name"]
         if messagebox.askyesno("确认重置", f"确定要重置预设 '{current_name}' 为默认值吗？\n\n此操作不可撤销！"):
-            # 重新初始化默认预设并获取对应的默认值
-            default_presets = {
-                1: {"name": "标准纠错", "content": "修正常见的错别字、同音字错误，如'的得'、'在再'、'做作'等。保持原文的语言风格和表达习惯，不要改变原意。"},
-                2: {"name": "保守纠错", "content": "只修正明显的错别字，对于可能是专有名词或技术术语的内容保持谨慎，确实不确定的词汇保持原样。注重保持原文的语言风格。"},
-                3: {"name": "口语化纠错", "content": "注意修正口语化表达中的语法错误，将不规范的口语表达调整为更标准的书面语，但保持自然的表达方式，不要过于正式。"},
-                4: {"name": "技术内容纠错", "content": "重点修正语音识别导致的技术词汇错误，确保技术表达的准确性。"},
-                5: {"name": "标点符号纠错", "content": "除了修正错别字外，也要注意标点符号的使用，修正明显的标点错误，确保句子结构清晰。"}
-            }
-            
-            if preset_id in default_presets:
-                self.corrector_presets[preset_id] = default_presets[preset_id].copy()
+            if preset_id in _DEFAULT_CORRECTOR_PRESETS:
+                self.corrector_presets[preset_id] = dict(_DEFAULT_CORRECTOR_PRESETS[preset_id])
+                self._dirty_keys.add("corrector_presets")
                 # 更新按钮文字（使用截断显示）
                 full_name = self.corrector_presets[preset_id]["name"]
                 display_name = truncate_text(full_name, 10)
@@ -5872,7 +6496,6 @@ class SRTGuiApp:
         try:
             import tempfile
             import datetime
-            import re
             
             # 解析SRT文件的函数
             def parse_srt_file(file_path):
@@ -5887,17 +6510,8 @@ class SRTGuiApp:
                         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                             content = f.read()
                 
-                # 使用与纠错器相同的正则表达式
-                SRT_PATTERN = re.compile(
-                    r'(\d+)\s*\n'               # 字幕序号
-                    r'(\d{2}:\d{2}:\d{2},\d{3})\s*-->\s*(\d{2}:\d{2}:\d{2},\d{3})\s*\n'  # 时间码
-                    r'((?:.+(?:\n|$))+?)'       # 字幕内容
-                    r'(?:\n|$)',                # 空行或文件结尾
-                    re.MULTILINE
-                )
-                
                 entries = []
-                for match in SRT_PATTERN.finditer(content):
+                for match in _SRT_ENTRY_RE.finditer(content):
                     number = int(match.group(1))
                     start_time = match.group(2)
                     end_time = match.group(3)
@@ -6150,6 +6764,7 @@ class SRTGuiApp:
 
     def auto_fill_review_files(self, input_file: str, output_file: str):
         """纠错完成后自动填充纠错审核文件路径"""
+        self._ensure_tab_built(self.review_frame)
         try:
             # 设置原始文件和纠错后文件路径
             if input_file and os.path.exists(input_file):
@@ -6207,21 +6822,13 @@ class SRTGuiApp:
 
     def browse_review_original_file(self):
         """浏览选择原始字幕文件"""
-        file_path = filedialog.askopenfilename(
-            title="选择原始字幕文件",
-            filetypes=[("SRT文件", "*.srt"), ("所有文件", "*.*")]
-        )
-        if file_path:
-            self.review_original_file_var.set(file_path)
+        self._browse("review_original", self.review_original_file_var, title="选择原始字幕文件",
+                     filetypes=[("SRT文件", "*.srt"), ("所有文件", "*.*")])
     
     def browse_review_corrected_file(self):
         """浏览选择纠错后字幕文件"""
-        file_path = filedialog.askopenfilename(
-            title="选择纠错后字幕文件",
-            filetypes=[("SRT文件", "*.srt"), ("所有文件", "*.*")]
-        )
-        if file_path:
-            self.review_corrected_file_var.set(file_path)
+        self._browse("review_corrected", self.review_corrected_file_var, title="选择纠错后字幕文件",
+                     filetypes=[("SRT文件", "*.srt"), ("所有文件", "*.*")])
     
     def load_comparison(self):
         """加载并对比两个字幕文件"""
@@ -6232,11 +6839,11 @@ class SRTGuiApp:
             messagebox.showerror("错误", "请选择原始文件和纠错后文件")
             return
             
-        if not os.path.exists(original_file):
+        if not os.path.isfile(original_file):
             messagebox.showerror("错误", f"原始文件不存在：{original_file}")
             return
             
-        if not os.path.exists(corrected_file):
+        if not os.path.isfile(corrected_file):
             messagebox.showerror("错误", f"纠错后文件不存在：{corrected_file}")
             return
         
@@ -6289,8 +6896,7 @@ class SRTGuiApp:
 
     def _char_count(self, text: str) -> int:
         try:
-            import re
-            return len(re.sub(r"\s+", "", text or ""))
+            return len(_WHITESPACE_RE.sub("", text or ""))
         except Exception:
             return len(text or "")
 
@@ -6306,9 +6912,11 @@ class SRTGuiApp:
             self.review_tree.delete(item)
         # 清空覆盖层
         self._clear_review_overlays()
+        self._review_row_overlays = [None] * len(self.review_entries)
+        self.review_item_to_row = {}
 
         # 添加变更项数据
-        for entry in self.review_entries:
+        for row, entry in enumerate(self.review_entries):
             status_text = self.get_status_text(entry.current_status)
 
             # 生成高亮差异文本
@@ -6358,6 +6966,7 @@ class SRTGuiApp:
 
             # 建立条目映射，方便覆盖层渲染
             self.review_item_to_entry[item_id] = entry
+            self.review_item_to_row[item_id] = row
 
             # 如果该编号在已处理集合中，覆盖为“已处理”绿色背景
             if entry.number in getattr(self, 'review_processed_numbers', set()):
@@ -6409,14 +7018,24 @@ class SRTGuiApp:
         # 70ms 节流：在快速拖动滚动条时减小刷新频率
         self._review_overlay_update_job = self.root.after(70, self._update_review_overlays)
 
+    def _destroy_review_row_overlays(self, row):
+        """销毁某一行的全部覆盖层"""
+        slots = self._review_row_overlays[row] if row < len(self._review_row_overlays) else None
+        if slots is not None:
+            for widget in slots:
+                if widget is not None:
+                    try:
+                        widget.destroy()
+                    except Exception:
+                        pass
+            self._review_row_overlays[row] = None
+        self._review_overlay_rows.discard(row)
+
     def _clear_review_overlays(self):
         # 移除现有覆盖层
-        for widget in list(self._review_cell_overlays.values()):
-            try:
-                widget.destroy()
-            except Exception:
-                pass
-        self._review_cell_overlays.clear()
+        for row in list(self._review_overlay_rows):
+            self._destroy_review_row_overlays(row)
+        self._review_overlay_rows.clear()
 
     def _update_review_overlays(self):
         # 避免频繁调用
@@ -6436,16 +7055,28 @@ class SRTGuiApp:
             return
 
         # 仅为可见行绘制覆盖，避免 O(n) 重绘导致的性能问题
-        diff_columns = ("原文", "纠错后")
-        speed_columns = ("原文语速", "纠错语速")
+        # 覆盖层按行索引存取：item_id 只在此处换算一次行号，列用固定槽位
+        diff_columns = ((0, "原文"), (1, "纠错后"))
+        item_to_row = self.review_item_to_row
+        row_overlays = self._review_row_overlays
+        visible_rows = set()
         for item_id in visible_items:
             bbox_row = self.review_tree.bbox(item_id)
             if not bbox_row:
                 continue
+            row = item_to_row.get(item_id)
+            if row is None or row >= len(row_overlays):
+                continue
+            visible_rows.add(row)
+            slots = row_overlays[row]
+            if slots is None:
+                slots = [None, None, None, None]
+                row_overlays[row] = slots
+                self._review_overlay_rows.add(row)
             y = bbox_row[1]
             height = bbox_row[3]
 
-            for col in diff_columns:
+            for slot, col in diff_columns:
                 try:
                     bbox = self.review_tree.bbox(item_id, col)
                 except Exception:
@@ -6454,8 +7085,7 @@ class SRTGuiApp:
                     continue
                 x, y, w, h = bbox
 
-                key = (item_id, col)
-                overlay = self._review_cell_overlays.get(key)
+                overlay = slots[slot]
                 if overlay is None:
                     # 创建Text作为覆盖层
                     overlay = tk.Text(self.review_tree, height=1, wrap=tk.NONE, borderwidth=0, highlightthickness=0, takefocus=0)
@@ -6464,7 +7094,7 @@ class SRTGuiApp:
                     overlay.tag_configure("ins", background="#b6ffb6", foreground="#004d00", font=('Microsoft YaHei UI', 10, 'bold'))
                     overlay.tag_configure("eq", foreground="#000000", font=('Microsoft YaHei UI', 10))
                     overlay.configure(font=('Microsoft YaHei UI', 10))
-                    self._review_cell_overlays[key] = overlay
+                    slots[slot] = overlay
                     # 让覆盖层也能响应单击/双击，触发与Treeview一致的行为
                     overlay.bind('<Button-1>', lambda e, iid=item_id: self._handle_overlay_click(iid))
                     overlay.bind('<Double-1>', lambda e, iid=item_id: self._handle_overlay_double_click(iid))
@@ -6492,14 +7122,13 @@ class SRTGuiApp:
                     dur = max(0.0, self._parse_srt_time_to_seconds(entry.end_time) - self._parse_srt_time_to_seconds(entry.start_time))
                 except Exception:
                     dur = 0.0
-                import re
                 def _cn_count(t):
-                    return len(re.findall(r"[\u4e00-\u9fff]", t or ""))
+                    return len(_CJK_CHAR_RE.findall(t or ""))
                 cn_orig = _cn_count(entry.original_content)
                 cn_corr = _cn_count(entry.corrected_content)
                 sp_min = getattr(self, 'cn_speed_min', 2.0)
                 sp_max = getattr(self, 'cn_speed_max', 4.0)
-                for col, cn_chars in (("原文语速", cn_orig), ("纠错语速", cn_corr)):
+                for slot, col, cn_chars in ((2, "原文语速", cn_orig), (3, "纠错语速", cn_corr)):
                     try:
                         bbox = self.review_tree.bbox(item_id, col)
                     except Exception:
@@ -6507,20 +7136,19 @@ class SRTGuiApp:
                     if not bbox:
                         continue
                     x, y, w, h = bbox
-                    key = (item_id, col)
+                    overlay = slots[slot]
                     # 仅当存在中文字符并且时长>0时才判断
                     if dur <= 0 or cn_chars <= 0:
                         # 清理可能存在的覆盖
-                        if key in self._review_cell_overlays:
+                        if overlay is not None:
                             try:
-                                self._review_cell_overlays[key].destroy()
+                                overlay.destroy()
                             except Exception:
                                 pass
-                            del self._review_cell_overlays[key]
+                            slots[slot] = None
                         continue
                     speed_cn = cn_chars / dur
                     out_of_range = speed_cn < sp_min or speed_cn > sp_max
-                    overlay = self._review_cell_overlays.get(key)
                     if out_of_range:
                         if overlay is None:
                             overlay = tk.Label(self.review_tree, borderwidth=0, highlightthickness=0)
@@ -6528,7 +7156,7 @@ class SRTGuiApp:
                             overlay.bind('<Double-1>', lambda e, iid=item_id: self._handle_overlay_double_click(iid))
                             overlay.bind('<Button-3>', lambda e, iid=item_id: self._show_review_context_menu_over_overlay(e, iid))
                             overlay.bind('<Enter>', lambda e, iid=item_id: self._set_review_hover_item(iid))
-                            self._review_cell_overlays[key] = overlay
+                            slots[slot] = overlay
                         cell_text = self.review_tree.set(item_id, col)
                         overlay.configure(text=cell_text, bg="#ffcccc", fg="#990000", font=('Microsoft YaHei UI', 9))
                         overlay.place_configure(x=x+1, y=y+1, width=w-2, height=h-2)
@@ -6538,20 +7166,11 @@ class SRTGuiApp:
                                 overlay.destroy()
                             except Exception:
                                 pass
-                            del self._review_cell_overlays[key]
+                            slots[slot] = None
 
-        # 清理已不可见的覆盖层
-        alive_keys = set()
-        for item_id in visible_items:
-            for col in ("原文", "纠错后", "原文语速", "纠错语速"):
-                alive_keys.add((item_id, col))
-        for key in list(self._review_cell_overlays.keys()):
-            if key not in alive_keys:
-                try:
-                    self._review_cell_overlays[key].destroy()
-                except Exception:
-                    pass
-                del self._review_cell_overlays[key]
+        # 清理已不可见行的覆盖层
+        for row in self._review_overlay_rows - visible_rows:
+            self._destroy_review_row_overlays(row)
 
     def _insert_colored_diff_to_overlay(self, text_widget, display_text):
         """将带有 [-删除-] 与 [+新增+] 标记的字符串渲染为彩色。"""
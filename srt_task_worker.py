@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import re
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Final, Optional
 
 
 @dataclass(frozen=True)
@@ -44,7 +46,57 @@ class PolisherJobConfig:
     auto_verify: bool = True
 
 
-def _make_queue_log_handler(out_queue, channel: str):
+class PipeQueue:
+    """以 put() 接口包装单向管道的发送端，供子进程内多个线程共用（发送加锁）"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        return {"conn": self._conn}
+
+    def __setstate__(self, state):
+        self._conn = state["conn"]
+        self._lock = threading.Lock()
+
+    def put(self, item) -> None:
+        with self._lock:
+            self._conn.send(item)
+
+
+_BATCH_TOTAL_RE: Final = re.compile(r"总计\s+(\d+)\s+个批次，剩余\s+(\d+)\s+个需要处理")
+_BATCH_WROTE_RE: Final = re.compile(r"已将批次\s+\d+\s+写入")
+
+
+class _TranslationProgress:
+    """在子进程内从翻译器日志解析批次进度，只把 (总批次, 已完成) 发给界面"""
+
+    def __init__(self):
+        self.total: Optional[int] = None
+        self.completed = 0
+
+    def feed(self, message: str):
+        if "批次" not in message and "完成" not in message:
+            return None
+        m = _BATCH_TOTAL_RE.search(message)
+        if m:
+            self.total = int(m.group(1))
+            self.completed = max(0, self.total - int(m.group(2)))
+        elif _BATCH_WROTE_RE.search(message):
+            # 不依赖批次号自增；多线程下也只是累计
+            self.completed += 1
+        elif "所有批次已完成" in message or "翻译完成。输出在" in message:
+            if not self.total:
+                return None
+            self.completed = self.total
+        else:
+            return None
+        completed = min(self.completed, self.total) if self.total else self.completed
+        return ("translation_progress", self.total, completed)
+
+
+def _make_queue_log_handler(out_queue, channel: str, progress=None):
     import logging
 
     class _QueueLogHandler(logging.Handler):
@@ -55,6 +107,10 @@ def _make_queue_log_handler(out_queue, channel: str):
             try:
                 msg = self.format(record)
                 out_queue.put((channel, msg))
+                if progress is not None:
+                    update = progress.feed(record.getMessage())
+                    if update is not None:
+                        out_queue.put(update)
             except Exception:
                 pass
 
@@ -90,6 +146,14 @@ class CheckerJobConfig:
     report_file: str
 
 
+@dataclass(frozen=True)
+class BilingualJobConfig:
+    original_file: str
+    translated_file: str
+    output_file: str
+    max_workers: Optional[int] = None
+
+
 def run_corrector_job(config: CorrectorJobConfig, out_queue) -> None:
     try:
         from srt_corrector import CorrectionAPI, SRTCorrector
@@ -216,7 +280,7 @@ def run_translation_job(config: TranslationJobConfig, out_queue) -> None:
 
         logger = logging.getLogger("SRT-Translator")
         logger.setLevel(logging.INFO)
-        handler = _make_queue_log_handler(out_queue, "translation")
+        handler = _make_queue_log_handler(out_queue, "translation", _TranslationProgress())
         handler.setLevel(logging.INFO)
         handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
         logger.addHandler(handler)
@@ -290,3 +354,39 @@ def run_checker_job(config: CheckerJobConfig, out_queue) -> None:
             out_queue.put(("checking_done", False))
         except Exception:
             pass
+
+
+def run_bilingual_job(config: BilingualJobConfig, out_queue, stop_event=None) -> None:
+    try:
+        import time
+
+        from independent_bilingual_translator import convert_to_bilingual
+
+        # 进度限速到每秒最多20次，由主线程格式化显示
+        last_t = 0.0
+
+        def progress_callback(progress, message):
+            nonlocal last_t
+            now = time.monotonic()
+            if now - last_t < 0.05 and progress < 1.0:
+                return
+            last_t = now
+            out_queue.put(("bilingual_progress", (progress, message)))
+
+        ok = bool(
+            convert_to_bilingual(
+                original_file=config.original_file,
+                translated_file=config.translated_file,
+                output_file=config.output_file,
+                max_workers=config.max_workers,
+                progress_callback=progress_callback,
+                stop_event=stop_event,
+            )
+        )
+        stopped = bool(stop_event is not None and stop_event.is_set())
+        out_queue.put(("bilingual_done", ok, config.output_file, stopped))
+    except Exception as e:
+        try:
+            out_queue.put(("bilingual_error", str(e)))
+        except Exception:
+            pass